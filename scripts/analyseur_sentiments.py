@@ -9,14 +9,231 @@ Dernière mise à jour : 15/06/2023
 
 import re
 import argparse
+import array
+import bz2
+import codecs
+import csv
+import glob
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import mmap
+import os
+import sqlite3
+import struct
 import sys
-from collections import defaultdict
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice, repeat
 import math
 
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : analyser_lot bascule sur le moteur rapide
+    np = None
+
+# Taille cible (en octets) des blocs répartis entre les processus
+TAILLE_BLOC_DEFAUT = 4 * 1024 * 1024
+
+# Nombre maximal de résultats conservés par le cache en mémoire
+TAILLE_CACHE_DEFAUT = 100000
+
+# Nombre de lignes analysées entre deux sauvegardes du point de reprise
+INTERVALLE_REPRISE_DEFAUT = 10000
+
+# Formats de sortie des résultats (option --format)
+FORMATS_SORTIE = ('jsonl', 'csv', 'columnar')
+
+# Nombre de résultats accumulés en mémoire avant écriture groupée
+TAILLE_TAMPON_SORTIE = 8192
+
+# Codes des sentiments dans le format en colonnes
+CODES_SENTIMENT = {'négatif': -1, 'neutre': 0, 'positif': 1}
+
+# Taille (en octets) des blocs lus dans les fichiers d'un corpus
+TAILLE_LECTURE_CORPUS = 1024 * 1024
+
+# Fichiers reconnus dans un répertoire de corpus, et leur décompression
+EXTENSIONS_CORPUS = ('.txt', '.jsonl')
+DECOMPRESSEURS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+# Fenêtres de temps des agrégats et format de leur clé
+FENETRES = {'heure': '%Y-%m-%dT%H', 'jour': '%Y-%m-%d', 'semaine': '%G-S%V', 'mois': '%Y-%m'}
+
+# Erreur relative maximale des quantiles estimés par EsquisseQuantiles
+PRECISION_QUANTILES = 0.01
+
+# Nombre d'octets de début de fichier utilisés pour détecter un fichier remplacé
+TAILLE_ENTETE_REPRISE = 4096
+
+# Format binaire des lexiques compilés (voir ecrire_lexique_binaire) :
+# en-tête, table de hachage à adressage ouvert, puis mots encodés en UTF-8
+MAGIQUE_LEXIQUE = b'NTLEX\x00\x03\x00'
+_ENTETE_LEXIQUE = struct.Struct('<8sIIQQ32sQQ')
+_CASE_LEXIQUE = struct.Struct('<IIHbBdd')
+_CASE_VIDE = 0xFFFFFFFF
+_DRAPEAU_NEGATION = 1
+_DRAPEAU_INTENSIFICATEUR = 2
+_DRAPEAU_POIDS_ENTIER = 4
+
+# Nombre de mots mémorisés par un lexique binaire avant remise à zéro
+TAILLE_MEMO_LEXIQUE = 200000
+
+# Ponctuation supprimée avant la tokenization
+_RE_PONCTUATION = re.compile(r'[^\w\s]')
+
+# Version des règles de normalisation, incluse dans l'empreinte du lexique
+# pour invalider les caches calculés avec d'autres règles
+VERSION_NORMALISATION = 2
+
+# Formes élidées (l', qu'...) remplacées par le mot complet. n' reste tel
+# quel : « ne ... pas » ne doit pas compter comme deux négations
+ELISIONS = {
+    'l': 'le', 'd': 'de', 'j': 'je', 'm': 'me', 't': 'te', 's': 'se', 'c': 'ce',
+    'qu': 'que', 'jusqu': 'jusque', 'lorsqu': 'lorsque',
+    'puisqu': 'puisque', 'quoiqu': 'quoique'
+}
+
+# Lettre répétée au moins 3 fois ("superrr")
+_RE_REPETITIONS = re.compile(r'([^\W\d_])\1{2,}')
+_RE_MOT = re.compile(r'\w+')
+
+# Encodage des textes normalisés octet par octet (voir normaliser_bloc) : il
+# couvre les lettres accentuées et la ponctuation typographique du français
+ENCODAGE_NORMALISATION = 'cp1252'
+
+def _construire_table_normalisation():
+    """
+    Construit la table de str.translate qui supprime la ponctuation et les accents
+    
+    Couvre l'alphabet latin étendu et la ponctuation typographique (’ « » …) ;
+    les autres caractères non ASCII restants passent par _RE_PONCTUATION.
+    
+    Returns:
+        dict: Code de caractère -> remplacement
+    """
+    table = {}
+    for code in list(range(0x250)) + list(range(0x2000, 0x2070)):
+        caractere = chr(code)
+        if not (caractere.isalnum() or caractere == '_' or caractere.isspace()):
+            table[code] = ' '
+        elif code >= 0x80:
+            decompose = unicodedata.normalize('NFD', caractere)
+            base = ''.join(c for c in decompose if not unicodedata.combining(c))
+            if base != caractere and base.isascii():
+                table[code] = base
+    table.update({ord('œ'): 'oe', ord('Œ'): 'OE', ord('æ'): 'ae', ord('Æ'): 'AE'})
+    return table
+
+_TABLE_NORMALISATION = _construire_table_normalisation()
+
+def _construire_tables_octets():
+    """
+    Construit les tables de bytes.translate équivalentes à _TABLE_NORMALISATION
+    
+    Elles s'appliquent à un texte en minuscules encodé avec
+    ENCODAGE_NORMALISATION. Les caractères remplacés par plusieurs lettres
+    (œ -> oe) ne tiennent pas dans un octet : ils sont renvoyés à part pour
+    être remplacés avant l'encodage.
+    
+    Returns:
+        tuple: (table de normalisation, table marquant d'un octet 0xFF les
+            octets normalisés qui ne sont pas des lettres, ligatures)
+    """
+    normalisation = bytearray(range(256))
+    non_lettres = bytearray(256)
+    ligatures = {}
+    for octet in range(256):
+        try:
+            caractere = bytes([octet]).decode(ENCODAGE_NORMALISATION)
+        except UnicodeDecodeError:
+            non_lettres[octet] = 0xFF  # Octet absent de l'encodage
+            continue
+        if not _RE_REPETITIONS.match(caractere * 3):
+            non_lettres[octet] = 0xFF
+        normalise = _RE_PONCTUATION.sub(' ', caractere.translate(_TABLE_NORMALISATION))
+        if len(normalise) == 1:
+            normalisation[octet] = normalise.encode(ENCODAGE_NORMALISATION)[0]
+        elif caractere == caractere.lower():
+            ligatures[caractere] = normalise
+    return bytes(normalisation), bytes(non_lettres), ligatures
+
+_TABLE_OCTETS, _TABLE_NON_LETTRES, _LIGATURES = _construire_tables_octets()
+
+def _normaliser_hors_encodage(erreur):
+    """
+    Gestionnaire d'erreur d'encodage normalisant les caractères absents de ENCODAGE_NORMALISATION
+    
+    Les symboles et lettres latines étendues sont remplacés comme dans
+    decouper_mots. Une lettre qui reste hors de l'encodage (alphabet non
+    latin) fait échouer l'encodage.
+    
+    Args:
+        erreur (UnicodeEncodeError): Erreur levée par l'encodage
+    
+    Returns:
+        tuple: (remplacement, position de reprise)
+    """
+    morceau = erreur.object[erreur.start:erreur.end]
+    return _RE_PONCTUATION.sub(' ', morceau.translate(_TABLE_NORMALISATION)), erreur.end
+
+codecs.register_error('normalisation_novatech', _normaliser_hors_encodage)
+
+def _positions_repetitions(octets):
+    """
+    Cherche les lettres répétées au moins 3 fois dans un texte normalisé encodé
+    
+    Le texte est lu comme un grand entier : l'octet i du résultat de
+    (n ^ n >> 8) | (n ^ n >> 16) | masque est nul si et seulement si les
+    octets i, i + 1 et i + 2 sont la même lettre. Ces opérations parcourent
+    le texte en C, bien plus vite qu'une expression régulière.
+    
+    Args:
+        octets (bytes): Texte normalisé (voir _TABLE_OCTETS)
+    
+    Returns:
+        list: Positions des débuts de répétition
+    """
+    n = int.from_bytes(octets, 'little')
+    masque = int.from_bytes(octets.translate(_TABLE_NON_LETTRES), 'little')
+    ecarts = ((n ^ n >> 8) | (n ^ n >> 16) | masque).to_bytes(len(octets), 'little')
+    positions = []
+    position = ecarts.find(0)
+    while position >= 0:
+        positions.append(position)
+        position = ecarts.find(0, position + 1)
+    return positions
+
+def decouper_mots(texte):
+    """
+    Découpe un texte en mots en minuscules, sans ponctuation ni accents
+    
+    Args:
+        texte (str): Texte à découper
+    
+    Returns:
+        list: Mots du texte ("C'est génial !" -> ['c', 'est', 'genial'])
+    """
+    texte = texte.lower().translate(_TABLE_NORMALISATION)
+    if not texte.isascii():
+        texte = _RE_PONCTUATION.sub(' ', texte)
+    return texte.split()
+
 class AnalyseurSentiments:
-    def __init__(self):
+    def __init__(self, chemin_lexique=None):
         """
         Initialise l'analyseur avec des dictionnaires de mots positifs et négatifs
+        
+        Args:
+            chemin_lexique (str): Lexique à charger en plus des mots intégrés
+                (CSV, JSON ou lexique binaire compilé, voir charger_lexique)
         """
         # Mots-clés positifs avec pondération (1-3)
         self.mots_positifs = {
@@ -25,7 +242,9 @@ class AnalyseurSentiments:
             'professionnel': 2, 'qualité': 2, 'recommande': 3, 'merci': 1, 'bravo': 2,
             'content': 2, 'heureux': 2, 'impressionnant': 3, 'fantastique': 3,
             'remarquable': 2, 'parfaitement': 2, 'idéal': 2, 'optimiste': 1,
-            'félicitations': 2, 'extra': 2, 'formidable': 3, 'top': 2, 'meilleur': 3
+            'félicitations': 2, 'extra': 2, 'formidable': 3, 'top': 2, 'meilleur': 3,
+            # Expressions de plusieurs mots (voir AutomateExpressions)
+            'rapport qualité prix': 2, 'service client au top': 3
         }
         
         # Mots-clés négatifs avec pondération (1-3)
@@ -36,7 +255,9 @@ class AnalyseurSentiments:
             'catastrophe': 3, 'inefficace': 2, 'médiocre': 2, 'insuffisant': 2,
             'inacceptable': 3, 'désagréable': 2, 'frustrant': 2, 'honteux': 3,
             'critique': 2, 'lamentable': 3, 'désastre': 3, 'piètre': 2,
-            'insupportable': 3, 'défectueux': 2, 'incomplet': 2, 'inadapté': 2
+            'insupportable': 3, 'défectueux': 2, 'incomplet': 2, 'inadapté': 2,
+            # Expressions de plusieurs mots (voir AutomateExpressions)
+            'pas terrible': 2
         }
         
         # Négations qui inversent le sentiment
@@ -48,6 +269,349 @@ class AnalyseurSentiments:
             'absolument': 1.8, 'complètement': 1.6, 'particulièrement': 1.4,
             'fortement': 1.5, 'tellement': 1.5, 'exceptionnellement': 1.8
         }
+        
+        # Cache de résultats optionnel (voir activer_cache)
+        self.cache = None
+        
+        # Profileur optionnel appelé autour de chaque étape (voir ProfileurAnalyse)
+        self.profileur = None
+        
+        # Lexique binaire projeté en mémoire, s'il en a été chargé un
+        self.lexique_binaire = None
+        
+        # Table fusionnée utilisée par le moteur rapide
+        if chemin_lexique:
+            self.charger_lexique(chemin_lexique)
+        else:
+            self.compiler_lexique()
+
+    def charger_lexique(self, chemin):
+        """
+        Charge un lexique externe
+        
+        Un fichier CSV (colonnes mot, categorie, valeur) ou JSON (clés
+        mots_positifs, mots_negatifs, negations, intensificateurs) complète les
+        dictionnaires actuels. Un lexique binaire compilé (voir
+        ecrire_lexique_binaire) est projeté en mémoire et les remplace :
+        son ouverture ne dépend pas du nombre d'entrées, et les processus qui
+        l'ouvrent partagent les mêmes pages.
+        
+        Args:
+            chemin (str): Chemin du lexique
+        """
+        with open(chemin, 'rb') as fichier:
+            binaire = fichier.read(6) == MAGIQUE_LEXIQUE[:6]
+        
+        if binaire:
+            lexique = LexiqueBinaire(chemin)
+            self.lexique_binaire = lexique
+            self.mots_positifs = VueLexique(lexique, 'positif')
+            self.mots_negatifs = VueLexique(lexique, 'negatif')
+            self.negations = VueLexique(lexique, 'negation')
+            self.intensificateurs = VueLexique(lexique, 'intensificateur')
+        else:
+            source = lire_source_lexique(chemin)
+            if self.lexique_binaire is not None:
+                # Les vues en lecture seule redeviennent des dictionnaires modifiables
+                self.mots_positifs = dict(self.mots_positifs)
+                self.mots_negatifs = dict(self.mots_negatifs)
+                self.negations = set(self.negations)
+                self.intensificateurs = dict(self.intensificateurs)
+                self.lexique_binaire = None
+            self.mots_positifs.update(source['mots_positifs'])
+            self.mots_negatifs.update(source['mots_negatifs'])
+            self.negations.update(source['negations'])
+            self.intensificateurs.update(source['intensificateurs'])
+        
+        self.compiler_lexique()
+
+    def compiler_lexique(self):
+        """
+        Fusionne les dictionnaires en une table unique pour le moteur rapide
+        
+        Les clés des dictionnaires sont d'abord normalisées comme les mots du
+        texte (minuscules, accents retirés, élisions développées). Chaque mot
+        est associé à un tuple (polarite, poids, est_negation,
+        facteur_intensite). Les expressions de plusieurs mots (clés contenant
+        des espaces) sont en plus compilées dans un automate. À rappeler après
+        toute modification des dictionnaires de mots.
+        
+        Returns:
+            dict: Table fusionnée mot -> (polarite, poids, est_negation, facteur)
+        """
+        if self.lexique_binaire is not None:
+            # Un lexique binaire est déjà une table fusionnée
+            self.lexique = self.lexique_binaire
+            self.empreinte = self.lexique_binaire.empreinte
+            expressions = self.lexique_binaire.expressions()
+            self.automate = AutomateExpressions(expressions) if expressions else None
+            self._tables_lot = None
+            self._valider_compilation()
+            return self.lexique
+        
+        # Les clés prennent la forme des mots du texte (accents, élisions)
+        self.mots_positifs = DictionnaireMots(
+            (_normaliser_cle(mot), poids) for mot, poids in self.mots_positifs.items())
+        self.mots_negatifs = DictionnaireMots(
+            (_normaliser_cle(mot), poids) for mot, poids in self.mots_negatifs.items())
+        self.negations = EnsembleMots(_normaliser_cle(mot) for mot in self.negations)
+        self.intensificateurs = DictionnaireMots(
+            (_normaliser_cle(mot), facteur) for mot, facteur in self.intensificateurs.items())
+        
+        lexique = {}
+        for mot in self.negations:
+            lexique[mot] = (0, 0, True, None)
+        for mot, facteur in self.intensificateurs.items():
+            _, _, est_negation, _ = lexique.get(mot, (0, 0, False, None))
+            lexique[mot] = (0, 0, est_negation, facteur)
+        # Les mots positifs sont prioritaires, comme dans analyser_texte
+        for polarite, mots in ((-1, self.mots_negatifs), (1, self.mots_positifs)):
+            for mot, poids in mots.items():
+                _, _, est_negation, facteur = lexique.get(mot, (0, 0, False, None))
+                lexique[mot] = (polarite, poids, est_negation, facteur)
+        
+        self.lexique = lexique
+        self.empreinte = self.empreinte_lexique()
+        
+        # Les clés de plusieurs mots sont reconnues par un automate commun
+        expressions = [mot for mot in lexique if ' ' in mot]
+        self.automate = AutomateExpressions(expressions) if expressions else None
+        
+        self._tables_lot = None  # Tables NumPy reconstruites à la demande
+        self._valider_compilation()
+        return lexique
+
+    def _etat_dictionnaires(self):
+        """
+        Identité et nombre de modifications des dictionnaires de mots
+        
+        Bien moins coûteux que empreinte_lexique : permet de ne recalculer
+        l'empreinte que si un dictionnaire a été remplacé ou modifié.
+        
+        Returns:
+            tuple: Couples (identifiant, revision) des quatre dictionnaires
+        """
+        return tuple((id(mots), getattr(mots, 'revision', None))
+                     for mots in (self.mots_positifs, self.mots_negatifs,
+                                  self.negations, self.intensificateurs))
+
+    def _valider_compilation(self):
+        """
+        Mémorise l'état des dictionnaires compilés et vide le cache devenu obsolète
+        """
+        self._etat_compile = self._etat_dictionnaires()
+        if self.cache is not None:
+            self.cache.valider(self.empreinte)
+
+    def empreinte_lexique(self):
+        """
+        Calcule l'empreinte du contenu des dictionnaires de mots
+        
+        Returns:
+            str: Empreinte SHA-256 hexadécimale
+        """
+        if self.lexique_binaire is not None:
+            return self.lexique_binaire.empreinte
+        
+        contenu = repr((
+            VERSION_NORMALISATION,
+            sorted(self.mots_positifs.items()),
+            sorted(self.mots_negatifs.items()),
+            sorted(self.negations),
+            sorted(self.intensificateurs.items())
+        ))
+        return hashlib.sha256(contenu.encode('utf-8')).hexdigest()
+
+    def verifier_lexique(self):
+        """
+        Recompile le lexique si les dictionnaires ont été modifiés
+        
+        Le cache éventuel est vidé lorsque l'empreinte change.
+        
+        Returns:
+            str: Empreinte courante du lexique
+        """
+        empreinte = self.empreinte_lexique()
+        if empreinte != self.empreinte:
+            self.compiler_lexique()
+        if self.cache is not None:
+            self.cache.valider(empreinte)
+        self._etat_compile = self._etat_dictionnaires()
+        return empreinte
+
+    def activer_cache(self, taille_max=TAILLE_CACHE_DEFAUT, chemin=None):
+        """
+        Active le cache des résultats, indexé par texte normalisé
+        
+        Args:
+            taille_max (int): Nombre maximal de résultats gardés en mémoire
+            chemin (str): Fichier SQLite persistant entre les exécutions (optionnel)
+        
+        Returns:
+            CacheResultats: Le cache activé
+        """
+        self.cache = CacheResultats(taille_max, chemin)
+        self.verifier_lexique()
+        return self.cache
+
+    def normaliser_texte(self, texte):
+        """
+        Normalise un texte comme preprocess_texte, sous forme de chaîne
+        
+        Args:
+            texte (str): Texte à normaliser
+        
+        Returns:
+            str: Mots nettoyés séparés par une espace
+        """
+        return ' '.join(self.tokeniser(texte))
+
+    def normaliser_mot(self, mot):
+        """
+        Normalise un mot issu de decouper_mots
+        
+        Les lettres répétées au moins 3 fois sont réduites à 2 si le mot
+        obtenu est dans le lexique ("excelllent"), à 1 sinon ("superrr"),
+        puis les formes élidées sont développées (l -> le).
+        
+        Args:
+            mot (str): Mot en minuscules sans accents
+        
+        Returns:
+            str: Mot normalisé
+        """
+        if _RE_REPETITIONS.search(mot):
+            mot = self._reduire_mot(mot)
+        return ELISIONS.get(mot, mot)
+
+    def _reduire_mot(self, mot):
+        double = _RE_REPETITIONS.sub(r'\1\1', mot)
+        return double if double in self.lexique else _RE_REPETITIONS.sub(r'\1', mot)
+
+    def _reduire_repetitions(self, texte, positions):
+        """
+        Réduit les seuls mots contenant une lettre répétée (voir normaliser_mot)
+        
+        Args:
+            texte (str): Texte normalisé
+            positions (list): Positions croissantes des lettres répétées
+        
+        Returns:
+            str: Texte dont ces mots sont réduits
+        """
+        morceaux = []
+        fin = 0
+        for position in positions:
+            if position < fin:
+                continue  # Mot déjà réduit
+            debut = position
+            while debut > fin and (texte[debut - 1].isalnum() or texte[debut - 1] == '_'):
+                debut -= 1
+            morceaux.append(texte[fin:debut])
+            fin = _RE_MOT.match(texte, position).end()
+            morceaux.append(self._reduire_mot(texte[debut:fin]))
+        morceaux.append(texte[fin:])
+        return ''.join(morceaux)
+
+    def normaliser_bloc(self, texte):
+        """
+        Normalise tous les mots d'un texte d'un seul bloc
+        
+        Le texte est encodé en cp1252 (les caractères absents passent par
+        _normaliser_hors_encodage), puis un seul bytes.translate retire la
+        ponctuation et les accents ; un texte en alphabet non latin passe
+        par str.translate. Seuls les mots contenant des lettres répétées
+        sont ensuite réduits (voir normaliser_mot). Les élisions, qui
+        dépendent du mot entier, sont développées après le découpage (voir
+        tokeniser). Les sauts de ligne sont conservés.
+        
+        Args:
+            texte (str): Texte à normaliser
+        
+        Returns:
+            str: Texte en minuscules sans ponctuation ni accents
+        """
+        texte = texte.lower()
+        for ligature, remplacement in _LIGATURES.items():
+            if ligature in texte:
+                texte = texte.replace(ligature, remplacement)
+        try:
+            octets = texte.encode(ENCODAGE_NORMALISATION, 'normalisation_novatech')
+        except UnicodeEncodeError:
+            texte = _RE_PONCTUATION.sub(' ', texte.translate(_TABLE_NORMALISATION))
+            positions = [repetition.start() for repetition in _RE_REPETITIONS.finditer(texte)]
+        else:
+            octets = octets.translate(_TABLE_OCTETS)
+            texte = octets.decode(ENCODAGE_NORMALISATION)
+            positions = _positions_repetitions(octets)
+        if positions:
+            texte = self._reduire_repetitions(texte, positions)
+        return texte
+
+    def tokeniser(self, texte):
+        """
+        Découpe et normalise les mots d'un texte
+        
+        Le texte est normalisé d'un bloc (normaliser_bloc), coupé sur les
+        espaces, puis les formes élidées sont développées par une recherche
+        dans ELISIONS. Le résultat est celui de decouper_mots suivi de
+        normaliser_mot sur chaque mot.
+        
+        Args:
+            texte (str): Texte à découper
+        
+        Returns:
+            list: Mots normalisés
+        """
+        mots = self.normaliser_bloc(texte).split()
+        return list(map(ELISIONS.get, mots, mots))
+
+    def _construire_tables_lot(self):
+        """
+        Construit les tables NumPy indexées par identifiant de mot
+        
+        L'identifiant 0 est réservé aux mots absents du lexique. Les mots
+        des expressions absents du lexique reçoivent un identifiant neutre,
+        pour que les expressions soient reconnues sur les identifiants.
+        L'index associe aussi chaque élision à l'identifiant du mot complet.
+        
+        Returns:
+            tuple: (index, polarite, poids, negation, facteur, intensifie,
+                poids_flottant, expressions)
+        """
+        index = {}
+        expressions = self.automate.expressions if self.automate is not None else []
+        supplementaires = sorted({mot for expression in expressions for mot in expression.split()
+                                  if mot not in self.lexique})
+        taille = len(self.lexique) + 1 + len(supplementaires)
+        polarite = np.zeros(taille, dtype=np.int8)
+        poids = np.zeros(taille, dtype=np.float64)
+        negation = np.zeros(taille, dtype=bool)
+        facteur = np.ones(taille, dtype=np.float64)
+        intensifie = np.zeros(taille, dtype=bool)
+        poids_flottant = np.zeros(taille, dtype=bool)
+        
+        index['\0'] = -1  # Sentinelle séparant les textes d'un lot
+        for identifiant, (mot, entree) in enumerate(self.lexique.items(), 1):
+            index[mot] = identifiant
+            polarite[identifiant], poids[identifiant], negation[identifiant], facteur_mot = entree
+            poids_flottant[identifiant] = not isinstance(entree[1], int)
+            if facteur_mot is not None:
+                facteur[identifiant] = facteur_mot
+                intensifie[identifiant] = True
+        
+        for identifiant, mot in enumerate(supplementaires, len(self.lexique) + 1):
+            index[mot] = identifiant
+        
+        expressions = ExpressionsLot(expressions, index) if expressions else None
+        
+        # Les élisions sont résolues par la même recherche que les mots
+        for elision, mot in ELISIONS.items():
+            index[elision] = index.get(mot, 0)
+        
+        self._tables_lot = (index, polarite, poids, negation, facteur, intensifie, poids_flottant,
+                            expressions)
+        return self._tables_lot
 
     def preprocess_texte(self, texte):
         """
@@ -59,14 +623,13 @@ class AnalyseurSentiments:
         Returns:
             list: Liste des mots nettoyés avec leurs positions
         """
-        # Conversion en minuscules
-        texte = texte.lower()
-        
-        # Suppression de la ponctuation mais conservation des négations
-        texte = re.sub(r'[^\w\s]', ' ', texte)
+        # Conversion en minuscules, suppression de la ponctuation et des accents,
+        # puis tokenization et normalisation des mots (élisions, lettres répétées)
+        mots = self.tokeniser(texte)
         
-        # Tokenization
-        mots = texte.split()
+        # Regroupement des expressions de plusieurs mots en une seule unité
+        if self.automate is not None:
+            mots = self.automate.fusionner(mots)
         
         # Conservation des mots avec leur position pour l'analyse contextuelle
         mots_avec_position = []
@@ -116,12 +679,26 @@ class AnalyseurSentiments:
         Returns:
             dict: Résultats de l'analyse avec scores détaillés
         """
+        profileur = self.profileur
+        if profileur is not None:
+            debut = time.perf_counter()
+        
         # Prétraitement du texte
         mots = self.preprocess_texte(texte)
         
+        if profileur is not None:
+            fin = time.perf_counter()
+            profileur.enregistrer('preprocess_texte', fin - debut)
+            debut = fin
+        
         # Analyse du contexte
         mots = self.analyser_contexte(mots)
         
+        if profileur is not None:
+            fin = time.perf_counter()
+            profileur.enregistrer('analyser_contexte', fin - debut)
+            debut = fin
+        
         # Calcul des scores
         score_positif = 0
         score_negatif = 0
@@ -179,23 +756,17 @@ class AnalyseurSentiments:
                     })
         
         # Calcul du score total et détermination du sentiment
-        score_total = score_positif + score_negatif
+        sentiment, confiance, score_total = _determiner_sentiment(score_positif, score_negatif)
         
-        if score_total == 0:
-            sentiment = "neutre"
-            confiance = 0
-        else:
-            ratio = score_positif / score_total
-            
-            if ratio > 0.7:
-                sentiment = "positif"
-            elif ratio < 0.3:
-                sentiment = "négatif"
-            else:
-                sentiment = "neutre"
-            
-            # Calcul de la confiance basée sur l'écart des scores
-            confiance = min(100, abs(score_positif - score_negatif) * 10)
+        if profileur is not None:
+            profileur.enregistrer('scoring', time.perf_counter() - debut)
+            trouves = mots_positifs_trouves + mots_negatifs_trouves
+            profileur.compter(
+                len(mots),
+                len(trouves),
+                sum(1 for mot in trouves if mot['negation']),
+                sum(1 for mot in trouves if mot['intensificateur'])
+            )
         
         return {
             "sentiment": sentiment,
@@ -208,36 +779,2358 @@ class AnalyseurSentiments:
             "texte_original": texte
         }
 
-    def analyser_fichier(self, chemin_fichier):
+    def analyser_texte_rapide(self, texte):
         """
-        Analyse les sentiments d'un fichier texte
+        Analyse le sentiment d'un texte en un seul passage sur les mots
+        
+        Produit les mêmes scores que analyser_texte sans construire de
+        structure intermédiaire : la négation (2 mots précédents) et
+        l'intensificateur (mot précédent) sont suivis dans des variables
+        locales. Les listes de mots détectés ne sont calculées qu'à la demande.
         
         Args:
-            chemin_fichier (str): Chemin vers le fichier à analyser
+            texte (str): Texte à analyser
         
         Returns:
-            list: Liste des résultats d'analyse pour chaque ligne
+            ResultatAnalyse: Résultat de l'analyse
+        """
+        profileur = self.profileur
+        if profileur is not None:
+            debut = time.perf_counter()
+        
+        lexique = self.lexique
+        score_positif = 0
+        score_negatif = 0
+        negation_1 = negation_2 = False  # Négation sur les mots i-1 et i-2
+        facteur = None  # Intensificateur sur le mot i-1
+        occurrences = negations = intensifies = 0  # Compteurs pour le profileur
+        
+        mots = self.tokeniser(texte)
+        if self.automate is not None:
+            mots = self.automate.fusionner(mots)
+        for mot in mots:
+            entree = lexique.get(mot)
+            if entree is None:
+                negation_2 = negation_1
+                negation_1 = False
+                facteur = None
+                continue
+            
+            polarite, poids, est_negation, facteur_mot = entree
+            if polarite:
+                occurrences += 1
+                if facteur is not None:
+                    poids *= facteur
+                    intensifies += 1
+                nie = negation_1 or negation_2
+                if nie:
+                    negations += 1
+                # Une négation inverse la polarité du mot
+                if (polarite > 0) != nie:
+                    score_positif += poids
+                else:
+                    score_negatif += poids
+            
+            negation_2 = negation_1
+            negation_1 = est_negation
+            facteur = facteur_mot
+        
+        sentiment, confiance, score_total = _determiner_sentiment(score_positif, score_negatif)
+        
+        if profileur is not None:
+            profileur.enregistrer('analyse_rapide', time.perf_counter() - debut)
+            profileur.compter(len(mots), occurrences, negations, intensifies)
+        
+        return ResultatAnalyse(
+            sentiment,
+            round(confiance, 1),
+            round(score_positif, 2),
+            round(score_negatif, 2),
+            round(score_total, 2),
+            texte,
+            self
+        )
+
+    def analyser_texte_cache(self, texte):
+        """
+        Analyse un texte en réutilisant le résultat d'un texte identique
+        
+        Les textes qui ne diffèrent que par la casse, les accents, la
+        ponctuation ou les espaces partagent la même entrée du cache. Sans cache actif, le texte
+        est analysé par le moteur rapide. Une modification des dictionnaires
+        de mots depuis la dernière compilation recompile le lexique et vide
+        le cache avant la recherche.
+        
+        Args:
+            texte (str): Texte à analyser
+        
+        Returns:
+            ResultatAnalyse: Résultat de l'analyse
+        """
+        cache = self.cache
+        if cache is None:
+            return self.analyser_texte_rapide(texte)
+        # Dictionnaires modifiés depuis la compilation : le lexique est
+        # recompilé et le cache vidé si leur contenu a changé
+        if self._etat_dictionnaires() != self._etat_compile:
+            self.verifier_lexique()
+            cache = self.cache
+        
+        cle = self.normaliser_texte(texte)
+        valeurs = cache.obtenir(cle)
+        if valeurs is not None:
+            return ResultatAnalyse(*valeurs, texte, self)
+        
+        # Le texte normalisé donne les mêmes mots, donc les mêmes scores
+        resultat = self.analyser_texte_rapide(cle)
+        resultat.texte_original = texte
+        cache.ajouter(cle, (resultat.sentiment, resultat.confiance, resultat.score_positif,
+                            resultat.score_negatif, resultat.score_total))
+        return resultat
+
+    def _moteur(self, rapide=False):
+        """
+        Choisit la fonction d'analyse d'un texte
+        
+        Args:
+            rapide (bool): Utiliser le moteur rapide
+        
+        Returns:
+            callable: Fonction texte -> résultat
+        """
+        if self.cache is not None:
+            return self.analyser_texte_cache
+        return self.analyser_texte_rapide if rapide else self.analyser_texte
+
+    def analyser_lot(self, textes):
         """
+        Analyse un lot de textes avec des opérations vectorisées NumPy
+        
+        Les mots de tout le lot sont normalisés d'un bloc et convertis en
+        identifiants en un seul passage, les expressions sont reconnues sur
+        les identifiants (ExpressionsLot), puis les négations (2 mots
+        précédents), les intensificateurs (mot précédent) et les scores sont
+        calculés sur des tableaux couvrant tout le lot.
+        Les scores sont identiques à ceux de analyser_texte. Sans NumPy,
+        le lot est analysé avec analyser_texte_rapide.
+        
+        Args:
+            textes (list): Textes à analyser
+        
+        Returns:
+            list: Un ResultatAnalyse par texte, dans l'ordre du lot
+        """
+        textes = list(textes)
+        if np is None:
+            return [self.analyser_texte_rapide(texte) for texte in textes]
+        
+        profileur = self.profileur
+        if profileur is not None:
+            debut = time.perf_counter()
+        
+        tables = self._tables_lot or self._construire_tables_lot()
+        (index, polarite_mot, poids_mot, negation_mot, facteur_mot, intensifie_mot,
+         poids_flottant_mot, expressions) = tables
+        
+        nb_textes = len(textes)
+        if not nb_textes:
+            return []
+        
+        # Tokenization du lot en identifiants de mots : une seule
+        # normalisation pour tout le lot, les textes étant séparés par un
+        # jeton sentinelle (-1) inséré après la normalisation
+        lot = '\n'.join(textes)
+        if lot.count('\n') != nb_textes - 1:
+            # Un saut de ligne dans un texte sépare deux mots comme une espace
+            lot = '\n'.join(texte.replace('\n', ' ') for texte in textes)
+        mots = self.normaliser_bloc(lot).replace('\n', ' \0 ').split()
+        identifiants = np.fromiter(map(index.get, mots, repeat(0)), dtype=np.int64,
+                                   count=len(mots))
+        if expressions is not None:
+            # Les sentinelles ne font partie d'aucune expression
+            identifiants = expressions.fusionner(identifiants)
+        sentinelles = identifiants == -1
+        document = np.cumsum(sentinelles)[~sentinelles]
+        mots = identifiants[~sentinelles]
+        longueurs = np.bincount(document, minlength=nb_textes)
+        
+        debuts = np.cumsum(longueurs) - longueurs
+        
+        # Seuls les mots polarisés contribuent aux scores : le contexte
+        # (2 mots précédents du même texte) n'est calculé que pour eux
+        polarite = polarite_mot[mots]
+        polaires = np.flatnonzero(polarite)
+        polarite = polarite[polaires]
+        document = document[polaires]
+        position = polaires - debuts[document]
+        # Les indices hors du texte sont bornés puis masqués par la position
+        precedents = mots[np.maximum(polaires - 1, 0)]
+        avant_precedents = mots[np.maximum(polaires - 2, 0)]
+        
+        # Négation : l'un des 2 mots précédents du même texte est une négation
+        negation = ((negation_mot[precedents] & (position >= 1))
+                    | (negation_mot[avant_precedents] & (position >= 2)))
+        
+        # Intensificateur : le mot précédent du même texte amplifie le poids
+        intensifie = intensifie_mot[precedents] & (position >= 1)
+        facteur = np.where(intensifie, facteur_mot[precedents], 1.0)
+        
+        poids = poids_mot[mots[polaires]] * facteur
+        positif = (polarite > 0) != negation
+        negatif = ~positif
+        
+        # bincount additionne dans l'ordre des mots, comme la boucle Python
+        scores_positifs = np.bincount(document, weights=np.where(positif, poids, 0.0),
+                                      minlength=nb_textes)
+        scores_negatifs = np.bincount(document, weights=np.where(negatif, poids, 0.0),
+                                      minlength=nb_textes)
+        # Un score sans intensificateur ni poids décimal reste entier,
+        # comme dans analyser_texte
+        flottant = intensifie | poids_flottant_mot[mots[polaires]]
+        flottants_positifs = np.bincount(document, weights=positif & flottant,
+                                         minlength=nb_textes) > 0
+        flottants_negatifs = np.bincount(document, weights=negatif & flottant,
+                                         minlength=nb_textes) > 0
+        
+        # Sentiment et confiance calculés sur tout le lot, avec les mêmes
+        # opérations flottantes que _determiner_sentiment
+        scores_totaux = scores_positifs + scores_negatifs
+        avec_score = scores_totaux != 0
+        ratios = np.divide(scores_positifs, scores_totaux,
+                           out=np.full(nb_textes, 0.5), where=avec_score)
+        codes = np.where(ratios > 0.7, 1, np.where(ratios < 0.3, 2, 0))
+        ecarts = np.abs(scores_positifs - scores_negatifs) * 10
+        confiances = np.where(avec_score, np.minimum(100, ecarts), 0)
+        # min(100, x) renvoie l'entier 100 dès que x >= 100
+        confiances_entieres = ~avec_score | (ecarts >= 100) | ~(flottants_positifs | flottants_negatifs)
+        
+        sentiments = ("neutre", "positif", "négatif")
+        if profileur is not None:
+            profileur.compter(
+                len(mots),
+                len(polaires),
+                int(negation.sum()),
+                int(intensifie.sum())
+            )
+        
         resultats = []
+        for (texte, code, score_positif, score_negatif, score_total, confiance,
+             flottant_positif, flottant_negatif, confiance_entiere) in zip(
+                textes, codes.tolist(), scores_positifs.tolist(), scores_negatifs.tolist(),
+                scores_totaux.tolist(), confiances.tolist(), flottants_positifs.tolist(),
+                flottants_negatifs.tolist(), confiances_entieres.tolist()):
+            # Les scores sans intensificateur restent entiers, comme dans analyser_texte
+            if flottant_positif:
+                score_positif = round(score_positif, 2)
+            else:
+                score_positif = int(score_positif)
+            if flottant_negatif:
+                score_negatif = round(score_negatif, 2)
+            else:
+                score_negatif = int(score_negatif)
+            if flottant_positif or flottant_negatif:
+                score_total = round(score_total, 2)
+            else:
+                score_total = int(score_total)
+            
+            resultats.append(ResultatAnalyse(
+                sentiments[code],
+                int(confiance) if confiance_entiere else round(confiance, 1),
+                score_positif,
+                score_negatif,
+                score_total,
+                texte,
+                self
+            ))
+        
+        if profileur is not None:
+            profileur.enregistrer('analyser_lot', time.perf_counter() - debut)
+        
+        return resultats
+
+    def iter_analyses(self, chemin_fichier, rapide=False):
+        """
+        Analyse un fichier texte ligne par ligne sous forme de générateur
+        
+        Chaque résultat est produit dès que sa ligne est lue : la mémoire
+        utilisée reste constante quelle que soit la taille du fichier.
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
         
+        Yields:
+            dict: Résultat d'analyse pour chaque ligne non vide
+        """
+        if self.cache is not None:
+            self.verifier_lexique()
+        analyser = self._moteur(rapide)
         try:
             with open(chemin_fichier, 'r', encoding='utf-8') as fichier:
                 for ligne in fichier:
                     ligne = ligne.strip()
                     if ligne:  # Ignorer les lignes vides
-                        resultat = self.analyser_texte(ligne)
-                        resultats.append(resultat)
+                        yield analyser(ligne)
         except FileNotFoundError:
-            print(f"Erreur : Le fichier '{chein_fichier}' n'a pas été trouvé.")
-            return []
+            print(f"Erreur : Le fichier '{chemin_fichier}' n'a pas été trouvé.")
         except Exception as e:
             print(f"Erreur lors de la lecture du fichier : {e}")
-            return []
+        finally:
+            if self.cache is not None:
+                self.cache.synchroniser()
+
+    def analyser_fichier(self, chemin_fichier, rapide=False):
+        """
+        Analyse les sentiments d'un fichier texte
         
-        return resultats
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+        
+        Returns:
+            list: Liste des résultats d'analyse pour chaque ligne
+        """
+        return list(self.iter_analyses(chemin_fichier, rapide))
 
-def afficher_resultat(resultat, verbose=False):
-    """
+    def exporter_fichier(self, chemin_fichier, ecrivain, rapide=False, workers=1):
+        """
+        Analyse un fichier texte et écrit les résultats au fil de l'eau
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            ecrivain (EcrivainResultats): Destination des résultats (voir ouvrir_ecrivain)
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+            workers (int): Nombre de processus
+        
+        Returns:
+            StatistiquesSentiments: Compteurs des résultats écrits
+        """
+        statistiques = StatistiquesSentiments()
+        if workers > 1:
+            resultats = self.iter_analyses_paralleles(chemin_fichier, workers, rapide=rapide)
+        else:
+            resultats = self.iter_analyses(chemin_fichier, rapide)
+        for resultat in resultats:
+            ecrivain.ecrire(resultat)
+            statistiques.ajouter(resultat)
+        return statistiques
+
+    def iter_analyses_corpus(self, sources, rapide=False, champ_texte='texte', par_fichier=None,
+                             agregateur=None):
+        """
+        Analyse un corpus de fichiers (répertoires, motifs glob, fichiers compressés)
+        
+        Les fichiers sont lus par blocs de lignes entières (voir
+        iter_blocs_corpus). Avec le moteur rapide et sans cache, chaque bloc
+        est analysé d'un coup par analyser_lot. Un fichier illisible est
+        signalé puis ignoré.
+        
+        Args:
+            sources (list): Fichiers, répertoires ou motifs glob
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+            champ_texte (str): Champ contenant le texte dans les fichiers JSONL
+            par_fichier (dict): Complété avec chemin -> StatistiquesSentiments
+            agregateur (AgregateurSentiments): Alimenté avec chaque résultat et
+                l'enregistrement JSONL dont il provient ({'fichier': chemin}
+                pour un fichier texte)
+        
+        Yields:
+            dict: Résultat d'analyse pour chaque texte non vide
+        """
+        if self.cache is not None:
+            self.verifier_lexique()
+        analyser = self._moteur(rapide)
+        par_lot = rapide and self.cache is None
+        try:
+            for chemin in lister_corpus(sources):
+                statistiques = StatistiquesSentiments()
+                if par_fichier is not None:
+                    par_fichier[chemin] = statistiques
+                try:
+                    for bloc in iter_blocs_corpus(chemin, champ_texte,
+                                                  avec_enregistrements=agregateur is not None):
+                        textes = bloc if agregateur is None else bloc[0]
+                        resultats = self.analyser_lot(textes) if par_lot else map(analyser, textes)
+                        if agregateur is None:
+                            for resultat in resultats:
+                                statistiques.ajouter(resultat)
+                                yield resultat
+                        else:
+                            for resultat, enregistrement in zip(resultats, bloc[1]):
+                                statistiques.ajouter(resultat)
+                                agregateur.ajouter(resultat, enregistrement)
+                                yield resultat
+                except Exception as e:
+                    print(f"Erreur lors de la lecture du fichier '{chemin}' : {e}")
+        finally:
+            if self.cache is not None:
+                self.cache.synchroniser()
+
+    def iter_analyses_incrementales(self, chemin_fichier, chemin_reprise=None, rapide=False,
+                                    statistiques=None, intervalle=INTERVALLE_REPRISE_DEFAUT):
+        """
+        Analyse un fichier en reprenant là où la dernière exécution s'est arrêtée
+        
+        La position (en octets) de la dernière ligne complète analysée et les
+        compteurs cumulés sont enregistrés régulièrement dans un fichier de
+        reprise. Une nouvelle exécution ne lit que les lignes ajoutées depuis.
+        L'analyse repart du début si le fichier a été tronqué ou remplacé, ou
+        si le lexique a changé.
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            chemin_reprise (str): Fichier de reprise (défaut : chemin_fichier + '.reprise')
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+            statistiques (StatistiquesSentiments): Compteurs complétés dès l'appel
+                avec les agrégats déjà enregistrés ; l'appelant y ajoute ensuite
+                les nouveaux résultats pour obtenir les statistiques du fichier entier
+            intervalle (int): Nombre de lignes entre deux sauvegardes
+        
+        Returns:
+            generator: Résultats d'analyse des nouvelles lignes non vides
+        """
+        chemin_reprise = chemin_reprise or chemin_fichier + '.reprise'
+        if self.cache is not None:
+            self.verifier_lexique()
+        
+        position, precedentes = self._charger_reprise(chemin_fichier, chemin_reprise)
+        if statistiques is not None:
+            statistiques.fusionner(precedentes)
+        
+        return self._generer_incrementales(chemin_fichier, chemin_reprise, position,
+                                           precedentes, rapide, intervalle)
+
+    def _charger_reprise(self, chemin_fichier, chemin_reprise):
+        """
+        Lit le point de reprise d'un fichier s'il est encore valable
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier analysé
+            chemin_reprise (str): Chemin vers le fichier de reprise
+        
+        Returns:
+            tuple: (position en octets, StatistiquesSentiments déjà cumulées)
+        """
+        try:
+            with open(chemin_reprise, 'r', encoding='utf-8') as fichier:
+                reprise = json.load(fichier)
+        except FileNotFoundError:
+            return 0, StatistiquesSentiments()
+        except (ValueError, OSError) as e:
+            print(f"Fichier de reprise illisible ({e}), analyse depuis le début.")
+            return 0, StatistiquesSentiments()
+        
+        try:
+            position = reprise['position']
+            valide = (reprise['empreinte'] == self.empreinte
+                      and os.path.getsize(chemin_fichier) >= position
+                      and reprise['entete'] == _empreinte_entete(chemin_fichier, position))
+        except OSError:
+            valide = False
+        
+        if not valide:
+            print("Fichier modifié ou lexique changé depuis la reprise, analyse depuis le début.")
+            return 0, StatistiquesSentiments()
+        
+        return position, StatistiquesSentiments.depuis_dict(reprise['statistiques'])
+
+    def _sauvegarder_reprise(self, chemin_fichier, chemin_reprise, position, statistiques):
+        """
+        Enregistre le point de reprise de façon atomique
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier analysé
+            chemin_reprise (str): Chemin vers le fichier de reprise
+            position (int): Position en octets après la dernière ligne complète
+            statistiques (StatistiquesSentiments): Compteurs cumulés jusqu'à position
+        """
+        reprise = {
+            'fichier': os.path.abspath(chemin_fichier),
+            'position': position,
+            'entete': _empreinte_entete(chemin_fichier, position),
+            'empreinte': self.empreinte,
+            'statistiques': statistiques.en_dict()
+        }
+        temporaire = chemin_reprise + '.tmp'
+        with open(temporaire, 'w', encoding='utf-8') as fichier:
+            json.dump(reprise, fichier)
+        os.replace(temporaire, chemin_reprise)
+
+    def _generer_incrementales(self, chemin_fichier, chemin_reprise, position, statistiques,
+                               rapide, intervalle):
+        """
+        Analyse les lignes situées après position et met à jour la reprise
+        
+        Une dernière ligne sans retour à la ligne (en cours d'écriture) est
+        analysée mais pas enregistrée dans la reprise : elle sera relue
+        entière lors de la prochaine exécution.
+        
+        Yields:
+            dict: Résultat d'analyse pour chaque nouvelle ligne non vide
+        """
+        analyser = self._moteur(rapide)
+        depuis_sauvegarde = 0
+        try:
+            with open(chemin_fichier, 'rb') as fichier:
+                fichier.seek(position)
+                for ligne in fichier:
+                    complete = ligne.endswith(b'\n')
+                    texte = ligne.decode('utf-8').strip()
+                    if texte:  # Ignorer les lignes vides
+                        resultat = analyser(texte)
+                        if complete:
+                            statistiques.ajouter(resultat)
+                        yield resultat
+                    if complete:
+                        position += len(ligne)
+                        depuis_sauvegarde += 1
+                        if depuis_sauvegarde >= intervalle:
+                            self._sauvegarder_reprise(chemin_fichier, chemin_reprise,
+                                                      position, statistiques)
+                            depuis_sauvegarde = 0
+        except FileNotFoundError:
+            print(f"Erreur : Le fichier '{chemin_fichier}' n'a pas été trouvé.")
+            return
+        except Exception as e:
+            print(f"Erreur lors de la lecture du fichier : {e}")
+        finally:
+            if self.cache is not None:
+                self.cache.synchroniser()
+        
+        self._sauvegarder_reprise(chemin_fichier, chemin_reprise, position, statistiques)
+
+    def iter_analyses_paralleles(self, chemin_fichier, workers=None, taille_bloc=TAILLE_BLOC_DEFAUT,
+                                 rapide=False):
+        """
+        Analyse un fichier texte en parallèle sur plusieurs processus
+        
+        Le fichier est découpé en blocs d'octets alignés sur les fins de ligne,
+        chaque processus réutilise une copie de cet analyseur, et les résultats
+        sont restitués dans l'ordre des lignes du fichier.
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            workers (int): Nombre de processus (défaut : nombre de cœurs)
+            taille_bloc (int): Taille cible d'un bloc en octets
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+        
+        Yields:
+            dict: Résultat d'analyse pour chaque ligne non vide
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            yield from self.iter_analyses(chemin_fichier, rapide)
+            return
+        
+        if self.cache is not None:
+            self.verifier_lexique()
+        try:
+            blocs = decouper_fichier(chemin_fichier, taille_bloc)
+        except FileNotFoundError:
+            print(f"Erreur : Le fichier '{chemin_fichier}' n'a pas été trouvé.")
+            return
+        except Exception as e:
+            print(f"Erreur lors de la lecture du fichier : {e}")
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_initialiser_worker,
+                                 initargs=(self,)) as executeur:
+            en_cours = deque()
+            suivants = iter(blocs)
+            while True:
+                # Fenêtre glissante de blocs en cours : la mémoire reste bornée
+                for debut, fin in islice(suivants, workers * 2 - len(en_cours)):
+                    en_cours.append(executeur.submit(_analyser_bloc, chemin_fichier, debut, fin, rapide))
+                if not en_cours:
+                    break
+                resultats, erreur = self._recevoir_bloc(*en_cours.popleft().result())
+                yield from resultats
+                if erreur is not None:
+                    # Comme iter_analyses, la lecture s'arrête après les lignes lisibles
+                    print(f"Erreur lors de la lecture du fichier : {erreur}")
+                    executeur.shutdown(cancel_futures=True)
+                    return
+
+    def _recevoir_bloc(self, resultats, succes, echecs, profil, erreur):
+        """
+        Intègre un bloc de résultats reçu d'un processus du pool
+        
+        Les résultats rapides sont rattachés à cet analyseur et les compteurs
+        du cache du processus sont reportés sur le cache principal.
+        
+        Args:
+            resultats (list): Résultats renvoyés par un processus du pool
+            succes (int): Succès du cache du processus pendant le bloc
+            echecs (int): Échecs du cache du processus pendant le bloc
+            profil (ProfileurAnalyse): Mesures du processus pendant le bloc
+            erreur (Exception): Erreur de lecture ayant interrompu le bloc, ou None
+        
+        Returns:
+            tuple: (résultats du bloc, erreur de lecture ou None)
+        """
+        if self.cache is not None:
+            self.cache.succes += succes
+            self.cache.echecs += echecs
+        if profil is not None and self.profileur is not None:
+            self.profileur.fusionner(profil)
+        for resultat in resultats:
+            if isinstance(resultat, ResultatAnalyse):
+                resultat.analyseur = self
+        return resultats, erreur
+
+    def analyser_fichier_parallele(self, chemin_fichier, workers=None, taille_bloc=TAILLE_BLOC_DEFAUT,
+                                   rapide=False):
+        """
+        Analyse les sentiments d'un fichier texte sur plusieurs processus
+        
+        Args:
+            chemin_fichier (str): Chemin vers le fichier à analyser
+            workers (int): Nombre de processus (défaut : nombre de cœurs)
+            taille_bloc (int): Taille cible d'un bloc en octets
+            rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+        
+        Returns:
+            list: Liste des résultats d'analyse, dans l'ordre des lignes
+        """
+        return list(self.iter_analyses_paralleles(chemin_fichier, workers, taille_bloc, rapide))
+
+def _normaliser_cle(mot):
+    """
+    Met une entrée de lexique sous la forme produite par la tokenization
+    
+    Args:
+        mot (str): Mot ou expression
+    
+    Returns:
+        str: Mots en minuscules sans ponctuation ni accents, élisions
+            développées, séparés par une espace
+    """
+    return ' '.join(ELISIONS.get(partie, partie) for partie in decouper_mots(mot))
+
+def lire_source_lexique(chemin):
+    """
+    Lit un lexique source au format CSV ou JSON
+    
+    Format CSV : une ligne d'en-tête « mot,categorie,valeur » puis une entrée
+    par ligne, categorie valant positif, negatif, negation ou intensificateur
+    et valeur le poids (1-3) ou le facteur d'intensité (vide pour une négation).
+    Format JSON : un objet avec les clés mots_positifs, mots_negatifs,
+    negations (liste) et intensificateurs. Les entrées peuvent être des
+    expressions de plusieurs mots ; elles sont normalisées comme le texte
+    analysé (minuscules, ponctuation remplacée par des espaces).
+    
+    Args:
+        chemin (str): Chemin du fichier source
+    
+    Returns:
+        dict: Dictionnaires mots_positifs, mots_negatifs, intensificateurs et
+            ensemble negations
+    """
+    source = {'mots_positifs': {}, 'mots_negatifs': {}, 'negations': set(), 'intensificateurs': {}}
+    
+    if chemin.lower().endswith('.json'):
+        with open(chemin, 'r', encoding='utf-8') as fichier:
+            donnees = json.load(fichier)
+        for cle in ('mots_positifs', 'mots_negatifs', 'intensificateurs'):
+            for mot, valeur in donnees.get(cle, {}).items():
+                source[cle][_normaliser_cle(mot)] = valeur
+        source['negations'].update(_normaliser_cle(mot) for mot in donnees.get('negations', []))
+        return source
+    
+    categories = {
+        'positif': 'mots_positifs',
+        'negatif': 'mots_negatifs',
+        'négatif': 'mots_negatifs',
+        'intensificateur': 'intensificateurs'
+    }
+    with open(chemin, 'r', encoding='utf-8', newline='') as fichier:
+        for numero, ligne in enumerate(csv.DictReader(fichier), 2):
+            mot = _normaliser_cle(ligne.get('mot') or '')
+            categorie = (ligne.get('categorie') or '').strip().lower()
+            valeur = (ligne.get('valeur') or '').strip()
+            if not mot:
+                continue
+            if categorie in ('negation', 'négation'):
+                source['negations'].add(mot)
+            elif categorie in categories:
+                try:
+                    # Les poids entiers restent entiers, comme dans le lexique intégré
+                    valeur = float(valeur) if '.' in valeur else int(valeur)
+                except ValueError:
+                    raise ValueError(f"{chemin}, ligne {numero} : valeur invalide '{valeur}'")
+                source[categories[categorie]][mot] = valeur
+            else:
+                raise ValueError(f"{chemin}, ligne {numero} : catégorie inconnue '{categorie}'")
+    return source
+
+def ecrire_lexique_binaire(lexique, chemin, empreinte):
+    """
+    Compile une table fusionnée dans un lexique binaire projetable en mémoire
+    
+    Le fichier contient un en-tête, une table de hachage à adressage ouvert
+    (CRC32 du mot, sondage linéaire, taux de remplissage au plus 1/2), les
+    mots encodés en UTF-8, puis la liste des expressions de plusieurs mots
+    (une par ligne) pour construire l'automate sans parcourir la table.
+    
+    Args:
+        lexique (dict): Table mot -> (polarite, poids, est_negation, facteur)
+        chemin (str): Fichier binaire à écrire
+        empreinte (str): Empreinte SHA-256 hexadécimale du lexique
+    """
+    nb_cases = 1
+    while nb_cases < 2 * max(len(lexique), 1):
+        nb_cases *= 2
+    masque = nb_cases - 1
+    
+    cases = [None] * nb_cases
+    chaines = bytearray()
+    for mot, (polarite, poids, est_negation, facteur) in lexique.items():
+        octets = mot.encode('utf-8')
+        drapeaux = 0
+        if est_negation:
+            drapeaux |= _DRAPEAU_NEGATION
+        if facteur is not None:
+            drapeaux |= _DRAPEAU_INTENSIFICATEUR
+        if isinstance(poids, int):
+            drapeaux |= _DRAPEAU_POIDS_ENTIER
+        
+        crc = zlib.crc32(octets)
+        indice = crc & masque
+        while cases[indice] is not None:
+            indice = (indice + 1) & masque
+        cases[indice] = (crc, len(chaines), len(octets), polarite, drapeaux,
+                         float(poids), float(facteur or 0))
+        chaines += octets
+    
+    expressions = '\n'.join(mot for mot in lexique if ' ' in mot).encode('utf-8')
+    
+    offset_cases = _ENTETE_LEXIQUE.size
+    offset_chaines = offset_cases + nb_cases * _CASE_LEXIQUE.size
+    offset_expressions = offset_chaines + len(chaines)
+    temporaire = chemin + '.tmp'
+    with open(temporaire, 'wb') as fichier:
+        fichier.write(_ENTETE_LEXIQUE.pack(MAGIQUE_LEXIQUE, len(lexique), nb_cases,
+                                           offset_cases, offset_chaines, bytes.fromhex(empreinte),
+                                           offset_expressions, len(expressions)))
+        vide = _CASE_LEXIQUE.pack(0, _CASE_VIDE, 0, 0, 0, 0.0, 0.0)
+        for case in cases:
+            fichier.write(vide if case is None else _CASE_LEXIQUE.pack(*case))
+        fichier.write(chaines)
+        fichier.write(expressions)
+    os.replace(temporaire, chemin)
+
+class LexiqueBinaire:
+    """
+    Lexique compilé projeté en mémoire (mmap)
+    
+    S'utilise comme la table fusionnée de compiler_lexique :
+    get(mot) renvoie (polarite, poids, est_negation, facteur) ou None.
+    Les mots déjà recherchés sont mémorisés dans le processus.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self._fichier = open(chemin, 'rb')
+        self._carte = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._carte[:len(MAGIQUE_LEXIQUE)] != MAGIQUE_LEXIQUE:
+            self.fermer()
+            raise ValueError(f"'{chemin}' n'est pas un lexique binaire NovaTech de cette version "
+                             "(recompilez-le avec --compiler-lexique)")
+        (_, self.nb_entrees, nb_cases, self._offset_cases, self._offset_chaines, empreinte,
+         self._offset_expressions, self._taille_expressions) = _ENTETE_LEXIQUE.unpack_from(self._carte, 0)
+        self._nb_cases = nb_cases
+        self._masque = nb_cases - 1
+        self.empreinte = empreinte.hex()
+        self._memo = {}
+
+    def __reduce__(self):
+        # Un processus du pool rouvre le fichier : les pages projetées sont partagées
+        return (LexiqueBinaire, (self.chemin,))
+
+    def __len__(self):
+        return self.nb_entrees
+
+    def __contains__(self, mot):
+        return self.get(mot) is not None
+
+    def _entree(self, indice):
+        """
+        Décode la case d'indice donné
+        
+        Returns:
+            tuple: (crc, mot en octets, entrée) ou None si la case est vide
+        """
+        crc, offset, longueur, polarite, drapeaux, poids, facteur = _CASE_LEXIQUE.unpack_from(
+            self._carte, self._offset_cases + indice * _CASE_LEXIQUE.size)
+        if offset == _CASE_VIDE:
+            return None
+        debut = self._offset_chaines + offset
+        entree = (
+            polarite,
+            int(poids) if drapeaux & _DRAPEAU_POIDS_ENTIER else poids,
+            bool(drapeaux & _DRAPEAU_NEGATION),
+            facteur if drapeaux & _DRAPEAU_INTENSIFICATEUR else None
+        )
+        return crc, self._carte[debut:debut + longueur], entree
+
+    def get(self, mot, defaut=None):
+        """
+        Recherche un mot dans le lexique
+        
+        Args:
+            mot (str): Mot à rechercher
+            defaut: Valeur renvoyée si le mot est absent
+        
+        Returns:
+            tuple: (polarite, poids, est_negation, facteur), ou defaut
+        """
+        memo = self._memo
+        if mot in memo:
+            entree = memo[mot]
+        else:
+            octets = mot.encode('utf-8')
+            crc = zlib.crc32(octets)
+            indice = crc & self._masque
+            while True:
+                case = self._entree(indice)
+                if case is None:
+                    entree = None
+                    break
+                if case[0] == crc and case[1] == octets:
+                    entree = case[2]
+                    break
+                indice = (indice + 1) & self._masque
+            if len(memo) >= TAILLE_MEMO_LEXIQUE:
+                memo.clear()
+            memo[mot] = entree
+        return defaut if entree is None else entree
+
+    def items(self):
+        """
+        Parcourt toutes les entrées du lexique
+        
+        Yields:
+            tuple: (mot, (polarite, poids, est_negation, facteur))
+        """
+        for indice in range(self._nb_cases):
+            case = self._entree(indice)
+            if case is not None:
+                yield case[1].decode('utf-8'), case[2]
+
+    def expressions(self):
+        """
+        Liste les expressions de plusieurs mots du lexique
+        
+        Returns:
+            list: Expressions, mots séparés par une espace
+        """
+        debut = self._offset_expressions
+        contenu = self._carte[debut:debut + self._taille_expressions].decode('utf-8')
+        return contenu.split('\n') if contenu else []
+
+    def fermer(self):
+        """
+        Libère la projection en mémoire
+        """
+        self._carte.close()
+        self._fichier.close()
+
+class AutomateExpressions:
+    """
+    Automate d'Aho-Corasick reconnaissant des expressions de plusieurs mots
+    
+    Les transitions portent sur des mots entiers : le texte tokenizé est
+    parcouru une seule fois, quel que soit le nombre d'expressions. Les
+    occurrences retenues sont les plus à gauche puis les plus longues, sans
+    chevauchement. Chaque expression reconnue devient une seule unité, sur
+    laquelle la négation (2 unités précédentes) et l'intensificateur (unité
+    précédente) s'appliquent comme sur un mot.
+    """
+
+    def __init__(self, expressions):
+        transitions = [{}]
+        longueurs = [()]
+        for expression in expressions:
+            mots = expression.split()
+            etat = 0
+            for mot in mots:
+                suivant = transitions[etat].get(mot)
+                if suivant is None:
+                    suivant = len(transitions)
+                    transitions[etat][mot] = suivant
+                    transitions.append({})
+                    longueurs.append(())
+                etat = suivant
+            longueurs[etat] = (len(mots),)
+        
+        # Liens d'échec et longueurs des expressions se terminant dans chaque état
+        echecs = [0] * len(transitions)
+        sorties = list(longueurs)
+        file = deque(transitions[0].values())
+        while file:
+            etat = file.popleft()
+            for mot, suivant in transitions[etat].items():
+                echec = echecs[etat]
+                while echec and mot not in transitions[echec]:
+                    echec = echecs[echec]
+                echecs[suivant] = transitions[echec].get(mot, 0)
+                sorties[suivant] = sorties[suivant] + sorties[echecs[suivant]]
+                file.append(suivant)
+        
+        self.expressions = list(expressions)
+        self.nb_expressions = sum(1 for longueur in longueurs if longueur)
+        self._transitions = transitions
+        self._echecs = echecs
+        self._sorties = sorties
+
+    def fusionner(self, mots):
+        """
+        Regroupe les expressions reconnues dans une liste de mots
+        
+        Args:
+            mots (list): Mots tokenizés
+        
+        Returns:
+            list: Mots, chaque expression reconnue remplacée par une chaîne
+                unique (mots séparés par une espace)
+        """
+        transitions = self._transitions
+        echecs = self._echecs
+        sorties = self._sorties
+        racine = transitions[0]
+        
+        etat = 0
+        candidats = []
+        for fin, mot in enumerate(mots, 1):
+            while etat and mot not in transitions[etat]:
+                etat = echecs[etat]
+            etat = transitions[etat].get(mot, 0) if etat else racine.get(mot, 0)
+            if sorties[etat]:
+                for longueur in sorties[etat]:
+                    candidats.append((fin - longueur, -longueur))
+        
+        if not candidats:
+            return mots
+        
+        # Les plus à gauche d'abord, puis les plus longues
+        candidats.sort()
+        unites = []
+        position = 0
+        for debut, moins_longueur in candidats:
+            if debut < position:
+                continue
+            fin = debut - moins_longueur
+            unites.extend(mots[position:debut])
+            unites.append(' '.join(mots[debut:fin]))
+            position = fin
+        unites.extend(mots[position:])
+        return unites
+
+class ExpressionsLot:
+    """
+    Reconnaissance vectorisée des expressions sur les identifiants d'un lot
+    
+    Donne le même découpage que AutomateExpressions.fusionner. Le trie des
+    expressions est parcouru depuis toutes les positions du lot à la fois :
+    à chaque étape, les transitions (état, mot) de toutes les positions
+    encore en cours sont cherchées d'un coup par np.searchsorted dans un
+    tableau trié. Seules les occurrences trouvées sont ensuite parcourues
+    en Python.
+    
+    Args:
+        expressions (list): Expressions (mots séparés par une espace)
+        index (dict): Mot -> identifiant, couvrant les mots des expressions
+    """
+
+    def __init__(self, expressions, index):
+        # Code de chaque mot des expressions (0 : mot hors expression) ; le
+        # dernier élément, lu pour la sentinelle -1, reste à 0
+        self.codes = np.zeros(max(index.values()) + 2, dtype=np.int64)
+        vocabulaire = {}
+        for expression in expressions:
+            for mot in expression.split():
+                if mot not in vocabulaire:
+                    vocabulaire[mot] = len(vocabulaire) + 1
+                    self.codes[index[mot]] = vocabulaire[mot]
+        
+        transitions = {}
+        unites = [0]
+        for expression in expressions:
+            etat = 0
+            for mot in expression.split():
+                cle = (etat, vocabulaire[mot])
+                if cle not in transitions:
+                    transitions[cle] = len(unites)
+                    unites.append(0)
+                etat = transitions[cle]
+            unites[etat] = index[expression]
+        
+        self.base = len(vocabulaire) + 1
+        cles = sorted(transitions)
+        self.cles = np.array([etat * self.base + code for etat, code in cles], dtype=np.int64)
+        self.suivants = np.array([transitions[cle] for cle in cles], dtype=np.int64)
+        # Identifiant de l'expression qui se termine dans chaque état (0 : aucune)
+        self.unites = np.array(unites, dtype=np.int64)
+        self.longueur_max = max(len(expression.split()) for expression in expressions)
+
+    def fusionner(self, identifiants):
+        """
+        Remplace chaque expression reconnue par son identifiant
+        
+        Les occurrences retenues sont les plus à gauche puis les plus
+        longues, sans chevauchement.
+        
+        Args:
+            identifiants (numpy.ndarray): Identifiants des mots du lot
+        
+        Returns:
+            numpy.ndarray: Identifiants des unités (mots et expressions)
+        """
+        codes = self.codes[identifiants]
+        nb_mots = len(identifiants)
+        positions = np.flatnonzero(codes)
+        etats = np.zeros(len(positions), dtype=np.int64)
+        debuts = []
+        longueurs = []
+        unites = []
+        for decalage in range(self.longueur_max):
+            suivantes = positions + decalage
+            dans_lot = suivantes < nb_mots
+            positions, etats, suivantes = positions[dans_lot], etats[dans_lot], suivantes[dans_lot]
+            cles = etats * self.base + codes[suivantes]
+            rangs = np.minimum(np.searchsorted(self.cles, cles), len(self.cles) - 1)
+            trouvees = self.cles[rangs] == cles
+            positions, etats = positions[trouvees], self.suivants[rangs[trouvees]]
+            if not len(positions):
+                break
+            unites_etat = self.unites[etats]
+            terminees = unites_etat != 0
+            debuts.append(positions[terminees])
+            longueurs.append(np.full(int(terminees.sum()), decalage + 1))
+            unites.append(unites_etat[terminees])
+        
+        if not debuts or not sum(map(len, debuts)):
+            return identifiants
+        
+        # Les plus à gauche d'abord, puis les plus longues
+        debuts = np.concatenate(debuts)
+        longueurs = np.concatenate(longueurs)
+        unites = np.concatenate(unites)
+        ordre = np.lexsort((-longueurs, debuts))
+        retenues = []
+        position = 0
+        for rang, debut, longueur in zip(ordre.tolist(), debuts[ordre].tolist(), longueurs[ordre].tolist()):
+            if debut >= position:
+                retenues.append(rang)
+                position = debut + longueur
+        debuts, longueurs = debuts[retenues], longueurs[retenues] - 1
+        
+        identifiants = identifiants.copy()
+        identifiants[debuts] = unites[retenues]
+        # Les mots suivants de chaque expression sont retirés
+        decalages = np.arange(longueurs.sum()) - np.repeat(np.cumsum(longueurs) - longueurs, longueurs) + 1
+        garder = np.ones(nb_mots, dtype=bool)
+        garder[np.repeat(debuts, longueurs) + decalages] = False
+        return identifiants[garder]
+
+class VueLexique(Mapping):
+    """
+    Vue en lecture seule d'une catégorie d'un lexique binaire
+    
+    Remplace mots_positifs, mots_negatifs, negations et intensificateurs
+    lorsqu'un lexique binaire est chargé, pour que analyser_texte et
+    analyser_contexte fonctionnent sans construire de dictionnaires.
+    """
+
+    def __init__(self, lexique, categorie):
+        self.lexique = lexique
+        self.categorie = categorie
+
+    def _valeur(self, entree):
+        """
+        Extrait la valeur de la catégorie d'une entrée, ou None si elle n'en fait pas partie
+        """
+        if entree is None:
+            return None
+        polarite, poids, est_negation, facteur = entree
+        if self.categorie == 'positif':
+            return poids if polarite > 0 else None
+        if self.categorie == 'negatif':
+            return poids if polarite < 0 else None
+        if self.categorie == 'negation':
+            return True if est_negation else None
+        return facteur
+
+    def __getitem__(self, mot):
+        valeur = self._valeur(self.lexique.get(mot))
+        if valeur is None:
+            raise KeyError(mot)
+        return valeur
+
+    def __contains__(self, mot):
+        return self._valeur(self.lexique.get(mot)) is not None
+
+    def __iter__(self):
+        for mot, entree in self.lexique.items():
+            if self._valeur(entree) is not None:
+                yield mot
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+def _compter_modifications(classe, methodes):
+    """
+    Fait incrémenter l'attribut revision par les méthodes qui modifient le conteneur
+    
+    Args:
+        classe (type): Sous-classe de dict ou de set à instrumenter
+        methodes (tuple): Noms des méthodes qui modifient le contenu
+    
+    Returns:
+        type: La classe instrumentée
+    """
+    def envelopper(methode):
+        def modifier(self, *args, **kwargs):
+            resultat = methode(self, *args, **kwargs)
+            self.revision += 1
+            return resultat
+        modifier.__name__ = methode.__name__
+        modifier.__doc__ = methode.__doc__
+        return modifier
+    
+    base = classe.__bases__[0]
+    for nom in methodes:
+        setattr(classe, nom, envelopper(getattr(base, nom)))
+    return classe
+
+class DictionnaireMots(dict):
+    """
+    Dictionnaire de mots du lexique qui compte ses modifications
+    
+    Permet à analyser_texte_cache de savoir sans recalculer l'empreinte si
+    les dictionnaires ont changé depuis la dernière compilation.
+    """
+
+    revision = 0
+
+class EnsembleMots(set):
+    """
+    Ensemble de mots du lexique qui compte ses modifications
+    """
+
+    revision = 0
+
+_compter_modifications(DictionnaireMots, (
+    '__setitem__', '__delitem__', '__ior__', 'clear', 'pop', 'popitem',
+    'setdefault', 'update'
+))
+_compter_modifications(EnsembleMots, (
+    '__iand__', '__ior__', '__isub__', '__ixor__', 'add', 'clear',
+    'difference_update', 'discard', 'intersection_update', 'pop', 'remove',
+    'symmetric_difference_update', 'update'
+))
+
+def _determiner_sentiment(score_positif, score_negatif):
+    """
+    Détermine le sentiment et la confiance à partir des scores
+    
+    Args:
+        score_positif (float): Score cumulé des mots positifs
+        score_negatif (float): Score cumulé des mots négatifs
+    
+    Returns:
+        tuple: (sentiment, confiance, score_total), non arrondis
+    """
+    score_total = score_positif + score_negatif
+    
+    if score_total == 0:
+        return "neutre", 0, score_total
+    
+    ratio = score_positif / score_total
+    
+    if ratio > 0.7:
+        sentiment = "positif"
+    elif ratio < 0.3:
+        sentiment = "négatif"
+    else:
+        sentiment = "neutre"
+    
+    # Calcul de la confiance basée sur l'écart des scores
+    confiance = min(100, abs(score_positif - score_negatif) * 10)
+    
+    return sentiment, confiance, score_total
+
+class ResultatAnalyse:
+    """
+    Résultat léger produit par le moteur rapide
+    
+    S'utilise comme le dictionnaire renvoyé par analyser_texte
+    (resultat['sentiment']). Les listes de mots détectés ne sont calculées
+    qu'au premier accès, par exemple en mode verbeux.
+    """
+
+    __slots__ = ('sentiment', 'confiance', 'score_positif', 'score_negatif',
+                 'score_total', 'texte_original', 'analyseur', '_detail')
+
+    CLES = ('sentiment', 'confiance', 'score_positif', 'score_negatif', 'score_total',
+            'mots_positifs', 'mots_negatifs', 'texte_original')
+
+    def __init__(self, sentiment, confiance, score_positif, score_negatif, score_total,
+                 texte_original, analyseur=None):
+        self.sentiment = sentiment
+        self.confiance = confiance
+        self.score_positif = score_positif
+        self.score_negatif = score_negatif
+        self.score_total = score_total
+        self.texte_original = texte_original
+        self.analyseur = analyseur
+        self._detail = None
+
+    def __reduce__(self):
+        # L'analyseur n'est pas transmis entre processus : il est rattaché
+        # par le processus qui reçoit le résultat
+        return (ResultatAnalyse, (self.sentiment, self.confiance, self.score_positif,
+                                  self.score_negatif, self.score_total, self.texte_original))
+
+    def __getitem__(self, cle):
+        if cle not in self.CLES:
+            raise KeyError(cle)
+        return getattr(self, cle)
+
+    def __repr__(self):
+        return f"ResultatAnalyse({self.sentiment!r}, confiance={self.confiance})"
+
+    def _details(self):
+        if self._detail is None:
+            analyseur = self.analyseur or AnalyseurSentiments()
+            self._detail = analyseur.analyser_texte(self.texte_original)
+        return self._detail
+
+    @property
+    def mots_positifs(self):
+        """Liste détaillée des mots positifs détectés (calculée à la demande)"""
+        return self._details()['mots_positifs']
+
+    @property
+    def mots_negatifs(self):
+        """Liste détaillée des mots négatifs détectés (calculée à la demande)"""
+        return self._details()['mots_negatifs']
+
+    def en_dict(self):
+        """
+        Convertit le résultat au format de analyser_texte
+        
+        Returns:
+            dict: Résultat complet, listes de mots incluses
+        """
+        return {cle: self[cle] for cle in self.CLES}
+
+class CacheResultats:
+    """
+    Cache des résultats d'analyse indexé par texte normalisé
+    
+    Combine un cache LRU en mémoire et, optionnellement, une base SQLite qui
+    persiste entre les exécutions. Les entrées sont associées à l'empreinte
+    du lexique et sont invalidées dès qu'elle change.
+    """
+
+    # Nombre d'écritures regroupées avant envoi vers la base
+    TAILLE_ECRITURE = 1000
+
+    def __init__(self, taille_max=TAILLE_CACHE_DEFAUT, chemin=None):
+        self.taille_max = taille_max
+        self.chemin = chemin
+        self.empreinte = None
+        self.succes = 0
+        self.echecs = 0
+        self._memoire = OrderedDict()
+        self._en_attente = {}
+        self._connexion = None
+        
+        if chemin:
+            self._connexion = sqlite3.connect(chemin)
+            self._connexion.execute(
+                "CREATE TABLE IF NOT EXISTS meta (cle TEXT PRIMARY KEY, valeur TEXT)")
+            # Colonnes sans type : SQLite conserve la distinction entier/réel
+            self._connexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultats (cle TEXT PRIMARY KEY, sentiment, "
+                "confiance, score_positif, score_negatif, score_total)")
+            self._connexion.commit()
+
+    def __reduce__(self):
+        # Dans un processus du pool, le cache est recréé en mémoire seulement :
+        # la base SQLite reste réservée au processus principal
+        return (CacheResultats, (self.taille_max,))
+
+    def valider(self, empreinte):
+        """
+        Vide le cache si l'empreinte du lexique a changé
+        
+        Args:
+            empreinte (str): Empreinte courante du lexique
+        """
+        if empreinte == self.empreinte:
+            return
+        
+        self._memoire.clear()
+        self._en_attente.clear()
+        if self._connexion is not None:
+            ligne = self._connexion.execute(
+                "SELECT valeur FROM meta WHERE cle = 'empreinte'").fetchone()
+            if ligne is None or ligne[0] != empreinte:
+                self._connexion.execute("DELETE FROM resultats")
+                self._connexion.execute(
+                    "INSERT OR REPLACE INTO meta (cle, valeur) VALUES ('empreinte', ?)",
+                    (empreinte,))
+                self._connexion.commit()
+        self.empreinte = empreinte
+
+    def obtenir(self, cle):
+        """
+        Cherche un résultat en mémoire puis dans la base
+        
+        Args:
+            cle (str): Texte normalisé
+        
+        Returns:
+            tuple: (sentiment, confiance, score_positif, score_negatif,
+                score_total), ou None si absent
+        """
+        valeurs = self._memoire.get(cle)
+        if valeurs is not None:
+            self._memoire.move_to_end(cle)
+            self.succes += 1
+            return valeurs
+        
+        if self._connexion is not None:
+            valeurs = self._en_attente.get(cle)
+            if valeurs is None:
+                valeurs = self._connexion.execute(
+                    "SELECT sentiment, confiance, score_positif, score_negatif, score_total "
+                    "FROM resultats WHERE cle = ?", (cle,)).fetchone()
+            if valeurs is not None:
+                self._memoriser(cle, valeurs)
+                self.succes += 1
+                return valeurs
+        
+        self.echecs += 1
+        return None
+
+    def ajouter(self, cle, valeurs):
+        """
+        Enregistre un résultat dans le cache
+        
+        Args:
+            cle (str): Texte normalisé
+            valeurs (tuple): (sentiment, confiance, score_positif,
+                score_negatif, score_total)
+        """
+        self._memoriser(cle, valeurs)
+        if self._connexion is not None:
+            self._en_attente[cle] = valeurs
+            if len(self._en_attente) >= self.TAILLE_ECRITURE:
+                self.synchroniser()
+
+    def _memoriser(self, cle, valeurs):
+        self._memoire[cle] = valeurs
+        if len(self._memoire) > self.taille_max:
+            self._memoire.popitem(last=False)
+
+    def synchroniser(self):
+        """
+        Écrit dans la base les résultats en attente
+        """
+        if self._connexion is None or not self._en_attente:
+            return
+        self._connexion.executemany(
+            "INSERT OR REPLACE INTO resultats (cle, sentiment, confiance, score_positif, "
+            "score_negatif, score_total) VALUES (?, ?, ?, ?, ?, ?)",
+            [(cle,) + tuple(valeurs) for cle, valeurs in self._en_attente.items()])
+        self._connexion.commit()
+        self._en_attente.clear()
+
+    def fermer(self):
+        """
+        Synchronise puis ferme la base persistante
+        """
+        if self._connexion is not None:
+            self.synchroniser()
+            self._connexion.close()
+            self._connexion = None
+
+    @property
+    def taux_succes(self):
+        """Proportion des recherches trouvées dans le cache (en %)"""
+        total = self.succes + self.echecs
+        return self.succes / total * 100 if total else 0
+
+def _empreinte_entete(chemin_fichier, position):
+    """
+    Calcule l'empreinte du début d'un fichier, limité à la partie déjà analysée
+    
+    Args:
+        chemin_fichier (str): Chemin vers le fichier
+        position (int): Nombre d'octets déjà analysés
+    
+    Returns:
+        str: Empreinte SHA-256 hexadécimale
+    """
+    with open(chemin_fichier, 'rb') as fichier:
+        entete = fichier.read(min(position, TAILLE_ENTETE_REPRISE))
+    return hashlib.sha256(entete).hexdigest()
+
+def lister_corpus(sources):
+    """
+    Liste les fichiers d'un corpus
+    
+    Un répertoire est parcouru récursivement à la recherche des fichiers
+    .txt et .jsonl, compressés ou non (.gz, .bz2, .xz). Un motif glob
+    (* ? [] et ** récursif) est développé tel quel.
+    
+    Args:
+        sources (list): Fichiers, répertoires ou motifs glob
+    
+    Returns:
+        list: Chemins des fichiers, sans doublon, dans l'ordre des sources
+    """
+    fichiers = []
+    for source in sources:
+        if os.path.isdir(source):
+            trouves = []
+            for dossier, _, noms in os.walk(source):
+                for nom in noms:
+                    base, extension = os.path.splitext(nom)
+                    if extension in DECOMPRESSEURS:
+                        extension = os.path.splitext(base)[1]
+                    if extension in EXTENSIONS_CORPUS:
+                        trouves.append(os.path.join(dossier, nom))
+        elif glob.has_magic(source):
+            trouves = [chemin for chemin in glob.glob(source, recursive=True)
+                       if os.path.isfile(chemin)]
+        else:
+            trouves = [source]
+        if not trouves:
+            print(f"Attention : aucun fichier ne correspond à '{source}'.")
+        fichiers.extend(sorted(trouves))
+    return list(dict.fromkeys(fichiers))
+
+def _iter_blocs_bruts(chemin, taille_bloc=TAILLE_LECTURE_CORPUS):
+    """
+    Lit un fichier par blocs de lignes entières décodées
+    
+    Un fichier non compressé est projeté en mémoire : chaque bloc est décodé
+    directement depuis la projection, sans lecture ligne par ligne. Un
+    fichier compressé est décompressé en flux par blocs de taille_bloc.
+    
+    Args:
+        chemin (str): Chemin vers le fichier
+        taille_bloc (int): Taille approximative d'un bloc en octets
+    
+    Yields:
+        str: Bloc de texte se terminant par une fin de ligne (sauf le dernier)
+    """
+    decompresser = DECOMPRESSEURS.get(os.path.splitext(chemin)[1])
+    if decompresser is not None:
+        with decompresser(chemin, 'rb') as fichier:
+            reste = b''
+            while True:
+                bloc = fichier.read(taille_bloc)
+                if not bloc:
+                    break
+                bloc = reste + bloc if reste else bloc
+                fin = bloc.rfind(b'\n') + 1
+                if fin:
+                    yield bloc[:fin].decode('utf-8')
+                reste = bloc[fin:]
+            if reste:
+                yield reste.decode('utf-8')
+        return
+    
+    taille = os.path.getsize(chemin)
+    if not taille:  # Un fichier vide ne peut pas être projeté en mémoire
+        return
+    with open(chemin, 'rb') as fichier, \
+            mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ) as carte:
+        vue = memoryview(carte)
+        try:
+            debut = 0
+            while debut < taille:
+                fin = min(debut + taille_bloc, taille)
+                if fin < taille:
+                    fin_ligne = carte.rfind(b'\n', debut, fin)
+                    if fin_ligne < 0:  # Ligne plus longue qu'un bloc
+                        fin_ligne = carte.find(b'\n', fin)
+                    fin = fin_ligne + 1 if fin_ligne >= 0 else taille
+                yield str(vue[debut:fin], 'utf-8')
+                debut = fin
+        finally:
+            vue.release()
+
+def iter_blocs_corpus(chemin, champ_texte='texte', taille_bloc=TAILLE_LECTURE_CORPUS,
+                      avec_enregistrements=False):
+    """
+    Lit les textes d'un fichier de corpus par blocs
+    
+    Un fichier .jsonl (éventuellement compressé) contient un objet JSON par
+    ligne dont le champ champ_texte est analysé ; les lignes invalides ou
+    sans ce champ sont ignorées. Les autres fichiers contiennent un texte
+    par ligne.
+    
+    Args:
+        chemin (str): Chemin vers le fichier
+        champ_texte (str): Champ contenant le texte dans les fichiers JSONL
+        taille_bloc (int): Taille approximative d'un bloc en octets
+        avec_enregistrements (bool): Produire aussi l'enregistrement de chaque
+            texte (objet JSONL complété du champ 'fichier', ou {'fichier': chemin})
+    
+    Yields:
+        list: Textes non vides d'un bloc, ou tuple (textes, enregistrements)
+            avec avec_enregistrements
+    """
+    base, extension = os.path.splitext(chemin)
+    if extension in DECOMPRESSEURS:
+        extension = os.path.splitext(base)[1]
+    jsonl = extension == '.jsonl'
+    enregistrement_fichier = {'fichier': chemin}
+    
+    for bloc in _iter_blocs_bruts(chemin, taille_bloc):
+        if not jsonl:
+            textes = [ligne for ligne in map(str.strip, bloc.split('\n')) if ligne]
+            enregistrements = [enregistrement_fichier] * len(textes)
+        else:
+            textes = []
+            enregistrements = []
+            for ligne in bloc.split('\n'):
+                if not ligne.strip():
+                    continue
+                try:
+                    enregistrement = json.loads(ligne)
+                    texte = enregistrement.get(champ_texte)
+                except (ValueError, AttributeError):
+                    continue
+                if isinstance(texte, str) and texte.strip():
+                    textes.append(texte.strip())
+                    if avec_enregistrements:
+                        enregistrement.setdefault('fichier', chemin)
+                        enregistrements.append(enregistrement)
+        if textes:
+            yield (textes, enregistrements) if avec_enregistrements else textes
+
+def decouper_fichier(chemin_fichier, taille_bloc=TAILLE_BLOC_DEFAUT):
+    """
+    Découpe un fichier en plages d'octets alignées sur les débuts de ligne
+    
+    Args:
+        chemin_fichier (str): Chemin vers le fichier à découper
+        taille_bloc (int): Taille cible d'un bloc en octets
+    
+    Returns:
+        list: Liste de tuples (debut, fin) couvrant tout le fichier
+    """
+    taille = os.path.getsize(chemin_fichier)
+    blocs = []
+    with open(chemin_fichier, 'rb') as fichier:
+        debut = 0
+        while debut < taille:
+            fichier.seek(min(debut + taille_bloc, taille))
+            fichier.readline()  # Avancer jusqu'à la fin de la ligne en cours
+            fin = min(fichier.tell(), taille)
+            blocs.append((debut, fin))
+            debut = fin
+    return blocs
+
+# Analyseur propre à chaque processus du pool, créé une seule fois par processus
+_analyseur_worker = None
+
+def _initialiser_worker(analyseur):
+    """
+    Installe l'analyseur réutilisé par le processus courant
+    
+    Args:
+        analyseur (AnalyseurSentiments): Copie de l'analyseur du processus parent
+    """
+    global _analyseur_worker
+    _analyseur_worker = analyseur
+
+def _analyser_bloc(chemin_fichier, debut, fin, rapide=False):
+    """
+    Analyse les lignes d'une plage d'octets d'un fichier
+    
+    Args:
+        chemin_fichier (str): Chemin vers le fichier à analyser
+        debut (int): Position de début (début de ligne)
+        fin (int): Position de fin (exclue)
+        rapide (bool): Utiliser le moteur rapide (analyser_texte_rapide)
+    
+    Les lignes sont découpées comme dans iter_analyses (fins de ligne
+    universelles). Une erreur de lecture ou de décodage interrompt le bloc
+    sans perdre les résultats des lignes précédentes.
+    
+    Returns:
+        tuple: (résultats des lignes non vides du bloc, succès du cache,
+            échecs du cache, mesures du profileur, erreur de lecture ou None)
+    """
+    profil = None
+    if _analyseur_worker.profileur is not None:
+        # Mesures propres au bloc, fusionnées par le processus principal
+        profil = _analyseur_worker.profileur = ProfileurAnalyse()
+    analyser = _analyseur_worker._moteur(rapide)
+    cache = _analyseur_worker.cache
+    succes, echecs = (cache.succes, cache.echecs) if cache is not None else (0, 0)
+    resultats = []
+    erreur = None
+    try:
+        with open(chemin_fichier, 'rb') as fichier:
+            fichier.seek(debut)
+            donnees = fichier.read(fin - debut)
+        for ligne in io.TextIOWrapper(io.BytesIO(donnees), encoding='utf-8'):
+            ligne = ligne.strip()
+            if ligne:  # Ignorer les lignes vides
+                resultats.append(analyser(ligne))
+    except (OSError, UnicodeDecodeError) as e:
+        erreur = e
+    if cache is not None:
+        succes, echecs = cache.succes - succes, cache.echecs - echecs
+    return resultats, succes, echecs, profil, erreur
+
+class ProfileurAnalyse:
+    """
+    Profileur par défaut : temps par étape et compteurs du scoring
+    
+    L'analyseur appelle enregistrer(etape, duree) autour de chaque étape
+    (preprocess_texte, analyser_contexte, scoring, analyse_rapide,
+    analyser_lot) et compter(...) une fois par texte ou par lot. Tout objet
+    exposant ces méthodes et fusionner() peut être installé dans
+    AnalyseurSentiments.profileur ; sans profileur, seul un test
+    « is not None » est ajouté par texte.
+    """
+
+    def __init__(self):
+        self.durees = defaultdict(float)
+        self.appels = defaultdict(int)
+        self.mots = 0
+        self.occurrences = 0
+        self.negations = 0
+        self.intensificateurs = 0
+
+    def enregistrer(self, etape, duree):
+        """
+        Ajoute la durée d'un passage dans une étape
+        
+        Args:
+            etape (str): Nom de l'étape
+            duree (float): Durée en secondes
+        """
+        self.durees[etape] += duree
+        self.appels[etape] += 1
+
+    def compter(self, mots, occurrences, negations, intensificateurs):
+        """
+        Ajoute les compteurs du scoring d'un texte ou d'un lot
+        
+        Args:
+            mots (int): Mots lus
+            occurrences (int): Mots trouvés dans le lexique de sentiments
+            negations (int): Négations appliquées
+            intensificateurs (int): Intensificateurs appliqués
+        """
+        self.mots += mots
+        self.occurrences += occurrences
+        self.negations += negations
+        self.intensificateurs += intensificateurs
+
+    def fusionner(self, autre):
+        """
+        Ajoute les mesures d'un autre profileur (par exemple d'un processus du pool)
+        
+        Args:
+            autre (ProfileurAnalyse): Mesures à intégrer
+        """
+        for etape, duree in autre.durees.items():
+            self.durees[etape] += duree
+            self.appels[etape] += autre.appels[etape]
+        self.mots += autre.mots
+        self.occurrences += autre.occurrences
+        self.negations += autre.negations
+        self.intensificateurs += autre.intensificateurs
+
+class StatistiquesSentiments:
+    """
+    Compteurs cumulés des analyses, alimentés résultat par résultat
+    
+    Permet de calculer les statistiques globales sans conserver la liste
+    complète des résultats en mémoire.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.positifs = 0
+        self.negatifs = 0
+        self.neutres = 0
+        self.somme_confiance = 0
+
+    def ajouter(self, resultat):
+        """
+        Intègre un résultat d'analyse dans les compteurs
+        
+        Args:
+            resultat (dict): Résultat de l'analyse
+        """
+        self.total += 1
+        sentiment = resultat['sentiment']
+        if sentiment == 'positif':
+            self.positifs += 1
+        elif sentiment == 'négatif':
+            self.negatifs += 1
+        elif sentiment == 'neutre':
+            self.neutres += 1
+        self.somme_confiance += resultat['confiance']
+
+    def fusionner(self, autres):
+        """
+        Ajoute à ces compteurs ceux d'un autre ensemble d'analyses
+        
+        Args:
+            autres (StatistiquesSentiments): Compteurs à intégrer
+        """
+        self.total += autres.total
+        self.positifs += autres.positifs
+        self.negatifs += autres.negatifs
+        self.neutres += autres.neutres
+        self.somme_confiance += autres.somme_confiance
+
+    def en_dict(self):
+        """
+        Exporte les compteurs (par exemple vers un fichier de reprise)
+        
+        Returns:
+            dict: Compteurs cumulés
+        """
+        return {
+            'total': self.total,
+            'positifs': self.positifs,
+            'negatifs': self.negatifs,
+            'neutres': self.neutres,
+            'somme_confiance': self.somme_confiance
+        }
+
+    @classmethod
+    def depuis_dict(cls, donnees):
+        """
+        Reconstruit des compteurs exportés par en_dict
+        
+        Args:
+            donnees (dict): Compteurs cumulés
+        
+        Returns:
+            StatistiquesSentiments: Compteurs reconstruits
+        """
+        statistiques = cls()
+        for cle, valeur in donnees.items():
+            setattr(statistiques, cle, valeur)
+        return statistiques
+
+    @property
+    def confiance_moyenne(self):
+        """Confiance moyenne des analyses intégrées"""
+        return self.somme_confiance / self.total if self.total else 0
+
+class EcrivainResultats:
+    """
+    Base des écrivains de résultats en masse
+    
+    Les résultats sont accumulés dans un tampon puis écrits par paquets de
+    TAILLE_TAMPON_SORTIE. S'utilise comme gestionnaire de contexte ; les
+    sous-classes définissent _ligne (conversion d'un résultat) et _vider.
+    
+    Args:
+        destination (str): Fichier de sortie ('-' pour la sortie standard)
+        texte (bool): Inclure le texte original
+        mots (bool): Inclure les listes de mots détectés (coûteux en mode rapide)
+    """
+
+    def __init__(self, destination, texte=True, mots=False):
+        self.destination = destination
+        self.texte = texte
+        self.mots = mots
+        self.nb_lignes = 0
+        self._tampon = []
+        
+        # Colonnes écrites, dans l'ordre
+        self.champs = ['sentiment', 'confiance', 'score_positif', 'score_negatif', 'score_total']
+        if mots:
+            self.champs += ['mots_positifs', 'mots_negatifs']
+        if texte:
+            self.champs.append('texte_original')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+    def _ouvrir_texte(self):
+        if self.destination == '-':
+            return sys.stdout
+        return open(self.destination, 'w', encoding='utf-8', newline='',
+                    buffering=1024 * 1024)
+
+    def ecrire(self, resultat):
+        """
+        Ajoute un résultat à la sortie
+        
+        Args:
+            resultat (dict): Résultat de l'analyse
+        """
+        self._tampon.append(self._ligne(resultat))
+        self.nb_lignes += 1
+        if len(self._tampon) >= TAILLE_TAMPON_SORTIE:
+            self._vider()
+
+    def ecrire_tous(self, resultats):
+        """
+        Ajoute plusieurs résultats à la sortie
+        
+        Args:
+            resultats (iterable): Résultats de l'analyse
+        """
+        for resultat in resultats:
+            self.ecrire(resultat)
+
+    def fermer(self):
+        """
+        Écrit le tampon restant et ferme la sortie
+        """
+        self._vider()
+
+class EcrivainJSONL(EcrivainResultats):
+    """
+    Écrit un objet JSON par ligne
+    """
+
+    def __init__(self, destination, texte=True, mots=False):
+        super().__init__(destination, texte, mots)
+        self._fichier = self._ouvrir_texte()
+
+    def _ligne(self, resultat):
+        return json.dumps({champ: resultat[champ] for champ in self.champs}, ensure_ascii=False)
+
+    def _vider(self):
+        if self._tampon:
+            self._tampon.append('')
+            self._fichier.write('\n'.join(self._tampon))
+            self._tampon = []
+
+    def fermer(self):
+        self._vider()
+        if self._fichier is not sys.stdout:
+            self._fichier.close()
+
+class EcrivainCSV(EcrivainResultats):
+    """
+    Écrit un fichier CSV avec une ligne d'en-tête
+    
+    Les listes de mots détectés sont encodées en JSON dans leur cellule.
+    """
+
+    def __init__(self, destination, texte=True, mots=False):
+        super().__init__(destination, texte, mots)
+        self._fichier = self._ouvrir_texte()
+        self._csv = csv.writer(self._fichier)
+        self._csv.writerow(self.champs)
+
+    def _ligne(self, resultat):
+        ligne = [resultat[champ] for champ in self.champs[:5]]
+        if self.mots:
+            ligne.append(json.dumps(resultat['mots_positifs'], ensure_ascii=False))
+            ligne.append(json.dumps(resultat['mots_negatifs'], ensure_ascii=False))
+        if self.texte:
+            ligne.append(resultat['texte_original'])
+        return ligne
+
+    def _vider(self):
+        if self._tampon:
+            self._csv.writerows(self._tampon)
+            self._tampon = []
+
+    def fermer(self):
+        self._vider()
+        if self._fichier is not sys.stdout:
+            self._fichier.close()
+
+class EcrivainColonnes(EcrivainResultats):
+    """
+    Écrit les résultats en colonnes binaires dans un répertoire
+    
+    Chaque colonne est un fichier de valeurs typées contiguës, lisible sans
+    analyse de texte (par exemple avec numpy.memmap, voir lire_colonnes) :
+    sentiment.i1 (int8, voir CODES_SENTIMENT), confiance.f8, score_positif.f8,
+    score_negatif.f8 et score_total.f8 (float64). Le texte original est
+    optionnel : texte.utf8 contient les textes bout à bout et texte.idx
+    (uint64) leurs n + 1 positions de début. schema.json décrit les colonnes
+    (type NumPy avec ordre des octets) et le nombre de lignes.
+    """
+    
+    # (colonne, code array, type NumPy sans ordre des octets, fichier)
+    COLONNES = (('sentiment', 'b', 'i1', 'sentiment.i1'),
+                ('confiance', 'd', 'f8', 'confiance.f8'),
+                ('score_positif', 'd', 'f8', 'score_positif.f8'),
+                ('score_negatif', 'd', 'f8', 'score_negatif.f8'),
+                ('score_total', 'd', 'f8', 'score_total.f8'))
+
+    def __init__(self, destination, texte=True, mots=False):
+        if mots:
+            raise ValueError("Le format en colonnes ne contient pas les listes de mots détectés")
+        if destination == '-':
+            raise ValueError("Le format en colonnes nécessite un répertoire de destination")
+        super().__init__(destination, texte, mots)
+        os.makedirs(destination, exist_ok=True)
+        
+        self._fichiers = [open(os.path.join(destination, fichier), 'wb')
+                          for _, _, _, fichier in self.COLONNES]
+        if texte:
+            self._textes = open(os.path.join(destination, 'texte.utf8'), 'wb')
+            self._index = open(os.path.join(destination, 'texte.idx'), 'wb')
+            self._position = 0
+            array.array('Q', [0]).tofile(self._index)
+
+    def _ligne(self, resultat):
+        return resultat
+
+    def _vider(self):
+        if not self._tampon:
+            return
+        tampon = self._tampon
+        sentiments = array.array('b', [CODES_SENTIMENT[r['sentiment']] for r in tampon])
+        sentiments.tofile(self._fichiers[0])
+        for fichier, (nom, code, _, _) in zip(self._fichiers[1:], self.COLONNES[1:]):
+            array.array(code, [r[nom] for r in tampon]).tofile(fichier)
+        if self.texte:
+            positions = array.array('Q')
+            morceaux = []
+            for resultat in tampon:
+                morceau = resultat['texte_original'].encode('utf-8')
+                morceaux.append(morceau)
+                self._position += len(morceau)
+                positions.append(self._position)
+            self._textes.write(b''.join(morceaux))
+            positions.tofile(self._index)
+        self._tampon = []
+
+    def fermer(self):
+        self._vider()
+        for fichier in self._fichiers:
+            fichier.close()
+        ordre = '<' if sys.byteorder == 'little' else '>'
+        colonnes = {nom: {'fichier': fichier, 'type': ordre + type_numpy}
+                    for nom, _, type_numpy, fichier in self.COLONNES}
+        if self.texte:
+            self._textes.close()
+            self._index.close()
+            colonnes['texte_original'] = {'fichier': 'texte.utf8', 'index': 'texte.idx',
+                                          'type': 'utf8'}
+        schema = {
+            'version': 1,
+            'lignes': self.nb_lignes,
+            'codes_sentiment': CODES_SENTIMENT,
+            'colonnes': colonnes
+        }
+        with open(os.path.join(self.destination, 'schema.json'), 'w', encoding='utf-8') as fichier:
+            json.dump(schema, fichier, ensure_ascii=False, indent=2)
+
+def ouvrir_ecrivain(format_sortie, destination, texte=True, mots=False):
+    """
+    Crée l'écrivain correspondant à un format de sortie
+    
+    Args:
+        format_sortie (str): 'jsonl', 'csv' ou 'columnar' (voir FORMATS_SORTIE)
+        destination (str): Fichier (ou répertoire pour 'columnar') ; '-' pour
+            la sortie standard
+        texte (bool): Inclure le texte original
+        mots (bool): Inclure les listes de mots détectés
+    
+    Returns:
+        EcrivainResultats: Écrivain à fermer après usage
+    """
+    ecrivains = {'jsonl': EcrivainJSONL, 'csv': EcrivainCSV, 'columnar': EcrivainColonnes}
+    if format_sortie not in ecrivains:
+        raise ValueError(f"Format de sortie inconnu : {format_sortie}")
+    return ecrivains[format_sortie](destination, texte, mots)
+
+def lire_colonnes(repertoire):
+    """
+    Ouvre des résultats écrits par EcrivainColonnes sans les recopier
+    
+    Args:
+        repertoire (str): Répertoire contenant schema.json et les colonnes
+    
+    Returns:
+        dict: Colonne -> numpy.memmap (ou array.array sans NumPy) ; le texte
+            original est une liste de chaînes
+    """
+    with open(os.path.join(repertoire, 'schema.json'), 'r', encoding='utf-8') as fichier:
+        schema = json.load(fichier)
+    
+    colonnes = {}
+    for nom, description in schema['colonnes'].items():
+        chemin = os.path.join(repertoire, description['fichier'])
+        if nom == 'texte_original':
+            index = array.array('Q')
+            with open(os.path.join(repertoire, description['index']), 'rb') as fichier:
+                index.frombytes(fichier.read())
+            with open(chemin, 'rb') as fichier:
+                contenu = fichier.read()
+            colonnes[nom] = [contenu[index[i]:index[i + 1]].decode('utf-8')
+                             for i in range(schema['lignes'])]
+        elif np is not None:
+            if schema['lignes']:
+                colonnes[nom] = np.memmap(chemin, dtype=description['type'], mode='r',
+                                          shape=(schema['lignes'],))
+            else:  # Un fichier vide ne peut pas être projeté en mémoire
+                colonnes[nom] = np.empty(0, dtype=description['type'])
+        else:
+            valeurs = array.array('b' if description['type'].endswith('i1') else 'd')
+            with open(chemin, 'rb') as fichier:
+                valeurs.frombytes(fichier.read())
+            if description['type'][0] != ('<' if sys.byteorder == 'little' else '>'):
+                valeurs.byteswap()
+            colonnes[nom] = valeurs
+    return colonnes
+
+class EsquisseQuantiles:
+    """
+    Esquisse de quantiles en flux, fusionnable (principe de DDSketch)
+    
+    Chaque valeur est rangée dans un compartiment logarithmique : le quantile
+    estimé est à moins de precision (en relatif) de la valeur exacte, avec une
+    mémoire proportionnelle au logarithme de l'étendue des valeurs. Deux
+    esquisses de même précision se fusionnent en additionnant leurs
+    compartiments.
+    
+    Args:
+        precision (float): Erreur relative maximale des quantiles
+    """
+
+    def __init__(self, precision=PRECISION_QUANTILES):
+        self.precision = precision
+        self._gamma = (1 + precision) / (1 - precision)
+        self._log_gamma = math.log(self._gamma)
+        self.positifs = defaultdict(int)
+        self.negatifs = defaultdict(int)
+        self.zeros = 0
+        self.nombre = 0
+        self.minimum = None
+        self.maximum = None
+
+    def ajouter(self, valeur):
+        """
+        Intègre une valeur dans l'esquisse
+        
+        Args:
+            valeur (float): Valeur observée
+        """
+        self.nombre += 1
+        if valeur > 0:
+            self.positifs[math.ceil(math.log(valeur) / self._log_gamma)] += 1
+        elif valeur < 0:
+            self.negatifs[math.ceil(math.log(-valeur) / self._log_gamma)] += 1
+        else:
+            self.zeros += 1
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+        if self.maximum is None or valeur > self.maximum:
+            self.maximum = valeur
+
+    def fusionner(self, autre):
+        """
+        Ajoute à cette esquisse les valeurs d'une autre
+        
+        Args:
+            autre (EsquisseQuantiles): Esquisse de même précision
+        """
+        if autre.precision != self.precision:
+            raise ValueError("Impossible de fusionner des esquisses de précisions différentes")
+        for indice, nombre in autre.positifs.items():
+            self.positifs[indice] += nombre
+        for indice, nombre in autre.negatifs.items():
+            self.negatifs[indice] += nombre
+        self.zeros += autre.zeros
+        self.nombre += autre.nombre
+        if autre.minimum is not None:
+            self.minimum = autre.minimum if self.minimum is None else min(self.minimum, autre.minimum)
+            self.maximum = autre.maximum if self.maximum is None else max(self.maximum, autre.maximum)
+
+    def quantile(self, q):
+        """
+        Estime un quantile des valeurs intégrées
+        
+        Args:
+            q (float): Quantile entre 0 et 1 (0.5 pour la médiane)
+        
+        Returns:
+            float: Valeur estimée, ou None si l'esquisse est vide
+        """
+        if not self.nombre:
+            return None
+        rang = q * (self.nombre - 1)
+        cumul = 0
+        
+        # Parcours des compartiments dans l'ordre croissant des valeurs
+        for indice in sorted(self.negatifs, reverse=True):
+            cumul += self.negatifs[indice]
+            if cumul > rang:
+                return max(-self._valeur(indice), self.minimum)
+        cumul += self.zeros
+        if cumul > rang:
+            return 0
+        for indice in sorted(self.positifs):
+            cumul += self.positifs[indice]
+            if cumul > rang:
+                return min(self._valeur(indice), self.maximum)
+        return self.maximum
+
+    def _valeur(self, indice):
+        # Valeur représentative du compartiment ]gamma^(i-1), gamma^i]
+        return 2 * self._gamma ** indice / (self._gamma + 1)
+
+    def en_dict(self):
+        """
+        Exporte l'esquisse dans un format sérialisable en JSON
+        
+        Returns:
+            dict: Précision, compartiments et extrêmes
+        """
+        return {
+            'precision': self.precision,
+            'positifs': dict(self.positifs),
+            'negatifs': dict(self.negatifs),
+            'zeros': self.zeros,
+            'nombre': self.nombre,
+            'minimum': self.minimum,
+            'maximum': self.maximum
+        }
+
+    @classmethod
+    def depuis_dict(cls, donnees):
+        """
+        Reconstruit une esquisse exportée par en_dict
+        
+        Args:
+            donnees (dict): Esquisse exportée
+        
+        Returns:
+            EsquisseQuantiles: Esquisse reconstruite
+        """
+        esquisse = cls(donnees['precision'])
+        # Les clés JSON sont des chaînes
+        esquisse.positifs.update({int(indice): n for indice, n in donnees['positifs'].items()})
+        esquisse.negatifs.update({int(indice): n for indice, n in donnees['negatifs'].items()})
+        esquisse.zeros = donnees['zeros']
+        esquisse.nombre = donnees['nombre']
+        esquisse.minimum = donnees['minimum']
+        esquisse.maximum = donnees['maximum']
+        return esquisse
+
+class StatistiquesGroupe(StatistiquesSentiments):
+    """
+    Compteurs d'un groupe d'analyses, complétés des sommes des scores et
+    d'esquisses de quantiles de la confiance et des scores
+    """
+    
+    QUANTILES = ('confiance', 'score_positif', 'score_negatif')
+
+    def __init__(self):
+        super().__init__()
+        self.somme_score_positif = 0
+        self.somme_score_negatif = 0
+        self.quantiles = {cle: EsquisseQuantiles() for cle in self.QUANTILES}
+
+    def ajouter(self, resultat):
+        super().ajouter(resultat)
+        self.somme_score_positif += resultat['score_positif']
+        self.somme_score_negatif += resultat['score_negatif']
+        for cle, esquisse in self.quantiles.items():
+            esquisse.ajouter(resultat[cle])
+
+    def fusionner(self, autres):
+        super().fusionner(autres)
+        self.somme_score_positif += autres.somme_score_positif
+        self.somme_score_negatif += autres.somme_score_negatif
+        for cle, esquisse in self.quantiles.items():
+            esquisse.fusionner(autres.quantiles[cle])
+
+    def en_dict(self):
+        donnees = super().en_dict()
+        donnees['somme_score_positif'] = self.somme_score_positif
+        donnees['somme_score_negatif'] = self.somme_score_negatif
+        donnees['quantiles'] = {cle: esquisse.en_dict() for cle, esquisse in self.quantiles.items()}
+        return donnees
+
+    @classmethod
+    def depuis_dict(cls, donnees):
+        donnees = dict(donnees)
+        quantiles = donnees.pop('quantiles')
+        statistiques = super().depuis_dict(donnees)
+        statistiques.quantiles = {cle: EsquisseQuantiles.depuis_dict(esquisse)
+                                  for cle, esquisse in quantiles.items()}
+        return statistiques
+
+def tronquer_date(valeur, fenetre):
+    """
+    Ramène une date au début de sa fenêtre de temps
+    
+    Args:
+        valeur (str | float): Date ISO 8601 ou horodatage Unix (secondes, UTC)
+        fenetre (str): 'heure', 'jour', 'semaine' ou 'mois' (voir FENETRES)
+    
+    Returns:
+        str: Clé de la fenêtre (par exemple '2023-06-15' par jour), ou None
+            si la date est absente ou illisible
+    """
+    try:
+        if isinstance(valeur, (int, float)) and not isinstance(valeur, bool):
+            date = datetime.fromtimestamp(valeur, timezone.utc)
+        else:
+            date = datetime.fromisoformat(valeur)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+    return date.strftime(FENETRES[fenetre])
+
+class AgregateurSentiments:
+    """
+    Agrégats des analyses par groupe, fusionnables
+    
+    Les groupes sont définis par des champs des enregistrements analysés
+    (produit, source...) et, en option, par une fenêtre de temps appliquée
+    au champ de date. Chaque groupe conserve des compteurs et des esquisses
+    de quantiles (StatistiquesGroupe) : les agrégats de plusieurs processus
+    ou de plusieurs exécutions se combinent avec fusionner, sans relire les
+    données.
+    
+    Args:
+        cles (list): Champs des enregistrements définissant les groupes
+        fenetre (str): Fenêtre de temps (voir FENETRES), ou None
+        champ_date (str): Champ contenant la date des enregistrements
+    """
+
+    def __init__(self, cles=(), fenetre=None, champ_date='date'):
+        if fenetre is not None and fenetre not in FENETRES:
+            raise ValueError(f"Fenêtre de temps inconnue : {fenetre}")
+        self.cles = list(cles)
+        self.fenetre = fenetre
+        self.champ_date = champ_date
+        self.groupes = {}
+
+    @property
+    def colonnes(self):
+        """Noms des composantes de la clé des groupes"""
+        return ([self.fenetre] if self.fenetre else []) + self.cles
+
+    def cle_groupe(self, enregistrement):
+        """
+        Calcule la clé du groupe d'un enregistrement
+        
+        Args:
+            enregistrement (dict): Enregistrement analysé
+        
+        Returns:
+            tuple: Valeurs des colonnes (None pour un champ absent)
+        """
+        valeurs = [enregistrement.get(cle) for cle in self.cles]
+        if self.fenetre:
+            valeurs.insert(0, tronquer_date(enregistrement.get(self.champ_date), self.fenetre))
+        return tuple(None if valeur is None else str(valeur) for valeur in valeurs)
+
+    def ajouter(self, resultat, enregistrement):
+        """
+        Intègre un résultat dans le groupe de son enregistrement
+        
+        Args:
+            resultat (dict): Résultat de l'analyse
+            enregistrement (dict): Enregistrement dont provient le texte
+        """
+        cle = self.cle_groupe(enregistrement)
+        statistiques = self.groupes.get(cle)
+        if statistiques is None:
+            statistiques = self.groupes[cle] = StatistiquesGroupe()
+        statistiques.ajouter(resultat)
+
+    def fusionner(self, autre):
+        """
+        Ajoute les agrégats d'un autre agrégateur de même configuration
+        
+        Args:
+            autre (AgregateurSentiments): Agrégats à intégrer
+        """
+        if autre.colonnes != self.colonnes or autre.champ_date != self.champ_date:
+            raise ValueError("Impossible de fusionner des agrégats groupés différemment")
+        for cle, statistiques in autre.groupes.items():
+            if cle in self.groupes:
+                self.groupes[cle].fusionner(statistiques)
+            else:
+                self.groupes[cle] = statistiques
+
+    def en_dict(self):
+        """
+        Exporte la configuration et les agrégats dans un format sérialisable
+        
+        Returns:
+            dict: Configuration et liste des groupes
+        """
+        return {
+            'cles': self.cles,
+            'fenetre': self.fenetre,
+            'champ_date': self.champ_date,
+            'groupes': [{'cle': list(cle), 'statistiques': statistiques.en_dict()}
+                        for cle, statistiques in self.groupes.items()]
+        }
+
+    @classmethod
+    def depuis_dict(cls, donnees):
+        """
+        Reconstruit un agrégateur exporté par en_dict
+        
+        Args:
+            donnees (dict): Agrégateur exporté
+        
+        Returns:
+            AgregateurSentiments: Agrégateur reconstruit
+        """
+        agregateur = cls(donnees['cles'], donnees['fenetre'], donnees['champ_date'])
+        for groupe in donnees['groupes']:
+            agregateur.groupes[tuple(groupe['cle'])] = \
+                StatistiquesGroupe.depuis_dict(groupe['statistiques'])
+        return agregateur
+
+    def sauvegarder(self, chemin):
+        """
+        Enregistre les agrégats dans un fichier JSON de façon atomique
+        
+        Args:
+            chemin (str): Fichier de destination
+        """
+        temporaire = chemin + '.tmp'
+        with open(temporaire, 'w', encoding='utf-8') as fichier:
+            json.dump(self.en_dict(), fichier, ensure_ascii=False)
+        os.replace(temporaire, chemin)
+
+    @classmethod
+    def charger(cls, chemin):
+        """
+        Charge des agrégats enregistrés par sauvegarder
+        
+        Args:
+            chemin (str): Fichier JSON des agrégats
+        
+        Returns:
+            AgregateurSentiments: Agrégats enregistrés
+        """
+        with open(chemin, 'r', encoding='utf-8') as fichier:
+            return cls.depuis_dict(json.load(fichier))
+
+def afficher_resultat(resultat, verbose=False):
+    """
     Affiche les résultats de l'analyse de manière formatée
     
     Args:
@@ -281,43 +3174,132 @@ def afficher_resultat(resultat, verbose=False):
     
     print("="*60)
 
-def afficher_statistiques(resultats):
+def afficher_statistiques(resultats, cache=None, titre="STATISTIQUES GLOBALES", flux=None):
     """
     Affiche des statistiques sur plusieurs analyses
     
     Args:
-        resultats (list): Liste des résultats d'analyse
+        resultats (StatistiquesSentiments | list): Compteurs cumulés ou liste
+            des résultats d'analyse
+        cache (CacheResultats): Cache dont les compteurs sont affichés (optionnel)
+        titre (str): Titre du tableau (par exemple le nom d'un fichier)
+        flux (file): Flux d'affichage (défaut : sortie standard)
     """
-    if not resultats:
+    if not isinstance(resultats, StatistiquesSentiments):
+        statistiques = StatistiquesSentiments()
+        for resultat in resultats:
+            statistiques.ajouter(resultat)
+    else:
+        statistiques = resultats
+    
+    if not statistiques.total:
         return
     
     # Calcul des statistiques
-    total = len(resultats)
-    sentiments = [r['sentiment'] for r in resultats]
-    positifs = sentiments.count('positif')
-    negatifs = sentiments.count('négatif')
-    neutres = sentiments.count('neutre')
+    total = statistiques.total
+    positifs = statistiques.positifs
+    negatifs = statistiques.negatifs
+    neutres = statistiques.neutres
     
-    confiance_moyenne = sum(r['confiance'] for r in resultats) / total
+    confiance_moyenne = statistiques.confiance_moyenne
     
-    print("\n" + "="*60)
-    print("STATISTIQUES GLOBALES".center(60))
-    print("="*60)
-    print(f"Total d'analyses: {total}")
-    print(f"Sentiments positifs: {positifs} ({positifs/total*100:.1f}%)")
-    print(f"Sentiments négatifs: {negatifs} ({negatifs/total*100:.1f}%)")
-    print(f"Sentiments neutres: {neutres} ({neutres/total*100:.1f}%)")
-    print(f"Confiance moyenne: {confiance_moyenne:.1f}%")
-    print("="*60)
+    print("\n" + "="*60, file=flux)
+    print(titre.center(60), file=flux)
+    print("="*60, file=flux)
+    print(f"Total d'analyses: {total}", file=flux)
+    print(f"Sentiments positifs: {positifs} ({positifs/total*100:.1f}%)", file=flux)
+    print(f"Sentiments négatifs: {negatifs} ({negatifs/total*100:.1f}%)", file=flux)
+    print(f"Sentiments neutres: {neutres} ({neutres/total*100:.1f}%)", file=flux)
+    print(f"Confiance moyenne: {confiance_moyenne:.1f}%", file=flux)
+    if cache is not None:
+        print(f"Cache: {cache.succes} succès, {cache.echecs} échecs "
+              f"({cache.taux_succes:.1f}% de succès)", file=flux)
+    print("="*60, file=flux)
+
+def _agreger(resultats, agregateur, enregistrement):
+    """
+    Alimente un agrégateur avec des résultats au fil de leur lecture
+    
+    Args:
+        resultats (iterable): Résultats d'analyse
+        agregateur (AgregateurSentiments): Agrégats à compléter
+        enregistrement (dict): Enregistrement commun à tous les résultats
+    
+    Yields:
+        dict: Les résultats, inchangés
+    """
+    for resultat in resultats:
+        agregateur.ajouter(resultat, enregistrement)
+        yield resultat
 
-def interface_utilisateur():
+def afficher_agregats(agregateur, flux=None):
+    """
+    Affiche les agrégats par groupe, triés par clé
+    
+    Args:
+        agregateur (AgregateurSentiments): Agrégats à afficher
+        flux (file): Flux d'affichage (défaut : sortie standard)
+    """
+    colonnes = agregateur.colonnes or ['groupe']
+    largeur = max([len(colonne) for colonne in colonnes]
+                  + [len(valeur or '-') for cle in agregateur.groupes for valeur in cle])
+    
+    print("\n" + "="*60, file=flux)
+    print("AGRÉGATS PAR GROUPE".center(60), file=flux)
+    print("="*60, file=flux)
+    print(''.join(f"{colonne:<{largeur + 2}}" for colonne in colonnes)
+          + f"{'Total':>8}{'Positifs':>10}{'Négatifs':>10}{'Conf. moy.':>12}{'Conf. p50':>11}{'Conf. p90':>11}",
+          file=flux)
+    for cle in sorted(agregateur.groupes, key=lambda cle: [valeur or '' for valeur in cle]):
+        statistiques = agregateur.groupes[cle]
+        total = statistiques.total
+        confiance = statistiques.quantiles['confiance']
+        print(''.join(f"{valeur or '-':<{largeur + 2}}" for valeur in cle or ('tout',))
+              + f"{total:>8}{statistiques.positifs/total*100:>9.1f}%{statistiques.negatifs/total*100:>9.1f}%"
+              + f"{statistiques.confiance_moyenne:>11.1f}%{confiance.quantile(0.5):>10.1f}%"
+              + f"{confiance.quantile(0.9):>10.1f}%", file=flux)
+    print("="*60, file=flux)
+
+def afficher_profil(profileur, duree_totale=None, flux=None):
+    """
+    Affiche la répartition du temps par étape et les compteurs du scoring
+    
+    Args:
+        profileur (ProfileurAnalyse): Mesures collectées
+        duree_totale (float): Durée totale de l'analyse en secondes (optionnel)
+        flux (file): Flux d'affichage (défaut : sortie standard)
+    """
+    temps_etapes = sum(profileur.durees.values())
+    
+    print("\n" + "="*60, file=flux)
+    print("PROFIL DE L'ANALYSE".center(60), file=flux)
+    print("="*60, file=flux)
+    print(f"{'Étape':<20}{'Appels':>10}{'Total (ms)':>12}{'Moyen (µs)':>12}{'Part':>6}", file=flux)
+    for etape, duree in sorted(profileur.durees.items(), key=lambda e: -e[1]):
+        appels = profileur.appels[etape]
+        part = duree / temps_etapes * 100 if temps_etapes else 0
+        print(f"{etape:<20}{appels:>10}{duree*1000:>12.1f}{duree/appels*1e6:>12.1f}{part:>5.0f}%",
+              file=flux)
+    print("-"*60, file=flux)
+    if duree_totale is not None:
+        print(f"Durée totale (lecture et affichage compris): {duree_totale*1000:.1f} ms", file=flux)
+    print(f"Mots lus: {profileur.mots}", file=flux)
+    print(f"Mots du lexique trouvés: {profileur.occurrences}", file=flux)
+    print(f"Négations appliquées: {profileur.negations}", file=flux)
+    print(f"Intensificateurs appliqués: {profileur.intensificateurs}", file=flux)
+    print("="*60, file=flux)
+
+def interface_utilisateur(analyseur=None):
     """
     Interface utilisateur en ligne de commande
+    
+    Args:
+        analyseur (AnalyseurSentiments): Analyseur à utiliser (défaut : lexique intégré)
     """
     print("=== ANALYSEUR DE SENTIMENTS NOVATECH ===")
     print("Cet outil analyse le sentiment des textes (positif, négatif, neutre)\n")
     
-    analyseur = AnalyseurSentiments()
+    analyseur = analyseur or AnalyseurSentiments()
     
     while True:
         print("\nOptions disponibles:")
@@ -363,34 +3345,169 @@ def interface_arguments():
     parser = argparse.ArgumentParser(description="Analyseur de sentiments NovaTech")
     parser.add_argument("texte", nargs="?", help="Texte à analyser")
     parser.add_argument("-f", "--fichier", help="Chemin vers un fichier à analyser")
+    parser.add_argument("-c", "--corpus", action="append", default=[],
+                        help="Fichier, répertoire ou motif glob à analyser (.txt, .jsonl, "
+                             "compressés en .gz/.bz2/.xz ; option répétable)")
+    parser.add_argument("--champ", default="texte",
+                        help="Champ contenant le texte dans les fichiers JSONL (défaut: texte)")
+    parser.add_argument("-g", "--grouper", action="append", default=[], metavar="CHAMP",
+                        help="Agréger les résultats par ce champ des enregistrements JSONL "
+                             "('fichier' pour le fichier source ; option répétable)")
+    parser.add_argument("--fenetre", choices=list(FENETRES),
+                        help="Agréger aussi par fenêtre de temps sur le champ de date")
+    parser.add_argument("--champ-date", default="date",
+                        help="Champ contenant la date des enregistrements JSONL (défaut: date)")
+    parser.add_argument("--agregats", metavar="FICHIER",
+                        help="Fichier JSON des agrégats : ceux des exécutions précédentes "
+                             "sont repris puis complétés")
     parser.add_argument("-v", "--verbose", action="store_true", help="Mode verbeux")
     parser.add_argument("-s", "--stats", action="store_true", help="Afficher les statistiques")
+    parser.add_argument("--stream", action="store_true",
+                        help="Analyser le fichier en flux (mémoire constante, affichage au fil de l'eau)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Nombre de processus pour l'analyse d'un fichier (défaut: 1)")
+    parser.add_argument("-r", "--rapide", action="store_true",
+                        help="Utiliser le moteur de scoring rapide en un seul passage")
+    parser.add_argument("--reprise", nargs="?", const="",
+                        help="Analyse incrémentale : reprendre depuis le fichier de reprise "
+                             "indiqué (défaut: <fichier>.reprise)")
+    parser.add_argument("-l", "--lexique", action="append", default=[],
+                        help="Lexique à charger : CSV, JSON ou binaire compilé (option répétable)")
+    parser.add_argument("--compiler-lexique", metavar="DESTINATION",
+                        help="Compiler le lexique courant (intégré + --lexique) en binaire puis quitter")
+    parser.add_argument("--profile", action="store_true",
+                        help="Afficher le temps passé dans chaque étape après l'analyse d'un fichier")
+    parser.add_argument("--cache", action="store_true",
+                        help="Réutiliser les résultats des textes identiques une fois normalisés")
+    parser.add_argument("--cache-fichier",
+                        help="Fichier SQLite où conserver le cache entre les exécutions")
+    parser.add_argument("--format", choices=FORMATS_SORTIE, dest="format_sortie",
+                        help="Écrire les résultats du fichier en masse au lieu de les afficher")
+    parser.add_argument("-o", "--sortie", default="-",
+                        help="Destination de --format : fichier, répertoire pour columnar "
+                             "(défaut: sortie standard)")
+    parser.add_argument("--sans-texte", action="store_true",
+                        help="Ne pas écrire le texte original avec --format")
+    parser.add_argument("--avec-mots", action="store_true",
+                        help="Écrire aussi les listes de mots détectés avec --format (jsonl, csv)")
     
     args = parser.parse_args()
     
+    # L'analyse d'un corpus et l'analyse incrémentale se font dans le processus courant
+    if args.workers > 1 and (args.corpus or args.reprise is not None):
+        print("Erreur : --workers ne peut pas être combiné avec --corpus ou --reprise")
+        sys.exit(1)
+    
     analyseur = AnalyseurSentiments()
+    try:
+        for chemin in args.lexique:
+            analyseur.charger_lexique(chemin)
+    except (OSError, ValueError) as e:
+        print(f"Erreur lors du chargement du lexique : {e}")
+        sys.exit(1)
     
-    if args.fichier:
-        # Analyser un fichier
-        resultats = analyseur.analyser_fichier(args.fichier)
-        if resultats:
-            for i, resultat in enumerate(resultats, 1):
+    if args.compiler_lexique:
+        ecrire_lexique_binaire(analyseur.lexique, args.compiler_lexique, analyseur.empreinte)
+        print(f"Lexique compilé ({len(analyseur.lexique)} entrées) : {args.compiler_lexique}")
+        return
+    
+    if args.cache or args.cache_fichier:
+        analyseur.activer_cache(chemin=args.cache_fichier)
+    if args.profile:
+        analyseur.profileur = ProfileurAnalyse()
+    
+    agregateur = None
+    if args.grouper or args.fenetre or args.agregats:
+        agregateur = AgregateurSentiments(args.grouper, args.fenetre, args.champ_date)
+        if args.agregats and os.path.exists(args.agregats):
+            # Les nouveaux résultats complètent les agrégats des exécutions précédentes
+            try:
+                precedents = AgregateurSentiments.charger(args.agregats)
+                precedents.fusionner(agregateur)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Erreur lors du chargement des agrégats : {e}")
+                sys.exit(1)
+            agregateur = precedents
+    
+    if args.fichier or args.corpus:
+        # Analyser un fichier, en parallèle si plusieurs processus sont demandés
+        debut = time.perf_counter()
+        statistiques = StatistiquesSentiments()
+        par_fichier = {}
+        if args.corpus:
+            sources = ([args.fichier] if args.fichier else []) + args.corpus
+            resultats = analyseur.iter_analyses_corpus(sources, args.rapide, args.champ, par_fichier,
+                                                       agregateur)
+        elif args.reprise is not None:
+            # Les compteurs reçoivent d'abord les agrégats des exécutions précédentes
+            resultats = analyseur.iter_analyses_incrementales(args.fichier, args.reprise or None,
+                                                              args.rapide, statistiques)
+        elif args.workers > 1:
+            resultats = analyseur.iter_analyses_paralleles(args.fichier, args.workers,
+                                                           rapide=args.rapide)
+        else:
+            resultats = analyseur.iter_analyses(args.fichier, args.rapide)
+        
+        if agregateur is not None and not args.corpus:
+            resultats = _agreger(resultats, agregateur, {'fichier': args.fichier})
+        
+        if args.format_sortie:
+            # Écriture en masse, au fil de l'analyse
+            try:
+                ecrivain = ouvrir_ecrivain(args.format_sortie, args.sortie,
+                                           not args.sans_texte, args.avec_mots)
+            except (OSError, ValueError) as e:
+                print(f"Erreur lors de l'ouverture de la sortie : {e}")
+                sys.exit(1)
+            with ecrivain:
+                for resultat in resultats:
+                    ecrivain.ecrire(resultat)
+                    statistiques.ajouter(resultat)
+        else:
+            # Sans --stream, toutes les analyses sont terminées avant l'affichage
+            if not args.stream:
+                resultats = list(resultats)
+            
+            for i, resultat in enumerate(resultats, statistiques.total + 1):
                 print(f"\n--- Analyse {i} ---")
                 afficher_resultat(resultat, args.verbose)
-            
-            if args.stats:
-                afficher_statistiques(resultats)
-        else:
-            print("Aucun résultat à afficher.")
+                statistiques.ajouter(resultat)
+        
+        # Les résultats formatés sur la sortie standard ne doivent pas être
+        # mêlés aux messages et tableaux, envoyés alors sur la sortie d'erreur
+        flux = sys.stderr if args.format_sortie and args.sortie == '-' else sys.stdout
+        if not statistiques.total:
+            print("Aucun résultat à afficher.", file=flux)
+        elif args.stats:
+            if len(par_fichier) > 1:
+                for chemin, statistiques_fichier in par_fichier.items():
+                    afficher_statistiques(statistiques_fichier, titre=os.path.basename(chemin),
+                                          flux=flux)
+            afficher_statistiques(statistiques, analyseur.cache, flux=flux)
+        
+        if agregateur is not None:
+            if agregateur.groupes:
+                afficher_agregats(agregateur, flux)
+            if args.agregats:
+                agregateur.sauvegarder(args.agregats)
+        
+        if args.profile:
+            afficher_profil(analyseur.profileur, time.perf_counter() - debut, flux)
     
     elif args.texte:
         # Analyser un texte
-        resultat = analyseur.analyser_texte(args.texte)
+        if args.rapide or analyseur.cache is not None:
+            resultat = analyseur._moteur(rapide=True)(args.texte)
+        else:
+            resultat = analyseur.analyser_texte(args.texte)
         afficher_resultat(resultat, args.verbose)
     
     else:
         # Mode interactif
-        interface_utilisateur()
+        interface_utilisateur(analyseur)
+    
+    if analyseur.cache is not None:
+        analyseur.cache.fermer()
 
 if __name__ == '__main__':
     # Vérifier si des arguments ont été passés
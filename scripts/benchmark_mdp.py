@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Banc d'essai et contrôle statistique du générateur de mots de passe NovaTech
+Ce script mesure le débit, l'aléa consommé et la mémoire de la génération et
+de l'évaluation pour chaque longueur et chaque alphabet, vérifie l'uniformité
+des caractères produits (tests du khi-deux) et détecte les régressions par
+rapport à une mesure de référence
+Dernière mise à jour : 17/10/2026
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from generateur_mdp import (GenerateurMotsDePasse, PolitiqueMotsDePasse, construire_alphabet, evaluer_force, generer_mot_de_passe,
+                            generer_plusieurs_mots_de_passe)
+
+# Longueurs mesurées par défaut
+LONGUEURS = (8, 12, 16, 32, 64)
+
+# Combinaisons d'alphabets : nom -> (majuscules, chiffres, symboles)
+ALPHABETS = {
+    '+'.join(['min'] + [nom for nom, inclus in zip(('maj', 'chi', 'sym'), options) if inclus]): options
+    for options in itertools.product((True, False), repeat=3)
+}
+
+# Politiques mesurées : nom -> paramètres de PolitiqueMotsDePasse (les plus
+# contraintes passent par le tirage d'un rang, bien plus lent que le rejet)
+_MINIMUMS_5 = {'majuscules': 5, 'minuscules': 5, 'chiffres': 5, 'symboles': 5}
+POLITIQUES = {
+    'L16/min1/rep2': {'longueur': 16, 'minimums': {nom: 1 for nom in _MINIMUMS_5}, 'max_repetitions': 2},
+    'L64/min5/rep2': {'longueur': 64, 'minimums': _MINIMUMS_5, 'max_repetitions': 2},
+    'L16/chi6+sym6': {'longueur': 16, 'minimums': {'chiffres': 6, 'symboles': 6}},
+    'L64/chi20/rep2': {'longueur': 64, 'minimums': {'chiffres': 20}, 'max_repetitions': 2}
+}
+
+# Longueur des mots de passe utilisés pour les tests d'uniformité
+LONGUEUR_QUALITE = 16
+
+def percentile(valeurs, rang):
+    """
+    Calcule un percentile d'une liste de valeurs triées
+    
+    Args:
+        valeurs (list): Valeurs triées
+        rang (float): Percentile voulu (0-100)
+    
+    Returns:
+        float: Valeur du percentile
+    """
+    if not valeurs:
+        return 0
+    return valeurs[min(len(valeurs) - 1, int(len(valeurs) * rang / 100))]
+
+class CompteurOctets:
+    """
+    Compte les octets tirés de l'aléa du système pendant un bloc with
+    
+    os.urandom (générateur en masse) et l'aléa de random.SystemRandom
+    (module secrets) sont remplacés le temps du bloc par une fonction qui
+    compte les octets demandés avant de les tirer.
+    """
+
+    def __enter__(self):
+        self.octets = 0
+        self._originaux = (os.urandom, random._urandom)
+        tirer = os.urandom
+
+        def urandom(nombre):
+            self.octets += nombre
+            return tirer(nombre)
+        
+        os.urandom = random._urandom = urandom
+        return self
+
+    def __exit__(self, *exception):
+        os.urandom, random._urandom = self._originaux
+
+def mesurer_unitaire(longueur, options, nombre, repetitions):
+    """
+    Mesure generer_mot_de_passe appelé mot de passe par mot de passe
+    
+    Le meilleur des essais est retenu pour limiter le bruit de la machine.
+    
+    Args:
+        longueur (int): Longueur des mots de passe
+        options (tuple): (majuscules, chiffres, symboles)
+        nombre (int): Nombre d'appels par essai
+        repetitions (int): Nombre d'essais
+    
+    Returns:
+        dict: Débit, octets aléatoires par mot de passe et latences (µs)
+    """
+    meilleure = None
+    latences = []
+    for _ in range(repetitions):
+        horloge = time.perf_counter
+        latences_essai = []
+        debut = horloge()
+        for _ in range(nombre):
+            t0 = horloge()
+            generer_mot_de_passe(longueur, *options)
+            latences_essai.append(horloge() - t0)
+        duree = horloge() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+            latences = latences_essai
+    
+    with CompteurOctets() as compteur:
+        for _ in range(nombre):
+            generer_mot_de_passe(longueur, *options)
+    
+    latences.sort()
+    return {
+        'duree_s': round(meilleure, 6),
+        'mdp_s': round(nombre / meilleure, 1),
+        'octets_par_mdp': round(compteur.octets / nombre, 2),
+        'latence_p50_us': round(percentile(latences, 50) * 1e6, 2),
+        'latence_p99_us': round(percentile(latences, 99) * 1e6, 2)
+    }
+
+def mesurer_lot(longueur, options, nombre, repetitions):
+    """
+    Mesure generer_plusieurs_mots_de_passe puis evaluer_force sur le lot
+    
+    Args:
+        longueur (int): Longueur des mots de passe
+        options (tuple): (majuscules, chiffres, symboles)
+        nombre (int): Taille du lot
+        repetitions (int): Nombre d'essais
+    
+    Returns:
+        tuple: (mesures de la génération, mesures de l'évaluation)
+    """
+    meilleure = meilleure_evaluation = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        mots_de_passe = generer_plusieurs_mots_de_passe(nombre, longueur, *options)
+        duree = time.perf_counter() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+        debut = time.perf_counter()
+        for mot_de_passe in mots_de_passe:
+            evaluer_force(mot_de_passe)
+        duree = time.perf_counter() - debut
+        if meilleure_evaluation is None or duree < meilleure_evaluation:
+            meilleure_evaluation = duree
+    
+    # Octets utilisés par le lot : les blocs de os.urandom entamés mais non
+    # lus restent en réserve dans le générateur et ne sont pas comptés
+    generateur = GenerateurMotsDePasse(longueur, *options)
+    generateur.generer(nombre)
+    tracemalloc.start()
+    generer_plusieurs_mots_de_passe(nombre, longueur, *options)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    generation = {
+        'duree_s': round(meilleure, 6),
+        'mdp_s': round(nombre / meilleure, 1),
+        'octets_par_mdp': round(generateur.octets_consommes / nombre, 2),
+        'memoire_pic_kio': round(pic / 1024, 1)
+    }
+    evaluation = {
+        'duree_s': round(meilleure_evaluation, 6),
+        'mdp_s': round(nombre / meilleure_evaluation, 1)
+    }
+    return generation, evaluation
+
+def mesurer_politique(parametres, nombre, repetitions):
+    """
+    Mesure la construction d'une PolitiqueMotsDePasse puis la génération
+    
+    Args:
+        parametres (dict): Paramètres de PolitiqueMotsDePasse
+        nombre (int): Taille du lot
+        repetitions (int): Nombre d'essais
+    
+    Returns:
+        dict: Durée de construction, chemin de génération, débit et octets
+            aléatoires par mot de passe
+    """
+    debut = time.perf_counter()
+    politique = PolitiqueMotsDePasse(**parametres)
+    construction = time.perf_counter() - debut
+    meilleure = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        politique.generer(nombre)
+        duree = time.perf_counter() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+    
+    octets = politique.octets_consommes
+    politique.generer(nombre)
+    octets = politique.octets_consommes - octets
+    
+    return {
+        'construction_s': round(construction, 6),
+        'chemin': 'libre' if politique._libre else 'rejet' if politique._rejet is not None else 'rang',
+        'duree_s': round(meilleure, 6),
+        'mdp_s': round(nombre / meilleure, 1),
+        'octets_par_mdp': round(octets / nombre, 2)
+    }
+
+def p_valeur_khi2(khi2, ddl):
+    """
+    Probabilité d'un khi-deux au moins aussi grand sous l'hypothèse d'uniformité
+    
+    Utilise l'approximation de Wilson-Hilferty (loi normale de la racine
+    cubique), précise pour les grands degrés de liberté des tests ci-dessous.
+    
+    Args:
+        khi2 (float): Statistique du khi-deux
+        ddl (int): Degrés de liberté
+    
+    Returns:
+        float: p-valeur
+    """
+    variance = 2 / (9 * ddl)
+    z = ((khi2 / ddl) ** (1 / 3) - (1 - variance)) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def tester_uniformite(mots_de_passe, alphabet):
+    """
+    Tests du khi-deux d'uniformité des caractères d'un échantillon
+    
+    - frequences : chaque caractère de l'alphabet est aussi fréquent ;
+    - positions : cette fréquence ne dépend pas de la position ;
+    - paires : deux caractères consécutifs sont indépendants.
+    
+    Args:
+        mots_de_passe (list): Échantillon de mots de passe de même longueur
+        alphabet (str): Alphabet attendu
+    
+    Returns:
+        dict: Pour chaque test, khi-deux, degrés de liberté et p-valeur
+    """
+    taille = len(alphabet)
+    longueur = len(mots_de_passe[0])
+
+    def resultat(comptes, cases, effectif):
+        attendu = effectif / cases
+        khi2 = sum((compte - attendu) ** 2 for compte in comptes) / attendu
+        khi2 += (cases - len(comptes)) * attendu  # Cases jamais observées
+        ddl = cases - 1
+        return {'khi2': round(khi2, 1), 'ddl': ddl, 'p': round(p_valeur_khi2(khi2, ddl), 6)}
+    
+    texte = ''.join(mots_de_passe)
+    frequences = [texte.count(caractere) for caractere in alphabet]
+    tests = {'frequences': resultat(frequences, taille, len(texte))}
+    
+    khi2 = 0.0
+    for position in range(longueur):
+        colonne = texte[position::longueur]
+        attendu = len(colonne) / taille
+        khi2 += sum((colonne.count(caractere) - attendu) ** 2 for caractere in alphabet) / attendu
+    ddl = longueur * (taille - 1)
+    tests['positions'] = {'khi2': round(khi2, 1), 'ddl': ddl, 'p': round(p_valeur_khi2(khi2, ddl), 6)}
+    
+    paires = {}
+    for mot_de_passe in mots_de_passe:
+        for paire in zip(mot_de_passe, mot_de_passe[1:]):
+            paires[paire] = paires.get(paire, 0) + 1
+    tests['paires'] = resultat(paires.values(), taille * taille, len(mots_de_passe) * (longueur - 1))
+    
+    caracteres_inattendus = set(texte) - set(alphabet)
+    if caracteres_inattendus:
+        raise ValueError(f"Caractères hors de l'alphabet : {''.join(sorted(caracteres_inattendus))}")
+    return tests
+
+def executer_qualite(echantillon, echantillon_unitaire):
+    """
+    Contrôle l'uniformité des deux générateurs pour chaque alphabet
+    
+    Args:
+        echantillon (int): Nombre de mots de passe du générateur en masse
+        echantillon_unitaire (int): Nombre de mots de passe de generer_mot_de_passe
+    
+    Returns:
+        dict: Tests par générateur et par alphabet
+    """
+    qualite = {}
+    for nom, options in ALPHABETS.items():
+        alphabet = construire_alphabet(*options)
+        qualite[f"generer_plusieurs_mots_de_passe/{nom}"] = tester_uniformite(
+            generer_plusieurs_mots_de_passe(echantillon, LONGUEUR_QUALITE, *options), alphabet)
+        qualite[f"generer_mot_de_passe/{nom}"] = tester_uniformite(
+            [generer_mot_de_passe(LONGUEUR_QUALITE, *options) for _ in range(echantillon_unitaire)], alphabet)
+    return qualite
+
+def echecs_qualite(qualite, alpha):
+    """
+    Liste les tests d'uniformité hors de l'intervalle [alpha, 1 - alpha]
+    
+    Une p-valeur trop proche de 1 est aussi suspecte qu'une p-valeur trop
+    faible : elle signale une sortie trop régulière pour être aléatoire.
+    
+    Args:
+        qualite (dict): Résultats de executer_qualite
+        alpha (float): Seuil de chaque côté
+    
+    Returns:
+        list: Échecs (générateur/alphabet, test, p-valeur)
+    """
+    return [(nom, test, mesures['p'])
+            for nom, tests in qualite.items()
+            for test, mesures in tests.items()
+            if not alpha <= mesures['p'] <= 1 - alpha]
+
+def comparer(resultats, reference, seuil):
+    """
+    Compare les débits et l'aléa consommé à ceux d'une mesure de référence
+    
+    Les deux mesures doivent avoir été prises avec les mêmes paramètres
+    (tailles des lots et des échantillons), sinon ValueError est levée.
+    
+    Args:
+        resultats (dict): Mesures courantes
+        reference (dict): Mesures de référence
+        seuil (float): Variation relative tolérée (0.10 = 10 %)
+    
+    Returns:
+        list: Régressions détectées (configuration, fonction, mesure, valeur
+            de référence, valeur mesurée, variation)
+    """
+    if resultats['parametres'] != reference.get('parametres'):
+        raise ValueError(f"Paramètres différents de ceux de la référence : "
+                         f"{resultats['parametres']} au lieu de {reference.get('parametres')}")
+    regressions = []
+    for configuration, fonctions in resultats['performances'].items():
+        fonctions_reference = reference.get('performances', {}).get(configuration)
+        if not fonctions_reference:
+            continue
+        for fonction, mesures in fonctions.items():
+            mesures_reference = fonctions_reference.get(fonction)
+            if not mesures_reference:
+                continue
+            # Le débit ne doit pas baisser, l'aléa consommé ne doit pas augmenter
+            for mesure, sens in (('mdp_s', -1), ('octets_par_mdp', 1)):
+                if mesure not in mesures or not mesures_reference.get(mesure):
+                    continue
+                valeur, valeur_reference = mesures[mesure], mesures_reference[mesure]
+                variation = (valeur - valeur_reference) / valeur_reference
+                if variation * sens > seuil:
+                    regressions.append((configuration, fonction, mesure, valeur_reference, valeur, variation))
+    return regressions
+
+def afficher_resultats(resultats, alpha):
+    """
+    Affiche un résumé lisible des mesures
+    
+    Args:
+        resultats (dict): Mesures du banc d'essai
+        alpha (float): Seuil des tests d'uniformité
+    """
+    print("\n" + "="*78)
+    print("BANC D'ESSAI DU GÉNÉRATEUR DE MOTS DE PASSE".center(78))
+    print("="*78)
+    if resultats['performances']:
+        print(f"  {'Configuration':<22}{'Fonction':<32}{'mdp/s':>11}{'octets/mdp':>11}")
+    for configuration, fonctions in resultats['performances'].items():
+        for fonction, mesures in fonctions.items():
+            octets = mesures.get('octets_par_mdp', '-')
+            print(f"  {configuration:<22}{fonction:<32}{mesures['mdp_s']:>11}{octets:>11}")
+    if resultats['qualite']:
+        print("-"*78)
+        print(f"  {'Générateur/alphabet':<48}{'fréquences':>10}{'positions':>10}{'paires':>10}")
+        for nom, tests in resultats['qualite'].items():
+            valeurs = [f"{tests[test]['p']:.4f}" + ("" if alpha <= tests[test]['p'] <= 1 - alpha else "!")
+                       for test in ('frequences', 'positions', 'paires')]
+            print(f"  {nom:<48}{valeurs[0]:>10}{valeurs[1]:>10}{valeurs[2]:>10}")
+    print("="*78)
+
+def interface_arguments():
+    """
+    Interface en ligne de commande avec arguments
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai du générateur de mots de passe NovaTech")
+    parser.add_argument("-n", "--nombre", type=int, default=20000,
+                        help="Taille des lots de generer_plusieurs_mots_de_passe et evaluer_force")
+    parser.add_argument("--unitaires", type=int, default=2000, help="Nombre d'appels à generer_mot_de_passe")
+    parser.add_argument("-r", "--repetitions", type=int, default=3, help="Nombre d'essais par mesure")
+    parser.add_argument("--longueurs", nargs="+", type=int, default=list(LONGUEURS),
+                        help="Longueurs mesurées (8-64)")
+    parser.add_argument("--alphabets", nargs="+", choices=list(ALPHABETS), default=list(ALPHABETS),
+                        help="Alphabets mesurés")
+    parser.add_argument("--politiques", nargs="*", choices=list(POLITIQUES), default=list(POLITIQUES),
+                        help="Politiques de composition mesurées (aucune : --politiques sans valeur)")
+    parser.add_argument("--echantillon", type=int, default=200000,
+                        help="Mots de passe du générateur en masse par test d'uniformité")
+    parser.add_argument("--echantillon-unitaire", type=int, default=20000,
+                        help="Mots de passe de generer_mot_de_passe par test d'uniformité")
+    parser.add_argument("--alpha", type=float, default=1e-4,
+                        help="Seuil des tests d'uniformité, de chaque côté (défaut: 1e-4)")
+    parser.add_argument("--sans-performances", action="store_true", help="Ne lancer que les tests d'uniformité")
+    parser.add_argument("--sans-qualite", action="store_true", help="Ne lancer que les mesures de performances")
+    parser.add_argument("-o", "--sortie", help="Fichier JSON où écrire les mesures")
+    parser.add_argument("--reference", help="Fichier JSON de référence pour détecter les régressions")
+    parser.add_argument("--seuil", type=float, default=0.10,
+                        help="Variation de débit ou d'aléa consommé tolérée par rapport à la référence (défaut: 0.10)")
+    
+    args = parser.parse_args()
+    
+    if args.nombre < 1 or args.unitaires < 1 or args.repetitions < 1:
+        print("Erreur : Le nombre de mots de passe et de répétitions doit être au moins 1")
+        sys.exit(1)
+    if any(not 8 <= longueur <= 64 for longueur in args.longueurs):
+        print("Erreur : Les longueurs doivent être entre 8 et 64 caractères")
+        sys.exit(1)
+    
+    resultats = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'parametres': {
+            'nombre': args.nombre,
+            'unitaires': args.unitaires,
+            'echantillon': args.echantillon,
+            'echantillon_unitaire': args.echantillon_unitaire,
+            'longueur_qualite': LONGUEUR_QUALITE
+        },
+        'performances': {},
+        'qualite': {}
+    }
+    if not args.sans_performances:
+        for longueur in args.longueurs:
+            for nom in args.alphabets:
+                options = ALPHABETS[nom]
+                generation, evaluation = mesurer_lot(longueur, options, args.nombre, args.repetitions)
+                resultats['performances'][f"L{longueur}/{nom}"] = {
+                    'generer_mot_de_passe': mesurer_unitaire(longueur, options, args.unitaires, args.repetitions),
+                    'generer_plusieurs_mots_de_passe': generation,
+                    'evaluer_force': evaluation
+                }
+        for nom in args.politiques:
+            resultats['performances'][f"pol/{nom}"] = {
+                'PolitiqueMotsDePasse': mesurer_politique(POLITIQUES[nom], args.nombre, args.repetitions)
+            }
+    if not args.sans_qualite:
+        resultats['qualite'] = executer_qualite(args.echantillon, args.echantillon_unitaire)
+    
+    afficher_resultats(resultats, args.alpha)
+    
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+        print(f"Mesures enregistrées dans {args.sortie}")
+    
+    echec = False
+    echecs = echecs_qualite(resultats['qualite'], args.alpha)
+    if echecs:
+        echec = True
+        print(f"\n❌ {len(echecs)} test(s) d'uniformité hors de [{args.alpha:g}, {1 - args.alpha:g}] :")
+        for nom, test, p in echecs:
+            print(f"  - {nom}/{test}: p = {p}")
+    
+    if args.reference:
+        with open(args.reference, 'r', encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        try:
+            regressions = comparer(resultats, reference, args.seuil)
+        except ValueError as erreur:
+            print(f"Erreur : {erreur}")
+            sys.exit(1)
+        if regressions:
+            echec = True
+            print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.seuil:.0%} :")
+            for configuration, fonction, mesure, valeur_reference, valeur, variation in regressions:
+                print(f"  - {configuration}/{fonction} {mesure}: {valeur_reference} -> {valeur} ({variation:+.1%})")
+        else:
+            print(f"\n✅ Aucune régression au-delà de {args.seuil:.0%}")
+    
+    if echec:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    interface_arguments()
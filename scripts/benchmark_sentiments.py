@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Banc d'essai de l'analyseur de sentiments NovaTech
+Ce script génère des témoignages synthétiques reproductibles, mesure le débit
+et la latence de chaque étape de l'analyse, et détecte les régressions par
+rapport à une mesure de référence
+Dernière mise à jour : 17/10/2026
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from analyseur_sentiments import AnalyseurSentiments
+
+# Mots neutres utilisés pour compléter les témoignages synthétiques
+MOTS_NEUTRES = [
+    'le', 'la', 'les', 'un', 'une', 'des', 'site', 'service', 'équipe', 'projet',
+    'application', 'livraison', 'support', 'client', 'est', 'était', 'a', 'été',
+    'nous', 'avons', 'leur', 'avec', 'pour', 'dans', 'sur', 'cette', 'mois',
+    'développement', 'design', 'délai', 'prix', 'contact', 'NovaTech', 'et', 'mais'
+]
+
+PONCTUATION = ['', '', '', ',', '.', '!', '...']
+
+# Scénarios mesurés : nombre de mots par texte et densités de négation/intensité
+SCENARIOS = {
+    'court': {'mots_min': 5, 'mots_max': 15, 'negation': 0.05, 'intensite': 0.05},
+    'long': {'mots_min': 60, 'mots_max': 150, 'negation': 0.05, 'intensite': 0.05},
+    'negations': {'mots_min': 10, 'mots_max': 30, 'negation': 0.30, 'intensite': 0.05},
+    'intensificateurs': {'mots_min': 10, 'mots_max': 30, 'negation': 0.05, 'intensite': 0.30}
+}
+
+# Proportion de mots porteurs de sentiment dans un témoignage
+DENSITE_SENTIMENT = 0.2
+
+def generer_corpus(analyseur, nb_textes, mots_min, mots_max, negation, intensite, graine=42):
+    """
+    Génère des témoignages français synthétiques et reproductibles
+    
+    Args:
+        analyseur (AnalyseurSentiments): Analyseur dont les lexiques sont utilisés
+        nb_textes (int): Nombre de témoignages
+        mots_min (int): Nombre minimal de mots par témoignage
+        mots_max (int): Nombre maximal de mots par témoignage
+        negation (float): Probabilité de placer une négation avant un mot
+        intensite (float): Probabilité de placer un intensificateur avant un mot
+        graine (int): Graine du générateur aléatoire
+    
+    Returns:
+        list: Témoignages générés
+    """
+    generateur = random.Random(graine)
+    sentiments = sorted(analyseur.mots_positifs) + sorted(analyseur.mots_negatifs)
+    negations = sorted(analyseur.negations)
+    intensificateurs = sorted(analyseur.intensificateurs)
+    
+    textes = []
+    for _ in range(nb_textes):
+        mots = []
+        for _ in range(generateur.randint(mots_min, mots_max)):
+            if generateur.random() < negation:
+                mots.append(generateur.choice(negations))
+            if generateur.random() < intensite:
+                mots.append(generateur.choice(intensificateurs))
+            if generateur.random() < DENSITE_SENTIMENT:
+                mot = generateur.choice(sentiments)
+            else:
+                mot = generateur.choice(MOTS_NEUTRES)
+            mots.append(mot + generateur.choice(PONCTUATION))
+        texte = ' '.join(mots)
+        textes.append(texte[0].upper() + texte[1:])
+    return textes
+
+def percentile(valeurs, rang):
+    """
+    Calcule un percentile d'une liste de valeurs triées
+    
+    Args:
+        valeurs (list): Valeurs triées
+        rang (float): Percentile voulu (0-100)
+    
+    Returns:
+        float: Valeur du percentile
+    """
+    if not valeurs:
+        return 0
+    return valeurs[min(len(valeurs) - 1, int(len(valeurs) * rang / 100))]
+
+def mesurer(fonction, textes, nb_mots, repetitions):
+    """
+    Mesure le débit d'une fonction appliquée texte par texte
+    
+    Le meilleur des essais est retenu pour limiter le bruit de la machine.
+    
+    Args:
+        fonction (callable): Fonction texte -> résultat
+        textes (list): Textes à traiter
+        nb_mots (int): Nombre total de mots des textes
+        repetitions (int): Nombre d'essais
+    
+    Returns:
+        dict: Débit (textes/s, mots/s) et latences par texte (µs)
+    """
+    meilleure = None
+    latences = []
+    for _ in range(repetitions):
+        horloge = time.perf_counter
+        latences_essai = []
+        debut = horloge()
+        for texte in textes:
+            t0 = horloge()
+            fonction(texte)
+            latences_essai.append(horloge() - t0)
+        duree = horloge() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+            latences = latences_essai
+    
+    latences.sort()
+    return {
+        'duree_s': round(meilleure, 6),
+        'textes_s': round(len(textes) / meilleure, 1),
+        'mots_s': round(nb_mots / meilleure, 1),
+        'latence_p50_us': round(percentile(latences, 50) * 1e6, 2),
+        'latence_p90_us': round(percentile(latences, 90) * 1e6, 2),
+        'latence_p99_us': round(percentile(latences, 99) * 1e6, 2)
+    }
+
+def mesurer_lot(analyseur, textes, nb_mots, repetitions):
+    """
+    Mesure le débit de l'analyse par lot (analyser_lot)
+    
+    Args:
+        analyseur (AnalyseurSentiments): Analyseur à mesurer
+        textes (list): Textes à traiter
+        nb_mots (int): Nombre total de mots des textes
+        repetitions (int): Nombre d'essais
+    
+    Returns:
+        dict: Débit en textes/s et mots/s
+    """
+    meilleure = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        analyseur.analyser_lot(textes)
+        duree = time.perf_counter() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+    return {
+        'duree_s': round(meilleure, 6),
+        'textes_s': round(len(textes) / meilleure, 1),
+        'mots_s': round(nb_mots / meilleure, 1)
+    }
+
+def mesurer_memoire(fonction, textes):
+    """
+    Mesure le pic de mémoire Python alloué pendant le traitement des textes
+    
+    Args:
+        fonction (callable): Fonction texte -> résultat
+        textes (list): Textes à traiter
+    
+    Returns:
+        float: Pic de mémoire en kio
+    """
+    tracemalloc.start()
+    for texte in textes:
+        fonction(texte)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(pic / 1024, 1)
+
+def executer_scenario(analyseur, parametres, nb_textes, repetitions, graine):
+    """
+    Mesure toutes les étapes de l'analyse pour un scénario
+    
+    Args:
+        analyseur (AnalyseurSentiments): Analyseur à mesurer
+        parametres (dict): Paramètres de génération du corpus
+        nb_textes (int): Nombre de témoignages
+        repetitions (int): Nombre d'essais par mesure
+        graine (int): Graine du générateur aléatoire
+    
+    Returns:
+        dict: Mesures par étape
+    """
+    textes = generer_corpus(analyseur, nb_textes, graine=graine, **parametres)
+    nb_mots = sum(len(analyseur.preprocess_texte(texte)) for texte in textes)
+    
+    # analyser_contexte modifie ses entrées : chaque essai repart de listes neuves
+    pretraites = [analyseur.preprocess_texte(texte) for texte in textes]
+    meilleure = None
+    for _ in range(repetitions):
+        copies = [[dict(mot) for mot in mots] for mots in pretraites]
+        debut = time.perf_counter()
+        for mots in copies:
+            analyseur.analyser_contexte(mots)
+        duree = time.perf_counter() - debut
+        if meilleure is None or duree < meilleure:
+            meilleure = duree
+    
+    etapes = {
+        'preprocess_texte': mesurer(analyseur.preprocess_texte, textes, nb_mots, repetitions),
+        'analyser_contexte': {
+            'duree_s': round(meilleure, 6),
+            'textes_s': round(len(textes) / meilleure, 1),
+            'mots_s': round(nb_mots / meilleure, 1)
+        },
+        'analyser_texte': mesurer(analyseur.analyser_texte, textes, nb_mots, repetitions),
+        'analyser_texte_rapide': mesurer(analyseur.analyser_texte_rapide, textes, nb_mots, repetitions),
+        'analyser_lot': mesurer_lot(analyseur, textes, nb_mots, repetitions)
+    }
+    etapes['analyser_texte']['memoire_pic_kio'] = mesurer_memoire(analyseur.analyser_texte, textes)
+    etapes['analyser_texte_rapide']['memoire_pic_kio'] = mesurer_memoire(
+        analyseur.analyser_texte_rapide, textes)
+    
+    return {
+        'parametres': parametres,
+        'textes': nb_textes,
+        'mots': nb_mots,
+        'etapes': etapes
+    }
+
+def comparer(resultats, reference, seuil):
+    """
+    Compare les débits mesurés à ceux d'une mesure de référence
+    
+    Args:
+        resultats (dict): Mesures courantes
+        reference (dict): Mesures de référence
+        seuil (float): Baisse relative tolérée (0.10 = 10 %)
+    
+    Returns:
+        list: Régressions détectées (scénario, étape, débit de référence,
+            débit mesuré, variation)
+    """
+    regressions = []
+    for nom, scenario in resultats['scenarios'].items():
+        scenario_reference = reference.get('scenarios', {}).get(nom)
+        if not scenario_reference:
+            continue
+        for etape, mesures in scenario['etapes'].items():
+            mesures_reference = scenario_reference['etapes'].get(etape)
+            if not mesures_reference:
+                continue
+            debit, debit_reference = mesures['textes_s'], mesures_reference['textes_s']
+            variation = (debit - debit_reference) / debit_reference
+            if variation < -seuil:
+                regressions.append((nom, etape, debit_reference, debit, variation))
+    return regressions
+
+def afficher_resultats(resultats):
+    """
+    Affiche un résumé lisible des mesures
+    
+    Args:
+        resultats (dict): Mesures du banc d'essai
+    """
+    print("\n" + "="*78)
+    print("BANC D'ESSAI DE L'ANALYSEUR DE SENTIMENTS".center(78))
+    print("="*78)
+    for nom, scenario in resultats['scenarios'].items():
+        print(f"\nScénario '{nom}' ({scenario['textes']} textes, {scenario['mots']} mots)")
+        print(f"  {'Étape':<24}{'textes/s':>14}{'mots/s':>14}{'p50 µs':>12}{'p99 µs':>12}")
+        for etape, mesures in scenario['etapes'].items():
+            p50 = mesures.get('latence_p50_us', '-')
+            p99 = mesures.get('latence_p99_us', '-')
+            print(f"  {etape:<24}{mesures['textes_s']:>14}{mesures['mots_s']:>14}{p50:>12}{p99:>12}")
+    print("="*78)
+
+def interface_arguments():
+    """
+    Interface en ligne de commande avec arguments
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'analyseur de sentiments NovaTech")
+    parser.add_argument("-n", "--textes", type=int, default=2000, help="Nombre de textes par scénario")
+    parser.add_argument("-r", "--repetitions", type=int, default=3, help="Nombre d'essais par mesure")
+    parser.add_argument("-g", "--graine", type=int, default=42, help="Graine du corpus synthétique")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS),
+                        help="Scénarios à exécuter")
+    parser.add_argument("-o", "--sortie", help="Fichier JSON où écrire les mesures")
+    parser.add_argument("--reference", help="Fichier JSON de référence pour détecter les régressions")
+    parser.add_argument("--seuil", type=float, default=0.10,
+                        help="Baisse de débit tolérée par rapport à la référence (défaut: 0.10)")
+    
+    args = parser.parse_args()
+    
+    if args.textes < 1 or args.repetitions < 1:
+        print("Erreur : Le nombre de textes et de répétitions doit être au moins 1")
+        sys.exit(1)
+    
+    analyseur = AnalyseurSentiments()
+    resultats = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'graine': args.graine,
+        'scenarios': {}
+    }
+    for nom in args.scenarios:
+        resultats['scenarios'][nom] = executer_scenario(
+            analyseur, SCENARIOS[nom], args.textes, args.repetitions, args.graine)
+    
+    afficher_resultats(resultats)
+    
+    if args.sortie:
+        with open(args.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+        print(f"Mesures enregistrées dans {args.sortie}")
+    
+    if args.reference:
+        with open(args.reference, 'r', encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        regressions = comparer(resultats, reference, args.seuil)
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.seuil:.0%} :")
+            for nom, etape, debit_reference, debit, variation in regressions:
+                print(f"  - {nom}/{etape}: {debit_reference} -> {debit} textes/s ({variation:+.1%})")
+            sys.exit(1)
+        print(f"\n✅ Aucune régression au-delà de {args.seuil:.0%}")
+
+if __name__ == '__main__':
+    interface_arguments()
@@ -7,6 +7,22 @@ Ce script calcule le prix d'un projet digital en fonction de ses caractéristiqu
 Dernière mise à jour : 15/06/2023
 """
 
+from itertools import chain, repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : calculer_prix_projets bascule sur calculer_prix_projet
+    np = None
+
+# Prix de base selon le type de projet
+PRIX_BASE = {
+    'website': 1500,
+    'ecommerce': 3500,
+    'webapp': 5000,
+    'mobile': 8500,
+    'desktop': 7000
+}
+
 def calculer_prix_projet(type_projet, nb_pages, design, fonctionnalites, seo):
     """
     Calcule le prix total d'un projet digital
@@ -21,21 +37,12 @@ def calculer_prix_projet(type_projet, nb_pages, design, fonctionnalites, seo):
     Returns:
         float: Prix total du projet
     """
-    # Prix de base selon le type de projet
-    prix_base = {
-        'website': 1500,
-        'ecommerce': 3500,
-        'webapp': 5000,
-        'mobile': 8500,
-        'desktop': 7000
-    }
-    
     # Vérification du type de projet
-    if type_projet not in prix_base:
+    if type_projet not in PRIX_BASE:
         raise ValueError("Type de projet non reconnu. Choisissez parmi: website, ecommerce, webapp, mobile, desktop")
     
     # Calcul du prix total
-    total = prix_base.get(type_projet, 0)
+    total = PRIX_BASE[type_projet]
     total += nb_pages * 100  # 100€ par page
     total += (design - 1) * 500  # Supplément design
     total += sum(fonctionnalites)  # Fonctionnalités supplémentaires
@@ -49,6 +56,64 @@ def calculer_prix_projet(type_projet, nb_pages, design, fonctionnalites, seo):
     
     return round(total, 2)
 
+def calculer_prix_projets(types_projet, nb_pages, design, fonctionnalites, seo):
+    """
+    Calcule le prix total d'un lot de projets avec des opérations vectorisées NumPy
+    
+    Les paramètres sont des colonnes : le i-ème élément de chacune décrit le
+    i-ème projet. Les additions et les remises sont faites dans le même ordre
+    que calculer_prix_projet, si bien que les prix sont identiques au centime
+    près. Sans NumPy, les projets sont calculés un par un avec
+    calculer_prix_projet.
+    
+    Args:
+        types_projet (list): Types de projet (website, ecommerce, webapp, mobile, desktop)
+        nb_pages (list): Nombre de pages de chaque projet
+        design (list): Niveau de design de chaque projet
+        fonctionnalites (list): Liste des fonctionnalités supplémentaires de chaque projet
+        seo (list): Option SEO de chaque projet
+    
+    Returns:
+        numpy.ndarray: Prix total de chaque projet (list sans NumPy)
+    """
+    if np is None:
+        return list(map(calculer_prix_projet, types_projet, nb_pages, design, fonctionnalites, seo))
+    
+    prix_base = np.fromiter(map(PRIX_BASE.get, types_projet, repeat(-1)), dtype=np.float64)
+    if (prix_base < 0).any():
+        raise ValueError("Type de projet non reconnu. Choisissez parmi: website, ecommerce, webapp, mobile, desktop")
+    nb_projets = len(prix_base)
+    
+    colonnes = [np.asarray(colonne, dtype=np.float64) for colonne in (nb_pages, design, seo)]
+    if any(colonne.shape != (nb_projets,) for colonne in colonnes) or len(fonctionnalites) != nb_projets:
+        raise ValueError("Toutes les colonnes doivent avoir un élément par projet")
+    nb_pages, design, seo = colonnes
+    
+    # Somme des fonctionnalités de chaque projet ; bincount additionne dans
+    # l'ordre des listes, comme sum() dans calculer_prix_projet
+    nb_fonctionnalites = np.fromiter(map(len, fonctionnalites), dtype=np.int64, count=nb_projets)
+    prix_fonctionnalites = np.fromiter(chain.from_iterable(fonctionnalites), dtype=np.float64)
+    total_fonctionnalites = np.bincount(np.repeat(np.arange(nb_projets), nb_fonctionnalites),
+                                        weights=prix_fonctionnalites, minlength=nb_projets)
+    
+    # Calcul du prix total
+    total = prix_base
+    total += nb_pages * 100  # 100€ par page
+    total += (design - 1) * 500  # Supplément design
+    total += total_fonctionnalites  # Fonctionnalités supplémentaires
+    total += seo  # Option SEO
+    
+    # Application des remises pour les gros projets
+    total = np.where(total > 10000, total * 0.9, np.where(total > 5000, total * 0.95, total))
+    
+    # np.round arrondit total * 100 : il ne diffère de round() qu'autour
+    # d'un demi-centime, où le prix est arrondi comme dans calculer_prix_projet
+    prix = np.round(total, 2)
+    centimes = total * 100
+    douteux = np.flatnonzero(np.abs(centimes - np.floor(centimes) - 0.5) < 1e-6)
+    prix[douteux] = [round(valeur, 2) for valeur in total[douteux].tolist()]
+    return prix
+
 def afficher_devis(type_projet, nb_pages, design, fonctionnalites, seo, total):
     """
     Affiche un devis formaté
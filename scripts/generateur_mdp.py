@@ -11,36 +11,184 @@ import random
 import string
 import secrets
 import argparse
+import base64
+import csv
+import hashlib
+import hmac
+import heapq
+import itertools
+import math
+import mmap
+import os
+import re
+import struct
 import sys
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
-def generer_mot_de_passe(longueur=12, majuscules=True, chiffres=True, symboles=True):
+# Taille (en octets) des blocs aléatoires tirés par la génération en masse
+TAILLE_BLOC_ALEATOIRE = 64 * 1024
+
+# Nombre de mots de passe écrits d'un coup sur la sortie en mode silencieux
+TAILLE_LOT_SORTIE = 4096
+
+# Nombre de mots de passe générés par tâche envoyée à un processus
+TAILLE_LOT_WORKER = 20000
+
+# Nombre de comptes provisionnés par tâche envoyée à un processus (le
+# hachage domine : quelques dizaines de millisecondes par compte)
+TAILLE_LOT_PROVISION = 64
+
+# Paramètres par défaut des fonctions de dérivation du provisionnement
+# (scrypt : 16 Mio de mémoire par empreinte ; PBKDF2 : recommandation OWASP)
+PARAMETRES_KDF = {
+    'scrypt': {'n': 2 ** 14, 'r': 8, 'p': 1},
+    'pbkdf2_sha256': {'iterations': 600000}
+}
+TAILLE_SEL = 16
+TAILLE_EMPREINTE = 32
+
+# Classes de caractères évaluées par evaluer_force : chaque caractère ASCII
+# d'une classe est remplacé par un code de contrôle, les autres sont retirés
+CLASSES_CARACTERES = (
+    ('has_upper', 'majuscules', string.ascii_uppercase),
+    ('has_lower', 'minuscules', string.ascii_lowercase),
+    ('has_digit', 'chiffres', string.digits),
+    ('has_symbol', 'symboles', string.punctuation)
+)
+_CODES_CLASSES = ('\x01', '\x02', '\x03', '\x04')
+_TABLE_CLASSES = {code: None for code in range(128)}
+for _code, (_, _, _caracteres) in zip(_CODES_CLASSES, CLASSES_CARACTERES):
+    _TABLE_CLASSES.update({ord(c): _code for c in _caracteres})
+
+# Proportion de mots libres conformes au-delà de laquelle PolitiqueMotsDePasse
+# tire des mots libres et écarte ceux qui ne respectent pas la politique (en
+# dessous, tirer un rang et construire le mot est plus rapide)
+TAUX_CONFORMES_REJET = 0.05
+
+# Caractères faciles à confondre à la lecture, exclus par sans_ambigus
+CARACTERES_AMBIGUS = "0O1lI|`'\""
+
+# Niveaux de force, du plus faible au plus fort
+NIVEAUX_FORCE = ("Faible", "Moyen", "Fort", "Très fort")
+
+# Index compilé des mots de passe compromis : en-tête (magique, nombre
+# d'empreintes, position de la table des préfixes), empreintes 64 bits
+# triées, puis table des positions par préfixe de BITS_PREFIXE_INDEX bits
+MAGIQUE_INDEX = b'NTMDP\x00\x01\x00'
+_ENTETE_INDEX = struct.Struct('<8sQQ')
+BITS_PREFIXE_INDEX = 16
+TAILLE_TABLE_PREFIXES = 1 << BITS_PREFIXE_INDEX
+
+# Nombre d'empreintes triées en mémoire à la fois lors de la compilation
+TAILLE_SERIE_INDEX = 2000000
+
+# Mots et mots de passe les plus courants (français et anglais), du plus
+# fréquent au moins fréquent : le rang sert d'estimation du nombre d'essais
+MOTS_COURANTS = (
+    "password", "123456", "azerty", "qwerty", "motdepasse", "admin", "iloveyou",
+    "soleil", "bonjour", "welcome", "letmein", "monkey", "dragon", "football",
+    "marseille", "doudou", "loulou", "chouchou", "princesse", "jetaime",
+    "master", "sunshine", "shadow", "baseball", "superman", "batman", "michael",
+    "jordan", "pokemon", "nicolas", "thomas", "julien", "camille", "marie",
+    "chocolat", "coucou", "secret", "liverpool", "arsenal", "chelsea", "paris",
+    "france", "amour", "bonheur", "papa", "maman", "bebe", "chat", "chien",
+    "hello", "love", "freedom", "whatever", "trustno1", "access", "computer",
+    "internet", "google", "samsung", "apple", "charlie", "pepper", "ginger",
+    "hunter", "killer", "ninja", "mustang", "starwars", "matrix", "orange",
+    "banane", "fraise", "cheval", "lapin", "tigre", "lion", "etoile", "lune",
+    "printemps", "hiver", "summer", "winter", "spring", "autumn", "novatech",
+    "test", "demo", "guest", "root", "user", "login", "pass", "changeme",
+    "default", "manager", "office", "service", "societe", "entreprise",
+    "bienvenue", "salut", "merci", "maison", "voiture", "vacances", "famille",
+    "mickey", "minnie", "barbie", "titi", "toto", "tata", "dieu", "jesus",
+    "angel", "ange", "diamond", "money", "argent", "flower", "fleur", "blue",
+    "bleu", "rouge", "noir", "black", "white", "blanc", "green", "vert"
+)
+RANGS_MOTS_COURANTS = {mot: rang for rang, mot in enumerate(MOTS_COURANTS, 1)}
+LONGUEUR_MAX_MOT = max(len(mot) for mot in MOTS_COURANTS)
+
+# Substitutions du leet speak, ramenées à la lettre d'origine
+_SUBSTITUTIONS_LEET = {'@': 'a', '4': 'a', '3': 'e', '1': 'i', '!': 'i', '0': 'o',
+                       '$': 's', '5': 's', '7': 't', '+': 't'}
+_TABLE_LEET = str.maketrans(_SUBSTITUTIONS_LEET)
+
+# Mots courants et mots à l'envers, sans leet speak comme les mots de passe
+# analysés ("123456" et "trustno1" compris) -> (rang, bit d'inversion, mot) ;
+# les préfixes de trois lettres écartent d'emblée la plupart des positions
+_MOTS_CONNUS = {mot[::-1].translate(_TABLE_LEET): (rang, 1, mot[::-1])
+                for mot, rang in RANGS_MOTS_COURANTS.items()}
+_MOTS_CONNUS.update((mot.translate(_TABLE_LEET), (rang, 0, mot))
+                    for mot, rang in RANGS_MOTS_COURANTS.items())
+_PREFIXES_MOTS = {mot[:3] for mot in _MOTS_CONNUS}
+
+_RE_REPETITION = re.compile(r'(.+?)\1+', re.DOTALL)
+_RE_ANNEE = re.compile(r'19\d\d|20\d\d')
+
+# Nombre de caractères dans lesquels les motifs sont cherchés (la recherche
+# des répétitions est quadratique) ; les suivants comptent comme isolés
+LONGUEUR_MAX_MOTIFS = 256
+
+# Nombre moyen de touches voisines sur un clavier (coût d'un changement de direction)
+DEGRE_MOYEN_CLAVIER = 6
+
+# Essais par seconde d'une attaque hors ligne sur une empreinte rapide
+ESSAIS_PAR_SECONDE = 1e10
+
+# Seuils d'entropie (en bits) des niveaux Moyen, Fort et Très fort
+SEUILS_ENTROPIE = (36, 60, 80)
+
+# Liste de mots compilée pour les phrases de passe : en-tête (magique,
+# nombre de mots, position de la table), mots UTF-8 accolés, puis table
+# des positions de chaque mot (entiers 32 bits)
+MAGIQUE_MOTS = b'NTMOTS\x00\x01'
+_ENTETE_MOTS = struct.Struct('<8sQQ')
+
+# Liste de mots livrée avec le script (français et anglais), compilée dans
+# REPERTOIRE_CACHE à la première utilisation : rien n'est écrit à côté du
+# script, qui peut être installé en lecture seule
+SOURCE_LISTE_MOTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mots_phrases.txt')
+REPERTOIRE_CACHE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                'novatech')
+
+# Mise en majuscules des mots d'une phrase de passe
+CAPITALES_PHRASE = ('aucune', 'initiale', 'aleatoire')
+
+def construire_alphabet(majuscules=True, chiffres=True, symboles=True):
     """
-    Génère un mot de passe sécurisé avec les critères spécifiés
+    Construit l'alphabet correspondant aux critères choisis
     
     Args:
-        longueur (int): Longueur du mot de passe (8-64)
         majuscules (bool): Inclure des lettres majuscules
         chiffres (bool): Inclure des chiffres
         symboles (bool): Inclure des symboles
     
     Returns:
-        str: Mot de passe généré
+        str: Caractères autorisés (minuscules toujours incluses)
     """
-    # Caractères de base (minuscules)
     caracteres = string.ascii_lowercase
-    
-    # Ajout des majuscules si demandé
     if majuscules:
         caracteres += string.ascii_uppercase
-    
-    # Ajout des chiffres si demandé
     if chiffres:
         caracteres += string.digits
-    
-    # Ajout des symboles si demandé
     if symboles:
         caracteres += string.punctuation
+    return caracteres
+
+def ajuster_longueur(longueur):
+    """
+    Ramène la longueur demandée entre 8 et 64 caractères en prévenant l'utilisateur
+    
+    Args:
+        longueur (int): Longueur demandée
     
+    Returns:
+        int: Longueur utilisable
+    """
     # Vérification de la longueur minimale
     if longueur < 8:
         print("⚠️  Attention : Un mot de passe de moins de 8 caractères n'est pas sécurisé !")
@@ -53,6 +201,611 @@ def generer_mot_de_passe(longueur=12, majuscules=True, chiffres=True, symboles=T
         print("   La longueur a été automatiquement ajustée à 64 caractères.")
         longueur = 64
     
+    return longueur
+
+class GenerateurMotsDePasse:
+    """
+    Générateur de mots de passe en masse
+    
+    L'alphabet est construit une seule fois et l'aléa est tiré de
+    os.urandom par blocs de TAILLE_BLOC_ALEATOIRE octets. Chaque octet est
+    converti en caractère par échantillonnage avec rejet : seuls les octets
+    inférieurs au plus grand multiple de la taille de l'alphabet sont gardés
+    (octet % taille), ce qui donne des caractères uniformes et indépendants.
+    La conversion et le rejet d'un bloc entier se font en une seule opération
+    bytes.translate.
+    
+    Args:
+        longueur (int): Longueur des mots de passe (8-64)
+        majuscules (bool): Inclure des lettres majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        taille_bloc (int): Nombre d'octets aléatoires tirés à la fois
+        alphabet (str): Alphabet ASCII imposé (remplace les trois options
+            précédentes)
+    """
+
+    def __init__(self, longueur=12, majuscules=True, chiffres=True, symboles=True,
+                 taille_bloc=TAILLE_BLOC_ALEATOIRE, alphabet=None):
+        if not 8 <= longueur <= 64:
+            raise ValueError("La longueur doit être entre 8 et 64 caractères")
+        self.longueur = longueur
+        self.alphabet = alphabet or construire_alphabet(majuscules, chiffres, symboles)
+        self.taille_bloc = taille_bloc
+        self._octets_tires = 0
+        
+        # Octet -> caractère pour les octets acceptés ; les autres sont supprimés
+        taille = len(self.alphabet)
+        limite = 256 - 256 % taille
+        self._table = bytes(ord(self.alphabet[octet % taille]) if octet < limite else 0
+                            for octet in range(256))
+        self._rejets = bytes(range(limite, 256))
+        self._reserve = ''
+        self._dernier_bloc = b''
+
+    @property
+    def octets_consommes(self):
+        """
+        Octets aléatoires utilisés depuis la création
+        
+        Les octets tirés de os.urandom dont les caractères attendent encore
+        dans la réserve ne sont pas comptés : ils serviront aux prochains
+        mots de passe.
+        """
+        attente = len(self._reserve)
+        non_lus = attente
+        # La réserve provient de la fin du dernier bloc ; les octets rejetés
+        # qui s'y intercalent sont ajoutés jusqu'à retrouver ses caractères
+        while non_lus:
+            manquants = attente - len(self._dernier_bloc[-non_lus:].translate(None, self._rejets))
+            if not manquants:
+                break
+            non_lus += manquants
+        return self._octets_tires - non_lus
+
+    def _caracteres(self, nombre):
+        """
+        Tire au moins nombre caractères uniformes de l'alphabet
+        
+        Args:
+            nombre (int): Nombre minimal de caractères à produire
+        
+        Returns:
+            str: Caractères tirés, réserve des tirages précédents comprise
+        """
+        morceaux = [self._reserve]
+        disponibles = len(self._reserve)
+        while disponibles < nombre:
+            bloc = os.urandom(self.taille_bloc)
+            self._octets_tires += len(bloc)
+            self._dernier_bloc = bloc
+            caracteres = bloc.translate(self._table, self._rejets).decode('ascii')
+            morceaux.append(caracteres)
+            disponibles += len(caracteres)
+        return ''.join(morceaux)
+
+    def _iter_blocs(self, nombre=None):
+        """
+        Produit les mots de passe par blocs, mis bout à bout
+        
+        Args:
+            nombre (int): Nombre de mots de passe (None : sans limite)
+        
+        Yields:
+            str: Caractères d'un nombre entier de mots de passe
+        """
+        longueur = self.longueur
+        restants = nombre
+        while restants is None or restants > 0:
+            # Un bloc aléatoire fournit plusieurs milliers de mots de passe
+            a_produire = self.taille_bloc // longueur if restants is None \
+                else min(restants, max(1, self.taille_bloc // longueur))
+            caracteres = self._caracteres(a_produire * longueur)
+            fin = a_produire * longueur
+            self._reserve = caracteres[fin:]
+            yield caracteres[:fin]
+            if restants is not None:
+                restants -= a_produire
+
+    def iter_mots_de_passe(self, nombre=None):
+        """
+        Produit des mots de passe au fil des tirages
+        
+        Args:
+            nombre (int): Nombre de mots de passe (None : sans limite)
+        
+        Yields:
+            str: Mot de passe généré
+        """
+        longueur = self.longueur
+        for bloc in self._iter_blocs(nombre):
+            for debut in range(0, len(bloc), longueur):
+                yield bloc[debut:debut + longueur]
+
+    def generer(self, nombre):
+        """
+        Génère une liste de mots de passe
+        
+        Args:
+            nombre (int): Nombre de mots de passe à générer
+        
+        Returns:
+            list: Mots de passe générés
+        """
+        return list(self.iter_mots_de_passe(nombre))
+
+class PolitiqueMotsDePasse:
+    """
+    Politique de composition des mots de passe et générateur conforme
+    
+    Une politique fixe la longueur, les classes de caractères utilisées, un
+    minimum de caractères par classe, des caractères exclus et le nombre
+    maximal de caractères identiques consécutifs.
+    
+    Les mots de passe conformes sont dénombrés une fois pour toutes par
+    programmation dynamique (voir _denombrer). Lorsqu'au moins
+    TAUX_CONFORMES_REJET des mots libres sont conformes, iter_mots_de_passe
+    tire des mots libres en masse comme GenerateurMotsDePasse et écarte
+    ceux qui ne respectent pas la politique : un mot libre uniforme
+    conditionné à la conformité est uniforme sur les mots conformes, et le
+    débit reste proche de celui de la génération libre.
+    
+    Sinon, chaque mot de passe est le mot conforme de rang n, pour un entier
+    n uniforme tiré en une fois (mot_de_rang) : le résultat est aussi
+    uniforme, sans boucle de génération puis vérification. Le seul rejet
+    porte sur le tirage de n (probabilité inférieure à 1/256). Ce chemin
+    construit le mot en Python bloc par bloc : il reste 10 à 100 fois plus
+    lent que la génération libre (quelques dizaines de milliers de mots de
+    passe par seconde, moins aux grandes longueurs avec beaucoup de
+    minimums) ; benchmark_mdp.py mesure les deux chemins.
+    
+    Args:
+        longueur (int): Longueur des mots de passe (8-64)
+        majuscules (bool): Inclure des lettres majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        minimums (dict): Nombre minimal de caractères par classe
+            (majuscules, minuscules, chiffres, symboles)
+        exclus (str): Caractères à ne jamais utiliser
+        sans_ambigus (bool): Exclure aussi CARACTERES_AMBIGUS
+        max_repetitions (int): Nombre maximal de caractères identiques
+            consécutifs (None : pas de limite)
+        taille_bloc (int): Nombre d'octets aléatoires tirés à la fois
+    """
+
+    def __init__(self, longueur=12, majuscules=True, chiffres=True, symboles=True, minimums=None,
+                 exclus='', sans_ambigus=False, max_repetitions=None, taille_bloc=TAILLE_BLOC_ALEATOIRE):
+        if not 8 <= longueur <= 64:
+            raise ValueError("La longueur doit être entre 8 et 64 caractères")
+        if max_repetitions is not None and max_repetitions < 1:
+            raise ValueError("Le nombre maximal de répétitions doit être au moins 1")
+        minimums = dict(minimums or {})
+        actives = {'majuscules': majuscules, 'minuscules': True, 'chiffres': chiffres, 'symboles': symboles}
+        inconnues = set(minimums) - set(actives)
+        if inconnues:
+            raise ValueError(f"Classes inconnues : {', '.join(sorted(inconnues))}")
+        self._parametres = (longueur, majuscules, chiffres, symboles, minimums,
+                            exclus, sans_ambigus, max_repetitions, taille_bloc)
+        
+        # Classes utilisables une fois les exclusions retirées
+        exclus = set(exclus) | (set(CARACTERES_AMBIGUS) if sans_ambigus else set())
+        self.classes = []
+        besoins = []
+        for _, nom, caracteres in CLASSES_CARACTERES:
+            minimum = minimums.get(nom, 0)
+            if minimum < 0:
+                raise ValueError(f"Le minimum de {nom} ne peut pas être négatif")
+            caracteres = ''.join(c for c in caracteres if c not in exclus) if actives[nom] else ''
+            if not caracteres:
+                if minimum:
+                    raise ValueError(f"Au moins {minimum} {nom} exigé(s), mais la classe est exclue")
+                continue
+            self.classes.append((nom, caracteres))
+            besoins.append(minimum)
+        if sum(besoins) > longueur:
+            raise ValueError(f"Les minimums ({sum(besoins)} caractères) dépassent la longueur ({longueur})")
+        
+        self.longueur = longueur
+        self.max_repetitions = max_repetitions
+        self.alphabet = ''.join(caracteres for _, caracteres in self.classes)
+        self._tailles = [len(caracteres) for _, caracteres in self.classes]
+        self._rangs = {c: rang for _, caracteres in self.classes for rang, c in enumerate(caracteres)}
+        self._besoins = besoins
+        self.nombre_valides = self._denombrer()
+        if not self.nombre_valides:
+            raise ValueError("Aucun mot de passe ne respecte cette politique")
+        
+        # Sans minimum ni règle de répétition, seules des exclusions
+        # s'appliquent : le générateur en masse suffit
+        self._libre = None
+        self._rejet = None
+        if max_repetitions is None and not any(besoins):
+            self._libre = GenerateurMotsDePasse(longueur, taille_bloc=taille_bloc, alphabet=self.alphabet)
+        elif self.nombre_valides / len(self.alphabet) ** longueur >= TAUX_CONFORMES_REJET:
+            # Assez de mots libres sont conformes : des mots libres sont tirés
+            # en masse et les autres écartés. Octet d'un caractère -> classe
+            self._rejet = GenerateurMotsDePasse(longueur, taille_bloc=taille_bloc, alphabet=self.alphabet)
+            table = bytearray(256)
+            for classe, (_, caracteres) in enumerate(self.classes):
+                for c in caracteres:
+                    table[ord(c)] = classe
+            self._table_classes = bytes(table)
+            self._exigences = [(classe, besoin) for classe, besoin in enumerate(besoins) if besoin]
+        if self._libre is not None or self._rejet is not None:
+            # Tables reconstruites par mot_de_rang si on la sollicite
+            self._fins = self._blocs = self._debuts = None
+        
+        # Entier uniforme dans [0, nombre_valides) : un octet de plus que
+        # nécessaire, pour que le rejet reste exceptionnel
+        self.taille_bloc = taille_bloc
+        self._taille_rang = (self.nombre_valides.bit_length() + 7) // 8 + 1
+        etendue = 1 << (8 * self._taille_rang)
+        self._limite_rang = etendue - etendue % self.nombre_valides
+        self._octets = b''
+        self._position = 0
+        self._octets_tires = 0
+
+    @property
+    def octets_consommes(self):
+        """Octets aléatoires utilisés depuis la création (hors réserve)"""
+        if self._libre is not None:
+            return self._libre.octets_consommes
+        if self._rejet is not None:
+            return self._rejet.octets_consommes
+        return self._octets_tires - (len(self._octets) - self._position)
+
+    def __reduce__(self):
+        # Les tables de dénombrement sont reconstruites dans les processus du pool
+        return (PolitiqueMotsDePasse, self._parametres)
+
+    def _denombrer(self):
+        """
+        Dénombre les fins de mot de passe conformes depuis chaque état
+        
+        Avec une règle de répétition, un mot de passe est découpé en blocs
+        de caractères identiques (au plus max_repetitions chacun), deux
+        blocs voisins utilisant des caractères différents ; sans règle,
+        chaque caractère est un bloc et aucun caractère n'est exclu. L'état
+        avant un bloc est (caractères restants, minimums restants, classe
+        du caractère du bloc précédent) ; les minimums restants sont
+        numérotés en base mixte. Trois listes plates d'entiers sont
+        remplies, des fins les plus courtes aux plus longues :
+        
+        - _fins : fins conformes dont le premier caractère diffère d'un
+          caractère donné de la classe (dernière classe + 1 : aucun
+          caractère exclu) ;
+        - _blocs : fins conformes commençant par un bloc d'un caractère
+          donné de la classe ;
+        - _debuts : rang de la première fin commençant par un caractère de
+          la classe, parmi les fins sans caractère exclu.
+        
+        Seuls les minimums restants atteignables depuis le départ sont
+        calculés ; les autres cases restent à 0 et ne sont jamais lues.
+        
+        Returns:
+            int: Nombre de mots de passe conformes
+        """
+        besoins = self._besoins
+        tailles = self._tailles
+        longueur = self.longueur
+        repetitions = self.max_repetitions
+        nb_classes = len(tailles)
+        largeur = nb_classes + 1
+        
+        # Numéro des minimums restants, et numéro après un caractère de chaque classe
+        pas = []
+        nb_besoins = 1
+        for besoin in besoins:
+            pas.append(nb_besoins)
+            nb_besoins *= besoin + 1
+        sommes = [0] * nb_besoins
+        moins = [[0] * nb_besoins for _ in tailles]
+        for indice in range(nb_besoins):
+            reste = indice
+            for classe, besoin in enumerate(besoins):
+                reste, valeur = divmod(reste, besoin + 1)
+                sommes[indice] += valeur
+                moins[classe][indice] = indice - pas[classe] if valeur else indice
+        # Numéro après repetitions + 1 caractères de la classe (bloc trop long)
+        loin = []
+        if repetitions is not None:
+            for classe in range(nb_classes):
+                suivants = list(range(nb_besoins))
+                for _ in range(repetitions + 1):
+                    suivants = [moins[classe][indice] for indice in suivants]
+                loin.append(suivants)
+        total = sum(besoins)
+        par_somme = [[] for _ in range(total + 1)]
+        for indice, somme in enumerate(sommes):
+            par_somme[somme].append(indice)
+        
+        fins = [0] * ((longueur + 1) * nb_besoins * largeur)
+        blocs = [0] * ((longueur + 1) * nb_besoins * nb_classes)
+        debuts = [0] * ((longueur + 1) * nb_besoins * nb_classes)
+        fins[:largeur] = [1] * largeur  # Mot de passe terminé, minimums atteints
+        for reste in range(1, longueur + 1):
+            sortie = reste - 1 - (repetitions or longueur)
+            for somme in range(max(0, total - (longueur - reste)), min(total, reste) + 1):
+                for indice in par_somme[somme]:
+                    etat = reste * nb_besoins + indice
+                    cumul = 0
+                    for classe in range(nb_classes):
+                        suivant = (reste - 1) * nb_besoins + moins[classe][indice]
+                        if repetitions is None:
+                            nombre = fins[suivant * largeur + nb_classes]
+                        else:
+                            # Bloc d'un caractère, ou caractère suivi d'un bloc plus court du même
+                            nombre = fins[suivant * largeur + classe] + blocs[suivant * nb_classes + classe]
+                            if sortie >= 0:
+                                nombre -= fins[(sortie * nb_besoins + loin[classe][indice]) * largeur + classe]
+                        blocs[etat * nb_classes + classe] = nombre
+                        debuts[etat * nb_classes + classe] = cumul
+                        cumul += tailles[classe] * nombre
+                    if repetitions is not None:
+                        for classe in range(nb_classes):
+                            fins[etat * largeur + classe] = cumul - blocs[etat * nb_classes + classe]
+                    fins[etat * largeur + nb_classes] = cumul
+        
+        self._nb_besoins = nb_besoins
+        self._moins = moins
+        self._fins = fins
+        self._blocs = blocs
+        self._debuts = debuts
+        return fins[(longueur * nb_besoins + nb_besoins - 1) * largeur + nb_classes]
+
+    def _mots_repetitifs(self, octets):
+        """
+        Repère les mots d'un bloc contenant trop de caractères identiques consécutifs
+        
+        Chaque caractère est comparé au précédent sur tout le bloc à la fois,
+        vu comme un grand entier : l'octet d'un caractère égal au précédent
+        devient 0x80, celui des autres 0. Les séries trop longues sont les
+        octets où max_repetitions égalités consécutives se terminent.
+        
+        Args:
+            octets (bytes): Mots de passe ASCII mis bout à bout
+        
+        Returns:
+            set: Positions de début des mots à écarter
+        """
+        longueur = self.longueur
+        repetitions = self.max_repetitions
+        if repetitions is None or repetitions >= longueur:
+            return set()
+        taille = len(octets)
+        valeur = int.from_bytes(octets, 'big')
+        hauts = int.from_bytes(b'\x80' * taille, 'big')
+        # Les écarts entre octets ASCII sont inférieurs à 0x80 : leur ajouter
+        # 0x7F ne met le bit de poids fort qu'aux octets non nuls, sans retenue
+        egaux = hauts ^ (((valeur ^ (valeur >> 8)) + hauts - (hauts >> 7)) & hauts)
+        series = egaux
+        for decalage in range(1, repetitions):
+            series &= egaux >> (8 * decalage)
+        ecartes = set()
+        if not series:
+            return ecartes
+        series = series.to_bytes(taille, 'big')
+        fin = series.find(0x80)
+        while fin >= 0:
+            # Une série à cheval sur deux mots n'en disqualifie aucun
+            if (fin - repetitions) // longueur == fin // longueur:
+                ecartes.add(fin - fin % longueur)
+            fin = series.find(0x80, fin + 1)
+        return ecartes
+
+    def _iter_rejet(self, nombre):
+        """
+        Produit des mots conformes en écartant les mots libres non conformes
+        
+        Les classes des caractères d'un bloc de tirages sont calculées en
+        une opération bytes.translate, et les séries trop longues repérées
+        sur tout le bloc à la fois (voir _mots_repetitifs).
+        
+        Args:
+            nombre (int): Nombre de mots de passe (None : sans limite)
+        
+        Yields:
+            str: Mot de passe conforme
+        """
+        longueur = self.longueur
+        table = self._table_classes
+        exigences = self._exigences
+        restants = nombre
+        while restants is None or restants > 0:
+            # Un lot un peu plus grand que le besoin compense les mots écartés
+            for bloc in self._rejet._iter_blocs(None if restants is None else restants + restants // 4 + 1):
+                octets = bloc.encode('ascii')
+                classes = octets.translate(table)
+                ecartes = self._mots_repetitifs(octets)
+                for debut in range(0, len(bloc), longueur):
+                    fin = debut + longueur
+                    for classe, minimum in exigences:
+                        if classes.count(classe, debut, fin) < minimum:
+                            break
+                    else:
+                        if debut in ecartes:
+                            continue
+                        yield bloc[debut:fin]
+                        if restants is not None:
+                            restants -= 1
+                            if not restants:
+                                return
+
+    def mot_de_rang(self, rang):
+        """
+        Renvoie le mot de passe conforme de rang donné
+        
+        Le mot est construit bloc par bloc (voir _denombrer) : à chaque
+        bloc, le rang choisit la classe, le caractère puis la longueur du
+        bloc.
+        
+        Args:
+            rang (int): Rang dans [0, nombre_valides)
+        
+        Returns:
+            str: Mot de passe conforme
+        """
+        if self._fins is None:
+            self._denombrer()
+        classes = self.classes
+        rangs = self._rangs
+        repetitions = self.max_repetitions
+        nb_classes = len(classes)
+        largeur = nb_classes + 1
+        nb_besoins = self._nb_besoins
+        moins = self._moins
+        fins = self._fins
+        blocs = self._blocs
+        debuts = self._debuts
+        reste = self.longueur
+        besoins = nb_besoins - 1
+        derniere = nb_classes
+        precedent = None
+        morceaux = []
+        while reste:
+            if besoins == 0 and repetitions is None:
+                # Fin sans contrainte : le rang s'écrit en base len(alphabet)
+                alphabet = self.alphabet
+                taille = len(alphabet)
+                for _ in range(reste):
+                    rang, choix = divmod(rang, taille)
+                    morceaux.append(alphabet[choix])
+                break
+            
+            # Classe et caractère du bloc : le rang saute les fins qui
+            # commenceraient par le caractère précédent
+            base = (reste * nb_besoins + besoins) * nb_classes
+            if precedent is not None:
+                exclues = blocs[base + derniere]
+                if rang >= debuts[base + derniere] + rangs[precedent] * exclues:
+                    rang += exclues
+            classe = bisect_right(debuts, rang, base, base + nb_classes) - base - 1
+            choix, rang = divmod(rang - debuts[base + classe], blocs[base + classe])
+            caractere = classes[classe][1][choix]
+            besoins = moins[classe][besoins]
+            if repetitions is None:
+                morceaux.append(caractere)
+                reste -= 1
+                continue
+            
+            # Longueur du bloc
+            taille_bloc = 1
+            while True:
+                nombre = fins[((reste - taille_bloc) * nb_besoins + besoins) * largeur + classe]
+                if rang < nombre:
+                    break
+                rang -= nombre
+                taille_bloc += 1
+                besoins = moins[classe][besoins]
+            morceaux.append(caractere * taille_bloc)
+            reste -= taille_bloc
+            derniere = classe
+            precedent = caractere
+        return ''.join(morceaux)
+
+    def _tirer_rang(self):
+        """
+        Tire un rang uniforme dans [0, nombre_valides) depuis os.urandom
+        
+        Returns:
+            int: Rang tiré
+        """
+        taille = self._taille_rang
+        while True:
+            if self._position + taille > len(self._octets):
+                self._octets = os.urandom(max(self.taille_bloc, taille))
+                self._octets_tires += len(self._octets)
+                self._position = 0
+            valeur = int.from_bytes(self._octets[self._position:self._position + taille], 'little')
+            self._position += taille
+            if valeur < self._limite_rang:
+                return valeur % self.nombre_valides
+
+    def entropie(self):
+        """
+        Entropie d'un mot de passe tiré avec cette politique
+        
+        Returns:
+            float: Entropie en bits (log2 du nombre de mots conformes)
+        """
+        return math.log2(self.nombre_valides)
+
+    def est_conforme(self, mot_de_passe):
+        """
+        Vérifie qu'un mot de passe respecte la politique
+        
+        Args:
+            mot_de_passe (str): Mot de passe à vérifier
+        
+        Returns:
+            bool: True si le mot de passe respecte la politique
+        """
+        if len(mot_de_passe) != self.longueur or any(c not in self._rangs for c in mot_de_passe):
+            return False
+        minimums = self._parametres[4]
+        for nom, caracteres in self.classes:
+            if sum(1 for c in mot_de_passe if c in caracteres) < minimums.get(nom, 0):
+                return False
+        if self.max_repetitions is not None:
+            serie = 1
+            for precedent, caractere in zip(mot_de_passe, mot_de_passe[1:]):
+                serie = serie + 1 if caractere == precedent else 1
+                if serie > self.max_repetitions:
+                    return False
+        return True
+
+    def iter_mots_de_passe(self, nombre=None):
+        """
+        Produit des mots de passe conformes
+        
+        Args:
+            nombre (int): Nombre de mots de passe (None : sans limite)
+        
+        Yields:
+            str: Mot de passe conforme
+        """
+        if self._libre is not None:
+            yield from self._libre.iter_mots_de_passe(nombre)
+            return
+        if self._rejet is not None:
+            yield from self._iter_rejet(nombre)
+            return
+        produits = 0
+        while nombre is None or produits < nombre:
+            yield self.mot_de_rang(self._tirer_rang())
+            produits += 1
+
+    def generer(self, nombre):
+        """
+        Génère une liste de mots de passe conformes
+        
+        Args:
+            nombre (int): Nombre de mots de passe à générer
+        
+        Returns:
+            list: Mots de passe générés
+        """
+        return list(self.iter_mots_de_passe(nombre))
+
+def generer_mot_de_passe(longueur=12, majuscules=True, chiffres=True, symboles=True):
+    """
+    Génère un mot de passe sécurisé avec les critères spécifiés
+    
+    Args:
+        longueur (int): Longueur du mot de passe (8-64)
+        majuscules (bool): Inclure des lettres majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+    
+    Returns:
+        str: Mot de passe généré
+    """
+    # Caractères autorisés (minuscules, puis majuscules, chiffres et symboles si demandés)
+    caracteres = construire_alphabet(majuscules, chiffres, symboles)
+    
+    # Vérification de la longueur (8 à 64 caractères)
+    longueur = ajuster_longueur(longueur)
+    
     # Génération du mot de passe avec le module secrets (plus sécurisé que random)
     mot_de_passe = ''.join(secrets.choice(caracteres) for _ in range(longueur))
     
@@ -81,11 +834,12 @@ def evaluer_force(mot_de_passe):
     else:
         recommendations.append("Le mot de passe est trop court (minimum 8 caractères recommandés)")
     
-    # Diversité des caractères
-    has_upper = any(c in string.ascii_uppercase for c in mot_de_passe)
-    has_lower = any(c in string.ascii_lowercase for c in mot_de_passe)
-    has_digit = any(c in string.digits for c in mot_de_passe)
-    has_symbol = any(c in string.punctuation for c in mot_de_passe)
+    # Diversité des caractères : chaque caractère est classé en un seul passage
+    classes = set(mot_de_passe.translate(_TABLE_CLASSES))
+    has_upper = '\x01' in classes
+    has_lower = '\x02' in classes
+    has_digit = '\x03' in classes
+    has_symbol = '\x04' in classes
     
     if has_upper:
         score += 1
@@ -133,13 +887,626 @@ def evaluer_force(mot_de_passe):
         "has_symbol": has_symbol
     }
 
-def afficher_resultat(mot_de_passe, evaluation):
+class IndexFuites:
+    """
+    Index compact de mots de passe compromis, projeté en mémoire
+    
+    Le fichier (voir compiler_index_fuites) contient les empreintes 64 bits
+    triées des mots de passe et une table des positions par préfixe de
+    16 bits. Une recherche lit la table puis fait une recherche dichotomique
+    dans quelques milliers d'empreintes au plus : quelques microsecondes,
+    sans charger le fichier en mémoire (seules les pages lues sont chargées).
+    
+    Args:
+        chemin (str): Chemin de l'index compilé
+    """
+
+    def __init__(self, chemin):
+        if sys.byteorder != 'little':
+            raise ValueError("L'index des mots de passe compromis nécessite une machine little-endian")
+        self.chemin = chemin
+        self._fichier = open(chemin, 'rb')
+        try:
+            self._carte = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Fichier vide
+            self._fichier.close()
+            raise ValueError(f"'{chemin}' n'est pas un index de mots de passe NovaTech")
+        if self._carte[:len(MAGIQUE_INDEX)] != MAGIQUE_INDEX:
+            self.fermer()
+            raise ValueError(f"'{chemin}' n'est pas un index de mots de passe NovaTech")
+        _, self.nombre, offset_table = _ENTETE_INDEX.unpack_from(self._carte, 0)
+        vue = memoryview(self._carte)
+        self._empreintes = vue[_ENTETE_INDEX.size:offset_table].cast('Q')
+        self._table = vue[offset_table:offset_table + (TAILLE_TABLE_PREFIXES + 1) * 8].cast('Q')
+
+    def __len__(self):
+        return self.nombre
+
+    def __contains__(self, mot_de_passe):
+        empreinte = empreinte_mot_de_passe(mot_de_passe)
+        prefixe = empreinte >> (64 - BITS_PREFIXE_INDEX)
+        debut, fin = self._table[prefixe], self._table[prefixe + 1]
+        position = bisect_left(self._empreintes, empreinte, debut, fin)
+        return position < fin and self._empreintes[position] == empreinte
+
+    def fermer(self):
+        """
+        Libère la projection en mémoire
+        """
+        for vue in ('_empreintes', '_table'):
+            if hasattr(self, vue):
+                getattr(self, vue).release()
+        self._carte.close()
+        self._fichier.close()
+
+def empreinte_mot_de_passe(mot_de_passe):
+    """
+    Calcule l'empreinte 64 bits d'un mot de passe pour l'index des fuites
+    
+    Args:
+        mot_de_passe (str): Mot de passe
+    
+    Returns:
+        int: Empreinte BLAKE2b tronquée à 64 bits
+    """
+    return int.from_bytes(hashlib.blake2b(mot_de_passe.encode('utf-8'), digest_size=8).digest(), 'big')
+
+def _lire_serie(fichier):
+    """
+    Relit une série triée d'empreintes écrite par compiler_index_fuites
+    
+    Yields:
+        int: Empreintes, dans l'ordre croissant
+    """
+    fichier.seek(0)
+    while True:
+        bloc = array('Q')
+        bloc.frombytes(fichier.read(TAILLE_LOT_SORTIE * 8 * 16))
+        if not bloc:
+            return
+        yield from bloc
+
+def _ouvrir_temporaire(destination):
+    """
+    Crée un fichier temporaire unique dans le répertoire de destination
+    
+    Le fichier est renommé en destination (os.replace) une fois complet :
+    deux compilations simultanées n'écrivent jamais dans le même fichier.
+    
+    Args:
+        destination (str): Chemin du fichier à produire
+    
+    Returns:
+        tuple: (fichier ouvert en écriture binaire, chemin du fichier temporaire)
+    """
+    descripteur, temporaire = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(destination) or '.')
+    return os.fdopen(descripteur, 'wb'), temporaire
+
+def compiler_index_fuites(source, destination, taille_serie=TAILLE_SERIE_INDEX):
+    """
+    Compile une liste de mots de passe (un par ligne) en IndexFuites
+    
+    Les empreintes sont triées par séries de taille_serie en mémoire, puis
+    les séries sont fusionnées depuis des fichiers temporaires : la mémoire
+    utilisée ne dépend pas de la taille de la liste. Le fichier produit
+    occupe 8 octets par mot de passe distinct, plus 512 Kio de table.
+    
+    Args:
+        source (str): Liste de mots de passe ('-' pour l'entrée standard)
+        destination (str): Chemin de l'index à écrire
+        taille_serie (int): Nombre d'empreintes triées en mémoire à la fois
+    
+    Returns:
+        int: Nombre de mots de passe distincts indexés
+    """
+    series = []
+    lot = []
+    try:
+        for mot_de_passe in iter_mots_de_passe_fichier(source):
+            lot.append(empreinte_mot_de_passe(mot_de_passe))
+            if len(lot) >= taille_serie:
+                serie = tempfile.TemporaryFile()
+                array('Q', sorted(lot)).tofile(serie)
+                series.append(serie)
+                lot = []
+        lot.sort()
+        empreintes = heapq.merge(lot, *(_lire_serie(serie) for serie in series)) if series else lot
+        
+        comptes = array('Q', bytes(8 * TAILLE_TABLE_PREFIXES))
+        nombre = 0
+        fichier, temporaire = _ouvrir_temporaire(destination)
+        try:
+            with fichier:
+                fichier.write(bytes(_ENTETE_INDEX.size))
+                tampon = array('Q')
+                precedente = None
+                for empreinte in empreintes:
+                    if empreinte == precedente:
+                        continue
+                    precedente = empreinte
+                    tampon.append(empreinte)
+                    comptes[empreinte >> (64 - BITS_PREFIXE_INDEX)] += 1
+                    if len(tampon) >= TAILLE_LOT_SORTIE * 16:
+                        nombre += len(tampon)
+                        tampon.tofile(fichier)
+                        tampon = array('Q')
+                nombre += len(tampon)
+                tampon.tofile(fichier)
+                
+                # Table des positions de début de chaque préfixe (et fin du dernier)
+                table = array('Q', [0])
+                for compte in comptes:
+                    table.append(table[-1] + compte)
+                offset_table = fichier.tell()
+                table.tofile(fichier)
+                fichier.seek(0)
+                fichier.write(_ENTETE_INDEX.pack(MAGIQUE_INDEX, nombre, offset_table))
+            os.replace(temporaire, destination)
+        except BaseException:
+            os.unlink(temporaire)
+            raise
+    finally:
+        for serie in series:
+            serie.close()
+    return nombre
+
+def _construire_graphe_clavier(rangees):
+    """
+    Construit le graphe des touches voisines d'un clavier
+    
+    Args:
+        rangees (tuple): Rangées de touches, du haut vers le bas (décalées
+            d'une demi-touche vers la droite à chaque rangée)
+    
+    Returns:
+        dict: Caractère -> (ligne, colonne)
+    """
+    return {caractere: (ligne, colonne)
+            for ligne, rangee in enumerate(rangees)
+            for colonne, caractere in enumerate(rangee)}
+
+CLAVIERS = {
+    'azerty': _construire_graphe_clavier(("1234567890", "azertyuiop", "qsdfghjklm", "wxcvbn,;:!")),
+    'qwerty': _construire_graphe_clavier(("1234567890-=", "qwertyuiop[]", "asdfghjkl;'", "zxcvbnm,./"))
+}
+
+def _direction_clavier(clavier, precedent, caractere):
+    """
+    Renvoie le déplacement entre deux touches voisines, ou None
+    """
+    if precedent not in clavier or caractere not in clavier:
+        return None
+    (ligne_1, colonne_1), (ligne_2, colonne_2) = clavier[precedent], clavier[caractere]
+    deplacement = (ligne_2 - ligne_1, colonne_2 - colonne_1)
+    # Voisins sur la même rangée ou sur la rangée adjacente (décalage d'une demi-touche)
+    if deplacement in ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, 0), (1, -1)):
+        return deplacement
+    return None
+
+def _cardinalite(caractere):
+    """
+    Taille de la classe d'un caractère (recherche exhaustive)
+    """
+    if caractere in string.ascii_lowercase or caractere in string.ascii_uppercase:
+        return 26
+    if caractere in string.digits:
+        return 10
+    if caractere in string.punctuation or caractere == ' ':
+        return 33
+    return 100
+
+def _bits_variantes(jeton, mot=None):
+    """
+    Entropie ajoutée par les majuscules et le leet speak d'un mot connu
+    
+    Args:
+        jeton (str): Mot tel qu'écrit dans le mot de passe
+        mot (str): Mot connu reconnu ; seuls les caractères qui en diffèrent
+            comptent comme leet speak (optionnel)
+    """
+    majuscules = sum(1 for c in jeton if c.isupper())
+    if majuscules == 0:
+        bits = 0
+    elif majuscules == len(jeton) or (majuscules == 1 and jeton[0].isupper()):
+        bits = 1
+    else:
+        bits = majuscules
+    if mot is None:
+        return bits + len(set(jeton).intersection(_SUBSTITUTIONS_LEET))
+    return bits + len({c for c, lettre in zip(jeton.lower(), mot) if c != lettre})
+
+def _motifs(mot_de_passe, index=None):
+    """
+    Recherche les motifs prévisibles d'un mot de passe
+    
+    Args:
+        mot_de_passe (str): Mot de passe à analyser
+        index (IndexFuites): Index des mots de passe compromis (optionnel)
+    
+    Returns:
+        list: Tuples (debut, fin, type, entropie en bits)
+    """
+    motifs = []
+    minuscules = mot_de_passe.lower()
+    longueur = min(len(mot_de_passe), LONGUEUR_MAX_MOTIFS)
+    
+    # Mots courants, éventuellement en leet speak, en majuscules ou à l'envers
+    # (les chiffres des mots comme "trustno1" sont ramenés aux lettres des deux côtés)
+    sans_leet = minuscules.translate(_TABLE_LEET)
+    for debut in range(longueur - 2):
+        if sans_leet[debut:debut + 3] not in _PREFIXES_MOTS:
+            continue
+        for fin in range(debut + 3, min(longueur, debut + LONGUEUR_MAX_MOT) + 1):
+            connu = _MOTS_CONNUS.get(sans_leet[debut:fin])
+            if connu is not None:
+                rang, inverse, mot = connu
+                motifs.append((debut, fin, 'mot courant', math.log2(rang) + inverse
+                               + _bits_variantes(mot_de_passe[debut:fin], mot)))
+    
+    # Variantes du mot de passe complet présentes dans l'index des fuites
+    if index is not None and mot_de_passe:
+        for candidat in {minuscules, sans_leet} - {mot_de_passe}:
+            if candidat in index:
+                motifs.append((0, len(mot_de_passe), 'fuite', math.log2(max(len(index), 2))
+                               + _bits_variantes(mot_de_passe)))
+                break
+    
+    # Répétitions d'un caractère ("aaaa") ou d'un bloc ("abcabc")
+    for correspondance in _RE_REPETITION.finditer(mot_de_passe, 0, longueur):
+        bloc = correspondance.group(1)
+        repetitions = len(correspondance.group(0)) // len(bloc)
+        entropie_bloc = sum(math.log2(_cardinalite(c)) for c in bloc)
+        motifs.append((correspondance.start(), correspondance.end(), 'répétition',
+                       entropie_bloc + math.log2(repetitions)))
+    
+    # Suites ("abcd", "4321") et marches sur le clavier ("azerty", "qsdf")
+    debut = 0
+    while debut < longueur - 2:
+        ecart = ord(mot_de_passe[debut + 1]) - ord(mot_de_passe[debut])
+        fin = debut + 1
+        if ecart in (-1, 1):
+            while fin < longueur and ord(mot_de_passe[fin]) - ord(mot_de_passe[fin - 1]) == ecart:
+                fin += 1
+        if fin - debut >= 3:
+            premier = mot_de_passe[debut]
+            depart = 1 if premier in 'aA01zZ9' else math.log2(_cardinalite(premier))
+            motifs.append((debut, fin, 'suite',
+                           depart + math.log2(fin - debut) + (1 if ecart < 0 else 0)))
+            debut = fin - 1
+        else:
+            debut += 1
+    for clavier in CLAVIERS.values():
+        debut = 0
+        while debut < longueur - 2:
+            fin = debut + 1
+            tours = 0
+            direction = None
+            while fin < longueur:
+                suivante = _direction_clavier(clavier, minuscules[fin - 1], minuscules[fin])
+                if suivante is None:
+                    break
+                if suivante != direction:
+                    tours += 1
+                    direction = suivante
+                fin += 1
+            if fin - debut >= 3:
+                motifs.append((debut, fin, 'clavier',
+                               math.log2(len(clavier)) + math.log2(fin - debut)
+                               + (tours - 1) * math.log2(DEGRE_MOYEN_CLAVIER)))
+                debut = fin - 1
+            else:
+                debut += 1
+    
+    # Années
+    for correspondance in _RE_ANNEE.finditer(mot_de_passe, 0, longueur):
+        motifs.append((correspondance.start(), correspondance.end(), 'année', math.log2(200)))
+    
+    return motifs
+
+def estimer_entropie(mot_de_passe, index=None):
+    """
+    Estime l'entropie réelle d'un mot de passe
+    
+    Le mot de passe est découpé en motifs prévisibles (mots courants, suites,
+    marches sur le clavier, répétitions, années) et en caractères isolés ; la
+    découpe retenue est celle d'entropie minimale, c'est-à-dire celle que
+    choisirait un attaquant. Un mot de passe présent dans l'index des fuites
+    ne vaut pas plus que le nombre d'essais pour parcourir cette liste.
+    Les motifs ne sont cherchés que dans les LONGUEUR_MAX_MOTIFS premiers
+    caractères.
+    
+    Args:
+        mot_de_passe (str): Mot de passe à évaluer
+        index (IndexFuites): Index des mots de passe compromis (optionnel)
+    
+    Returns:
+        dict: entropie (bits), niveau, compromis, motifs (liste de dict
+            type/jeton/entropie) et temps de cassage hors ligne (secondes)
+    """
+    longueur = len(mot_de_passe)
+    motifs_par_fin = {}
+    for motif in _motifs(mot_de_passe, index):
+        motifs_par_fin.setdefault(motif[1], []).append(motif)
+    
+    # Programmation dynamique : meilleure[i] = entropie minimale des i premiers caractères
+    meilleure = [0.0] + [math.inf] * longueur
+    choix = [None] * (longueur + 1)
+    for fin in range(1, longueur + 1):
+        meilleure[fin] = meilleure[fin - 1] + math.log2(_cardinalite(mot_de_passe[fin - 1]))
+        for motif in motifs_par_fin.get(fin, ()):
+            entropie = meilleure[motif[0]] + motif[3]
+            if entropie < meilleure[fin]:
+                meilleure[fin] = entropie
+                choix[fin] = motif
+    
+    motifs = []
+    position = longueur
+    while position > 0:
+        motif = choix[position]
+        if motif is None:
+            position -= 1
+            continue
+        debut, fin, type_motif, entropie = motif
+        motifs.append({'type': type_motif, 'jeton': mot_de_passe[debut:fin],
+                       'entropie': round(entropie, 1)})
+        position = debut
+    motifs.reverse()
+    
+    entropie = meilleure[longueur]
+    compromis = index is not None and mot_de_passe in index
+    if compromis:
+        entropie = min(entropie, math.log2(max(len(index), 2)))
+    
+    return {
+        "entropie": round(entropie, 1),
+        "niveau": "Faible" if compromis else niveau_entropie(entropie),
+        "compromis": compromis,
+        "motifs": motifs,
+        "temps_cassage": temps_cassage(entropie)
+    }
+
+def temps_cassage(entropie):
+    """
+    Durée d'une attaque hors ligne parcourant 2 ** entropie essais
+    
+    Args:
+        entropie (float): Entropie en bits
+    
+    Returns:
+        float: Durée en secondes, math.inf au-delà de la plage des flottants
+    """
+    try:
+        return 2 ** entropie / ESSAIS_PAR_SECONDE
+    except OverflowError:
+        return math.inf
+
+def niveau_entropie(entropie):
+    """
+    Niveau de force correspondant à une entropie
+    
+    Args:
+        entropie (float): Entropie en bits
+    
+    Returns:
+        str: Niveau parmi NIVEAUX_FORCE
+    """
+    return NIVEAUX_FORCE[bisect_right(SEUILS_ENTROPIE, entropie)]
+
+def formater_duree(secondes):
+    """
+    Formate une durée de cassage de façon lisible
+    
+    Args:
+        secondes (float): Durée en secondes (math.inf pour une durée hors de
+            la plage des flottants)
+    
+    Returns:
+        str: Durée arrondie dans l'unité la plus adaptée
+    """
+    if math.isinf(secondes):
+        return "plus d'un million de siècles"
+    for unite, duree in (("siècles", 3153600000), ("ans", 31536000), ("jours", 86400),
+                         ("heures", 3600), ("minutes", 60)):
+        if secondes >= duree:
+            return f"{secondes / duree:.0f} {unite}" if secondes < duree * 1e6 else f"plus d'un million de {unite}"
+    return "moins d'une minute" if secondes >= 1 else "instantané"
+
+class StatistiquesAudit:
+    """
+    Histogrammes cumulés d'un audit de mots de passe
+    
+    Compte les niveaux de force, les classes de caractères absentes et les
+    longueurs, sans conserver les mots de passe. Les niveaux d'entropie et
+    les mots de passe compromis ne sont comptés que si l'audit les estime.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.forces = {niveau: 0 for niveau in NIVEAUX_FORCE}
+        self.manques = {nom: 0 for _, nom, _ in CLASSES_CARACTERES}
+        self.longueurs = {}
+        self.niveaux_entropie = {niveau: 0 for niveau in NIVEAUX_FORCE}
+        self.compromis = 0
+
+    def ajouter(self, evaluation, estimation=None):
+        """
+        Intègre l'évaluation d'un mot de passe
+        
+        Args:
+            evaluation (dict): Résultat de evaluer_force
+            estimation (dict): Résultat de estimer_entropie (optionnel)
+        """
+        self.total += 1
+        self.forces[evaluation['force']] += 1
+        if estimation is not None:
+            self.niveaux_entropie[estimation['niveau']] += 1
+            self.compromis += estimation['compromis']
+        for cle, nom, _ in CLASSES_CARACTERES:
+            if not evaluation[cle]:
+                self.manques[nom] += 1
+        longueur = evaluation['longueur']
+        self.longueurs[longueur] = self.longueurs.get(longueur, 0) + 1
+
+    def fusionner(self, autres):
+        """
+        Ajoute les compteurs d'un autre audit
+        
+        Args:
+            autres (StatistiquesAudit): Compteurs à intégrer
+        """
+        self.total += autres.total
+        for niveau, nombre in autres.forces.items():
+            self.forces[niveau] += nombre
+        for nom, nombre in autres.manques.items():
+            self.manques[nom] += nombre
+        for longueur, nombre in autres.longueurs.items():
+            self.longueurs[longueur] = self.longueurs.get(longueur, 0) + nombre
+        for niveau, nombre in autres.niveaux_entropie.items():
+            self.niveaux_entropie[niveau] += nombre
+        self.compromis += autres.compromis
+
+def classes_manquantes(evaluation):
+    """
+    Liste les classes de caractères absentes d'un mot de passe évalué
+    
+    Args:
+        evaluation (dict): Résultat de evaluer_force
+    
+    Returns:
+        list: Noms des classes absentes (majuscules, minuscules, chiffres, symboles)
+    """
+    return [nom for cle, nom, _ in CLASSES_CARACTERES if not evaluation[cle]]
+
+def iter_mots_de_passe_fichier(chemin):
+    """
+    Lit une liste de mots de passe, un par ligne
+    
+    Seul le retour à la ligne est retiré : les espaces font partie du mot
+    de passe. Les octets qui ne sont pas de l'UTF-8 valide sont remplacés.
+    
+    Args:
+        chemin (str): Fichier à lire ('-' pour l'entrée standard)
+    
+    Yields:
+        str: Mot de passe non vide
+    """
+    if chemin == '-':
+        fichier = sys.stdin.buffer
+    else:
+        fichier = open(chemin, 'rb', buffering=1024 * 1024)
+    try:
+        for ligne in fichier:
+            mot_de_passe = ligne.rstrip(b'\r\n').decode('utf-8', 'replace')
+            if mot_de_passe:
+                yield mot_de_passe
+    finally:
+        if fichier is not sys.stdin.buffer:
+            fichier.close()
+
+def auditer_mots_de_passe(chemin, sortie=None, avec_mots=False, entropie=False, index=None):
+    """
+    Évalue tous les mots de passe d'un fichier avec evaluer_force
+    
+    Les verdicts sont écrits par lots au format CSV (numero, score, force,
+    classes manquantes séparées par « | », entropie et compromis si estimées,
+    puis le mot de passe si demandé).
+    
+    Args:
+        chemin (str): Fichier à auditer ('-' pour l'entrée standard)
+        sortie (file): Flux texte recevant les verdicts (None : aucun verdict)
+        avec_mots (bool): Inclure le mot de passe dans chaque verdict
+        entropie (bool): Estimer aussi l'entropie avec estimer_entropie
+        index (IndexFuites): Index des mots de passe compromis (implique entropie)
+    
+    Returns:
+        StatistiquesAudit: Histogrammes de l'audit
+    """
+    statistiques = StatistiquesAudit()
+    ecrivain = csv.writer(sortie, lineterminator='\n') if sortie is not None else None
+    if ecrivain is not None:
+        entete = ['numero', 'score', 'force', 'manques']
+        if entropie or index is not None:
+            entete += ['entropie', 'compromis']
+        ecrivain.writerow(entete + ['mot_de_passe'] if avec_mots else entete)
+    
+    lot = []
+    for numero, mot_de_passe in enumerate(iter_mots_de_passe_fichier(chemin), 1):
+        evaluation = evaluer_force(mot_de_passe)
+        estimation = estimer_entropie(mot_de_passe, index) if entropie or index is not None else None
+        statistiques.ajouter(evaluation, estimation)
+        if ecrivain is not None:
+            verdict = [numero, evaluation['score'], evaluation['force'],
+                       '|'.join(classes_manquantes(evaluation))]
+            if estimation is not None:
+                verdict += [estimation['entropie'], int(estimation['compromis'])]
+            if avec_mots:
+                verdict.append(mot_de_passe)
+            lot.append(verdict)
+            if len(lot) >= TAILLE_LOT_SORTIE:
+                ecrivain.writerows(lot)
+                lot = []
+    if lot:
+        ecrivain.writerows(lot)
+    return statistiques
+
+def afficher_audit(statistiques, flux=None):
+    """
+    Affiche les histogrammes d'un audit
+    
+    Args:
+        statistiques (StatistiquesAudit): Histogrammes de l'audit
+        flux (file): Flux de sortie (défaut : sortie standard)
+    """
+    flux = flux or sys.stdout
+    total = statistiques.total
+    
+    def barre(nombre):
+        return "█" * round(nombre / total * 30) if total else ""
+    
+    print("\n" + "="*50, file=flux)
+    print("AUDIT DES MOTS DE PASSE".center(50), file=flux)
+    print("="*50, file=flux)
+    print(f"Mots de passe analysés: {total}", file=flux)
+    if not total:
+        print("="*50, file=flux)
+        return
+    
+    print("-"*50, file=flux)
+    print("Force:", file=flux)
+    for niveau in reversed(NIVEAUX_FORCE):
+        nombre = statistiques.forces[niveau]
+        print(f"  {niveau:<10}{nombre:>10} {nombre/total*100:5.1f}% {barre(nombre)}", file=flux)
+    
+    if sum(statistiques.niveaux_entropie.values()):
+        print("Entropie estimée:", file=flux)
+        for niveau in reversed(NIVEAUX_FORCE):
+            nombre = statistiques.niveaux_entropie[niveau]
+            print(f"  {niveau:<10}{nombre:>10} {nombre/total*100:5.1f}% {barre(nombre)}", file=flux)
+        nombre = statistiques.compromis
+        print(f"  {'Compromis':<10}{nombre:>10} {nombre/total*100:5.1f}% {barre(nombre)}", file=flux)
+    
+    print("Classes de caractères manquantes:", file=flux)
+    for nom, nombre in statistiques.manques.items():
+        print(f"  {nom:<10}{nombre:>10} {nombre/total*100:5.1f}% {barre(nombre)}", file=flux)
+    
+    print("Longueurs:", file=flux)
+    tranches = {}
+    for longueur, nombre in statistiques.longueurs.items():
+        tranche = "< 8" if longueur < 8 else "8-11" if longueur < 12 else "12-15" if longueur < 16 else "16+"
+        tranches[tranche] = tranches.get(tranche, 0) + nombre
+    for tranche in ("< 8", "8-11", "12-15", "16+"):
+        nombre = tranches.get(tranche, 0)
+        print(f"  {tranche:<10}{nombre:>10} {nombre/total*100:5.1f}% {barre(nombre)}", file=flux)
+    print("="*50, file=flux)
+
+def afficher_resultat(mot_de_passe, evaluation, estimation=None):
     """
     Affiche le mot de passe et son évaluation de manière formatée
     
     Args:
         mot_de_passe (str): Mot de passe généré
         evaluation (dict): Résultats de l'évaluation
+        estimation (dict): Résultat de estimer_entropie (optionnel)
     """
     print("\n" + "="*50)
     print("GÉNÉRATEUR DE MOTS DE PASSE NOVATECH".center(50))
@@ -156,6 +1523,16 @@ def afficher_resultat(mot_de_passe, evaluation):
     print(f"  - Chiffres: {'✅' if evaluation['has_digit'] else '❌'}")
     print(f"  - Symboles: {'✅' if evaluation['has_symbol'] else '❌'}")
     
+    # Entropie estimée
+    if estimation is not None:
+        print("-"*50)
+        print(f"Entropie estimée: {estimation['entropie']} bits ({estimation['niveau']})")
+        print(f"Temps de cassage hors ligne: {formater_duree(estimation['temps_cassage'])}")
+        if estimation['compromis']:
+            print("⚠️  Ce mot de passe figure dans la liste des mots de passe compromis !")
+        for motif in estimation['motifs']:
+            print(f"  - {motif['type']}: « {motif['jeton']} » ({motif['entropie']} bits)")
+    
     # Recommandations
     if evaluation['recommendations']:
         print("\nRecommandations:")
@@ -178,13 +1555,628 @@ def generer_plusieurs_mots_de_passe(nombre, longueur=12, majuscules=True, chiffr
     Returns:
         list: Liste des mots de passe générés
     """
-    mots_de_passe = []
-    for _ in range(nombre):
-        mot_de_passe = generer_mot_de_passe(longueur, majuscules, chiffres, symboles)
-        mots_de_passe.append(mot_de_passe)
+    return list(iter_mots_de_passe(nombre, longueur, majuscules, chiffres, symboles))
+
+def iter_mots_de_passe(nombre, longueur=12, majuscules=True, chiffres=True, symboles=True):
+    """
+    Génère des mots de passe au fil de l'eau avec le générateur en masse
+    
+    Args:
+        nombre (int): Nombre de mots de passe à générer
+        longueur (int): Longueur de chaque mot de passe (ajustée entre 8 et 64)
+        majuscules (bool): Inclure des majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
     
+    Returns:
+        generator: Mots de passe générés, sans construire de liste
+    """
+    generateur = GenerateurMotsDePasse(ajuster_longueur(longueur), majuscules, chiffres, symboles)
+    return generateur.iter_mots_de_passe(nombre)
+
+# Générateur réutilisé par le processus courant du pool
+_generateur_worker = None
+
+def _construire_generateur(longueur, majuscules, chiffres, symboles, parametres_politique=None):
+    """
+    Construit le générateur d'une politique ou des options de classes
+    
+    Args:
+        longueur (int): Longueur des mots de passe
+        majuscules (bool): Inclure des majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        parametres_politique (tuple): Paramètres de PolitiqueMotsDePasse
+            (remplacent la longueur et les options de classes)
+    
+    Returns:
+        GenerateurMotsDePasse | PolitiqueMotsDePasse: Générateur
+    """
+    if parametres_politique is not None:
+        return PolitiqueMotsDePasse(*parametres_politique)
+    return GenerateurMotsDePasse(longueur, majuscules, chiffres, symboles)
+
+def _initialiser_worker(*options):
+    """
+    Construit le générateur réutilisé par le processus courant
+    
+    Les tables d'une politique ne sont ainsi construites qu'une fois par
+    processus ; les tâches ne transportent que des nombres et des comptes.
+    
+    Args:
+        options (tuple): Arguments de _construire_generateur
+    """
+    global _generateur_worker
+    _generateur_worker = _construire_generateur(*options)
+
+def _generer_lot(nombre, evaluer):
+    """
+    Génère (et évalue) un lot de mots de passe dans un processus du pool
+    
+    Chaque processus tire son aléa de os.urandom, donc du générateur du
+    système : les lots sont indépendants sans graine à partager.
+    
+    Args:
+        nombre (int): Nombre de mots de passe du lot
+        evaluer (bool): Joindre l'évaluation de evaluer_force
+    
+    Returns:
+        list: Mots de passe, ou tuples (mot de passe, évaluation)
+    """
+    mots_de_passe = _generateur_worker.generer(nombre)
+    if evaluer:
+        return [(mdp, evaluer_force(mdp)) for mdp in mots_de_passe]
     return mots_de_passe
 
+def iter_mots_de_passe_paralleles(nombre, longueur=12, majuscules=True, chiffres=True, symboles=True,
+                                  workers=None, evaluer=False, ordonne=False,
+                                  taille_lot=TAILLE_LOT_WORKER, politique=None):
+    """
+    Génère (et évalue) des mots de passe sur plusieurs processus
+    
+    Les mots de passe sont produits par lots de taille_lot ; seuls
+    2 lots par processus sont en cours à la fois, donc la mémoire reste
+    bornée quel que soit le nombre demandé.
+    
+    Args:
+        nombre (int): Nombre de mots de passe à générer
+        longueur (int): Longueur de chaque mot de passe (ajustée entre 8 et 64)
+        majuscules (bool): Inclure des majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        workers (int): Nombre de processus (défaut : nombre de cœurs)
+        evaluer (bool): Produire des tuples (mot de passe, évaluation)
+        ordonne (bool): Restituer les lots dans l'ordre de leur soumission
+            plutôt que dès qu'ils sont prêts
+        taille_lot (int): Nombre de mots de passe par tâche
+        politique (PolitiqueMotsDePasse): Politique à respecter (remplace
+            la longueur et les options de classes)
+    
+    Yields:
+        str | tuple: Mot de passe, ou (mot de passe, évaluation) avec evaluer
+    """
+    longueur = ajuster_longueur(longueur)
+    workers = workers or os.cpu_count() or 1
+    tailles = [taille_lot] * (nombre // taille_lot)
+    if nombre % taille_lot:
+        tailles.append(nombre % taille_lot)
+    
+    options = (longueur, majuscules, chiffres, symboles, None if politique is None else politique._parametres)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialiser_worker,
+                             initargs=options) as executeur:
+        en_cours = deque()
+        for taille in tailles:
+            en_cours.append(executeur.submit(_generer_lot, taille, evaluer))
+            if len(en_cours) >= workers * 2:
+                yield from _recevoir_lot(en_cours, ordonne)
+        while en_cours:
+            yield from _recevoir_lot(en_cours, ordonne)
+
+def _recevoir_lot(en_cours, ordonne):
+    """
+    Retire un lot terminé de la file des tâches en cours
+    
+    Args:
+        en_cours (deque): Tâches soumises au pool, dans l'ordre de soumission
+        ordonne (bool): Attendre le plus ancien lot plutôt que le premier prêt
+    
+    Returns:
+        list: Résultats du lot
+    """
+    if ordonne:
+        return en_cours.popleft().result()
+    termines, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+    tache = next(iter(termines))
+    en_cours.remove(tache)
+    return tache.result()
+
+def parametres_kdf(kdf='scrypt', parametres=None):
+    """
+    Complète et valide les paramètres d'une fonction de dérivation
+    
+    Args:
+        kdf (str): 'scrypt' ou 'pbkdf2_sha256'
+        parametres (dict): Paramètres à modifier (défaut : PARAMETRES_KDF)
+    
+    Returns:
+        dict: Paramètres complets
+    """
+    if kdf not in PARAMETRES_KDF:
+        raise ValueError(f"Fonction de dérivation inconnue : {kdf} (choix : {', '.join(PARAMETRES_KDF)})")
+    parametres = {**PARAMETRES_KDF[kdf], **{cle: valeur for cle, valeur in (parametres or {}).items()
+                                            if cle in PARAMETRES_KDF[kdf] and valeur is not None}}
+    if any(valeur < 1 for valeur in parametres.values()):
+        raise ValueError("Les paramètres de la fonction de dérivation doivent être positifs")
+    if kdf == 'scrypt' and (parametres['n'] < 2 or parametres['n'] & (parametres['n'] - 1)):
+        raise ValueError("Le paramètre n de scrypt doit être une puissance de 2")
+    return parametres
+
+def hacher_mot_de_passe(mot_de_passe, kdf='scrypt', parametres=None):
+    """
+    Calcule l'empreinte salée d'un mot de passe avec une fonction de dérivation
+    
+    Formats produits (sel et empreinte en base64) :
+    scrypt$n$r$p$sel$empreinte et pbkdf2_sha256$iterations$sel$empreinte
+    
+    Args:
+        mot_de_passe (str): Mot de passe à hacher
+        kdf (str): 'scrypt' ou 'pbkdf2_sha256'
+        parametres (dict): Paramètres de la fonction (défaut : PARAMETRES_KDF)
+    
+    Returns:
+        str: Empreinte encodée, avec l'algorithme, les paramètres et le sel
+    """
+    parametres = parametres_kdf(kdf, parametres)
+    sel = os.urandom(TAILLE_SEL)
+    if kdf == 'scrypt':
+        n, r, p = parametres['n'], parametres['r'], parametres['p']
+        empreinte = hashlib.scrypt(mot_de_passe.encode('utf-8'), salt=sel, n=n, r=r, p=p,
+                                   maxmem=128 * r * (n + p + 2) + 1024 * 1024, dklen=TAILLE_EMPREINTE)
+        entete = f"scrypt${n}${r}${p}"
+    else:
+        iterations = parametres['iterations']
+        empreinte = hashlib.pbkdf2_hmac('sha256', mot_de_passe.encode('utf-8'), sel, iterations,
+                                        dklen=TAILLE_EMPREINTE)
+        entete = f"pbkdf2_sha256${iterations}"
+    return f"{entete}${base64.b64encode(sel).decode('ascii')}${base64.b64encode(empreinte).decode('ascii')}"
+
+def verifier_mot_de_passe(mot_de_passe, empreinte_encodee):
+    """
+    Vérifie un mot de passe contre une empreinte de hacher_mot_de_passe
+    
+    Args:
+        mot_de_passe (str): Mot de passe à vérifier
+        empreinte_encodee (str): Empreinte encodée
+    
+    Returns:
+        bool: True si le mot de passe correspond
+    """
+    champs = empreinte_encodee.split('$')
+    if champs[0] == 'scrypt' and len(champs) == 6:
+        n, r, p = (int(champ) for champ in champs[1:4])
+        sel, attendue = base64.b64decode(champs[4]), base64.b64decode(champs[5])
+        calculee = hashlib.scrypt(mot_de_passe.encode('utf-8'), salt=sel, n=n, r=r, p=p,
+                                  maxmem=128 * r * (n + p + 2) + 1024 * 1024, dklen=len(attendue))
+    elif champs[0] == 'pbkdf2_sha256' and len(champs) == 4:
+        sel, attendue = base64.b64decode(champs[2]), base64.b64decode(champs[3])
+        calculee = hashlib.pbkdf2_hmac('sha256', mot_de_passe.encode('utf-8'), sel, int(champs[1]),
+                                       dklen=len(attendue))
+    else:
+        raise ValueError("Format d'empreinte non reconnu")
+    return hmac.compare_digest(calculee, attendue)
+
+class StatistiquesProvisionnement:
+    """
+    Durées cumulées de chaque étape d'un provisionnement
+    
+    La génération et le hachage sont mesurés dans les processus du pool
+    (temps cumulé sur tous les processus) ; la lecture, l'attente des lots
+    et l'écriture le sont dans le processus principal.
+    """
+    
+    ETAPES = ('lecture', 'generation', 'hachage', 'attente', 'ecriture')
+
+    def __init__(self):
+        self.comptes = 0
+        self.durees = {etape: 0.0 for etape in self.ETAPES}
+        self.duree_totale = 0.0
+
+    def debit(self):
+        """
+        Comptes provisionnés par seconde
+        
+        Returns:
+            float: Débit sur la durée totale
+        """
+        return self.comptes / self.duree_totale if self.duree_totale else 0.0
+
+def _provisionner_lot(comptes, kdf, parametres, avec_mots, generateur=None):
+    """
+    Génère et hache les mots de passe d'un lot de comptes dans un processus du pool
+    
+    Args:
+        comptes (list): Identifiants des comptes
+        kdf (str): Fonction de dérivation (voir hacher_mot_de_passe)
+        parametres (dict): Paramètres de la fonction de dérivation
+        avec_mots (bool): Joindre le mot de passe en clair à chaque ligne
+        generateur (GenerateurMotsDePasse | PolitiqueMotsDePasse):
+            Générateur à utiliser (défaut : celui du processus du pool)
+    
+    Returns:
+        tuple: (lignes [compte, empreinte(, mot de passe)], durée de
+            génération, durée de hachage)
+    """
+    debut = time.perf_counter()
+    mots_de_passe = (generateur or _generateur_worker).generer(len(comptes))
+    milieu = time.perf_counter()
+    lignes = []
+    for compte, mot_de_passe in zip(comptes, mots_de_passe):
+        ligne = [compte, hacher_mot_de_passe(mot_de_passe, kdf, parametres)]
+        if avec_mots:
+            ligne.append(mot_de_passe)
+        lignes.append(ligne)
+    return lignes, milieu - debut, time.perf_counter() - milieu
+
+def provisionner_comptes(source, sortie, longueur=12, majuscules=True, chiffres=True, symboles=True,
+                         politique=None, kdf='scrypt', parametres=None, avec_mots=False,
+                         workers=None, taille_lot=TAILLE_LOT_PROVISION):
+    """
+    Génère un mot de passe et son empreinte pour chaque compte d'une liste
+    
+    Les comptes (un par ligne) sont lus par lots de taille_lot et confiés
+    au pool ; 2 lots par processus au plus sont en cours, dans l'ordre de
+    la liste. Les lignes compte,empreinte(,mot_de_passe) sont écrites en
+    CSV au fil des lots terminés.
+    
+    Args:
+        source (str): Liste des comptes ('-' pour l'entrée standard)
+        sortie (file): Flux texte recevant le CSV
+        longueur (int): Longueur des mots de passe (8-64)
+        majuscules (bool): Inclure des majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        politique (PolitiqueMotsDePasse): Politique à respecter (remplace
+            la longueur et les options de classes)
+        kdf (str): 'scrypt' ou 'pbkdf2_sha256'
+        parametres (dict): Paramètres de la fonction de dérivation
+        avec_mots (bool): Inclure le mot de passe en clair
+        workers (int): Nombre de processus (défaut : nombre de cœurs ;
+            1 : tout dans le processus courant)
+        taille_lot (int): Nombre de comptes par tâche
+    
+    Returns:
+        StatistiquesProvisionnement: Nombre de comptes et durées par étape
+    """
+    # Validation immédiate, plutôt qu'à la première tâche du pool
+    parametres = parametres_kdf(kdf, parametres)
+    workers = workers or os.cpu_count() or 1
+    statistiques = StatistiquesProvisionnement()
+    ecrivain = csv.writer(sortie, lineterminator='\n')
+    entete = ['compte', 'empreinte']
+    ecrivain.writerow(entete + ['mot_de_passe'] if avec_mots else entete)
+    options = (longueur, majuscules, chiffres, symboles, None if politique is None else politique._parametres)
+    hachage = (kdf, parametres, avec_mots)
+    
+    def ecrire(resultat):
+        lignes, duree_generation, duree_hachage = resultat
+        debut = time.perf_counter()
+        ecrivain.writerows(lignes)
+        statistiques.durees['ecriture'] += time.perf_counter() - debut
+        statistiques.durees['generation'] += duree_generation
+        statistiques.durees['hachage'] += duree_hachage
+        statistiques.comptes += len(lignes)
+    
+    lus = 0
+    
+    def lire_lots():
+        nonlocal lus
+        # Les lignes vides sont écartées avant le découpage : un lot vide
+        # signifie seulement que la liste est épuisée
+        comptes = (compte for compte in map(str.strip, iter_mots_de_passe_fichier(source)) if compte)
+        while True:
+            debut = time.perf_counter()
+            lot = list(itertools.islice(comptes, taille_lot))
+            statistiques.durees['lecture'] += time.perf_counter() - debut
+            if not lot:
+                return
+            lus += len(lot)
+            yield lot
+    
+    debut_total = time.perf_counter()
+    if workers == 1:
+        generateur = politique or _construire_generateur(*options)
+        for lot in lire_lots():
+            ecrire(_provisionner_lot(lot, *hachage, generateur))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initialiser_worker,
+                                 initargs=options) as executeur:
+            en_cours = deque()
+            for lot in lire_lots():
+                en_cours.append(executeur.submit(_provisionner_lot, lot, *hachage))
+                while len(en_cours) >= workers * 2 or (en_cours and en_cours[0].done()):
+                    debut = time.perf_counter()
+                    resultat = en_cours.popleft().result()
+                    statistiques.durees['attente'] += time.perf_counter() - debut
+                    ecrire(resultat)
+            while en_cours:
+                debut = time.perf_counter()
+                resultat = en_cours.popleft().result()
+                statistiques.durees['attente'] += time.perf_counter() - debut
+                ecrire(resultat)
+    statistiques.duree_totale = time.perf_counter() - debut_total
+    if statistiques.comptes != lus:
+        raise RuntimeError(f"{statistiques.comptes} comptes provisionnés sur {lus} lus")
+    return statistiques
+
+def afficher_provisionnement(statistiques, flux=None):
+    """
+    Affiche le débit et la durée de chaque étape d'un provisionnement
+    
+    Args:
+        statistiques (StatistiquesProvisionnement): Résultat de provisionner_comptes
+        flux (file): Flux de sortie (défaut : sortie standard)
+    """
+    flux = flux or sys.stdout
+    print("\n" + "="*50, file=flux)
+    print("PROVISIONNEMENT DES COMPTES".center(50), file=flux)
+    print("="*50, file=flux)
+    print(f"Comptes provisionnés: {statistiques.comptes}", file=flux)
+    print(f"Durée totale: {statistiques.duree_totale:.2f} s", file=flux)
+    print(f"Débit: {statistiques.debit():.1f} comptes/s", file=flux)
+    print("-"*50, file=flux)
+    print("Durée par étape (génération et hachage cumulés sur les processus):", file=flux)
+    for etape in StatistiquesProvisionnement.ETAPES:
+        duree = statistiques.durees[etape]
+        par_compte = duree / statistiques.comptes * 1000 if statistiques.comptes else 0.0
+        print(f"  {etape:<12}{duree:>10.3f} s {par_compte:>10.3f} ms/compte", file=flux)
+    print("="*50, file=flux)
+
+class ListeMots:
+    """
+    Liste de mots indexée et projetée en mémoire pour les phrases de passe
+    
+    Le fichier (voir compiler_liste_mots) contient les mots en UTF-8 mis
+    bout à bout puis la table de leurs positions (nombre + 1 entiers de
+    32 bits). Lire le i-ème mot coûte deux lectures dans la table, quelle
+    que soit la taille de la liste, et seules les pages lues sont chargées.
+    
+    Args:
+        chemin (str): Chemin de la liste compilée
+    """
+
+    def __init__(self, chemin):
+        if sys.byteorder != 'little':
+            raise ValueError("La liste de mots compilée nécessite une machine little-endian")
+        self.chemin = chemin
+        self._fichier = open(chemin, 'rb')
+        try:
+            self._carte = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Fichier vide
+            self._fichier.close()
+            raise ValueError(f"'{chemin}' n'est pas une liste de mots NovaTech")
+        if self._carte[:len(MAGIQUE_MOTS)] != MAGIQUE_MOTS:
+            self.fermer()
+            raise ValueError(f"'{chemin}' n'est pas une liste de mots NovaTech")
+        _, self.nombre, offset_table = _ENTETE_MOTS.unpack_from(self._carte, 0)
+        vue = memoryview(self._carte)
+        self._mots = vue[_ENTETE_MOTS.size:offset_table]
+        self._positions = vue[offset_table:offset_table + (self.nombre + 1) * 4].cast('I')
+
+    def __len__(self):
+        return self.nombre
+
+    def __getitem__(self, numero):
+        if not 0 <= numero < self.nombre:
+            raise IndexError("numéro de mot hors de la liste")
+        return str(self._mots[self._positions[numero]:self._positions[numero + 1]], 'utf-8')
+
+    def fermer(self):
+        """
+        Libère la projection en mémoire
+        """
+        for vue in ('_mots', '_positions'):
+            if hasattr(self, vue):
+                getattr(self, vue).release()
+        self._carte.close()
+        self._fichier.close()
+
+def compiler_liste_mots(sources, destination):
+    """
+    Compile une ou plusieurs listes de mots (un par ligne) en ListeMots
+    
+    Les lignes vides et les commentaires (#) sont ignorés. Pour les listes
+    diceware (« 11111 mot »), seul le dernier champ est gardé. Les mots sont
+    mis en minuscules puis les doublons sont retirés : les majuscules étant
+    ajoutées par GenerateurPhrasesDePasse, « Paris » et « paris » ne
+    comptent qu'une fois et chaque mot distinct a la même probabilité
+    d'être tiré.
+    
+    Args:
+        sources (list): Fichiers de mots ('-' pour l'entrée standard)
+        destination (str): Chemin de la liste compilée à écrire
+    
+    Returns:
+        int: Nombre de mots distincts
+    """
+    mots = set()
+    for source in sources:
+        for ligne in iter_mots_de_passe_fichier(source):
+            champs = ligne.split()
+            if champs and not champs[0].startswith('#'):
+                mots.add(champs[-1].lower())
+    if len(mots) < 2:
+        raise ValueError("La liste doit contenir au moins deux mots distincts")
+    
+    fichier, temporaire = _ouvrir_temporaire(destination)
+    try:
+        with fichier:
+            fichier.write(bytes(_ENTETE_MOTS.size))
+            positions = array('I', [0])
+            position = 0
+            tampon = []
+            for mot in sorted(mots):
+                encode = mot.encode('utf-8')
+                position += len(encode)
+                if position >= 1 << 32:
+                    raise ValueError("La liste de mots dépasse 4 Gio")
+                positions.append(position)
+                tampon.append(encode)
+                if len(tampon) >= TAILLE_LOT_SORTIE:
+                    fichier.write(b''.join(tampon))
+                    tampon = []
+            fichier.write(b''.join(tampon))
+            offset_table = fichier.tell()
+            positions.tofile(fichier)
+            fichier.seek(0)
+            fichier.write(_ENTETE_MOTS.pack(MAGIQUE_MOTS, len(mots), offset_table))
+        os.replace(temporaire, destination)
+    except BaseException:
+        os.unlink(temporaire)
+        raise
+    return len(mots)
+
+def chemin_liste_mots_defaut():
+    """
+    Chemin de la liste par défaut compilée dans REPERTOIRE_CACHE
+    
+    Le nom du fichier contient une empreinte du contenu de
+    SOURCE_LISTE_MOTS : une source modifiée donne un autre fichier, sans
+    dépendre des dates de modification.
+    
+    Returns:
+        str: Chemin de la liste compilée (existante ou non)
+    """
+    with open(SOURCE_LISTE_MOTS, 'rb') as fichier:
+        empreinte = hashlib.blake2b(fichier.read(), digest_size=8).hexdigest()
+    return os.path.join(REPERTOIRE_CACHE, f"mots_phrases-{empreinte}.idx")
+
+def ouvrir_liste_mots(chemin=None):
+    """
+    Ouvre une liste de mots compilée
+    
+    Sans chemin, la liste livrée avec le script est compilée dans
+    REPERTOIRE_CACHE à sa première utilisation (voir
+    chemin_liste_mots_defaut), puis réutilisée.
+    
+    Args:
+        chemin (str): Chemin de la liste compilée (None : liste par défaut)
+    
+    Returns:
+        ListeMots: Liste de mots ouverte
+    """
+    if chemin is None:
+        chemin = chemin_liste_mots_defaut()
+        if not os.path.exists(chemin):
+            os.makedirs(REPERTOIRE_CACHE, exist_ok=True)
+            compiler_liste_mots([SOURCE_LISTE_MOTS], chemin)
+    return ListeMots(chemin)
+
+class GenerateurPhrasesDePasse:
+    """
+    Générateur de phrases de passe de type diceware
+    
+    Chaque mot est tiré uniformément et indépendamment dans la liste avec
+    secrets.randbelow, de même que les séparateurs, les majuscules
+    aléatoires et le chiffre inséré : l'entropie annoncée est exacte pour un
+    attaquant qui connaît la liste et les réglages.
+    
+    Args:
+        liste (ListeMots): Liste de mots
+        nombre_mots (int): Nombre de mots par phrase
+        separateurs (str): Séparateurs possibles, un tiré entre chaque mot
+            (chaîne vide : mots accolés)
+        capitales (str): 'aucune', 'initiale' (chaque mot commence par une
+            majuscule) ou 'aleatoire' (chaque mot a une chance sur deux)
+        chiffre (bool): Ajouter un chiffre à la fin d'un des mots
+    """
+
+    def __init__(self, liste, nombre_mots=6, separateurs='-', capitales='aucune', chiffre=False):
+        if nombre_mots < 1:
+            raise ValueError("La phrase doit contenir au moins un mot")
+        if capitales not in CAPITALES_PHRASE:
+            raise ValueError(f"Capitales inconnues : {capitales} (choix : {', '.join(CAPITALES_PHRASE)})")
+        self.liste = liste
+        self.nombre_mots = nombre_mots
+        self.separateurs = separateurs
+        self.capitales = capitales
+        self.chiffre = chiffre
+
+    def entropie(self):
+        """
+        Entropie d'une phrase générée avec ces réglages
+        
+        Returns:
+            float: Entropie en bits
+        """
+        bits = self.nombre_mots * math.log2(len(self.liste))
+        if len(self.separateurs) > 1:
+            bits += (self.nombre_mots - 1) * math.log2(len(self.separateurs))
+        if self.capitales == 'aleatoire':
+            bits += self.nombre_mots
+        if self.chiffre:
+            bits += math.log2(10 * self.nombre_mots)
+        return bits
+
+    def generer(self):
+        """
+        Génère une phrase de passe
+        
+        Returns:
+            str: Phrase de passe
+        """
+        liste = self.liste
+        mots = [liste[secrets.randbelow(len(liste))] for _ in range(self.nombre_mots)]
+        if self.capitales == 'initiale':
+            mots = [mot[:1].upper() + mot[1:] for mot in mots]
+        elif self.capitales == 'aleatoire':
+            mots = [mot[:1].upper() + mot[1:] if secrets.randbelow(2) else mot for mot in mots]
+        if self.chiffre:
+            position = secrets.randbelow(self.nombre_mots)
+            mots[position] += str(secrets.randbelow(10))
+        if len(self.separateurs) > 1:
+            phrase = [mots[0]]
+            for mot in mots[1:]:
+                phrase.append(self.separateurs[secrets.randbelow(len(self.separateurs))])
+                phrase.append(mot)
+            return ''.join(phrase)
+        return self.separateurs.join(mots)
+
+    def iter_phrases(self, nombre=None):
+        """
+        Produit des phrases de passe
+        
+        Args:
+            nombre (int): Nombre de phrases (None : sans limite)
+        
+        Yields:
+            str: Phrase de passe
+        """
+        produites = 0
+        while nombre is None or produites < nombre:
+            yield self.generer()
+            produites += 1
+
+def afficher_phrase(phrase, entropie, taille_liste):
+    """
+    Affiche une phrase de passe et son entropie de manière formatée
+    
+    Args:
+        phrase (str): Phrase de passe générée
+        entropie (float): Entropie en bits (GenerateurPhrasesDePasse.entropie)
+        taille_liste (int): Nombre de mots de la liste utilisée
+    """
+    print("\n" + "="*50)
+    print("GÉNÉRATEUR DE MOTS DE PASSE NOVATECH".center(50))
+    print("="*50)
+    print(f"Phrase de passe générée: {phrase}")
+    print(f"Longueur: {len(phrase)} caractères")
+    print(f"Liste de mots: {taille_liste} mots")
+    print("-"*50)
+    print(f"Entropie: {entropie:.1f} bits ({niveau_entropie(entropie)})")
+    print(f"Temps de cassage hors ligne: {formater_duree(temps_cassage(entropie))}")
+    print("="*50)
+
 def interface_utilisateur():
     """
     Interface utilisateur en ligne de commande
@@ -245,9 +2237,136 @@ def interface_arguments():
     parser.add_argument("-c", "--chiffres", action="store_false", help="Exclure les chiffres")
     parser.add_argument("-s", "--symboles", action="store_false", help="Exclure les symboles")
     parser.add_argument("-q", "--quiet", action="store_true", help="Mode silencieux (affiche seulement les mots de passe)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Nombre de processus pour générer et évaluer les mots de passe (défaut: 1)")
+    parser.add_argument("--ordonne", action="store_true",
+                        help="Avec --workers, écrire les lots dans un ordre stable plutôt que dès qu'ils sont prêts")
+    parser.add_argument("--audit", metavar="FICHIER",
+                        help="Évaluer les mots de passe d'un fichier, un par ligne ('-' pour l'entrée standard)")
+    parser.add_argument("--verdicts", metavar="FICHIER",
+                        help="Avec --audit, écrire le verdict de chaque mot de passe en CSV ('-' pour la sortie standard)")
+    parser.add_argument("--avec-mots", action="store_true",
+                        help="Avec --verdicts ou --provisionner, inclure le mot de passe dans chaque ligne")
+    parser.add_argument("--entropie", action="store_true",
+                        help="Estimer l'entropie réelle (mots courants, suites, clavier, répétitions)")
+    parser.add_argument("--index", metavar="FICHIER",
+                        help="Index des mots de passe compromis compilé avec --compiler-index (implique --entropie)")
+    parser.add_argument("--compiler-index", nargs=2, metavar=("SOURCE", "DESTINATION"),
+                        help="Compiler une liste de mots de passe compromis (un par ligne) en index")
+    parser.add_argument("--garantir", action="store_true",
+                        help="Garantir au moins un caractère de chaque classe incluse")
+    for nom in ("majuscules", "minuscules", "chiffres", "symboles"):
+        parser.add_argument(f"--min-{nom}", type=int, default=0, metavar="N",
+                            help=f"Nombre minimal de {nom}")
+    parser.add_argument("--exclure", default="", metavar="CARACTERES", help="Caractères à ne jamais utiliser")
+    parser.add_argument("--sans-ambigus", action="store_true",
+                        help=f"Exclure les caractères faciles à confondre ({CARACTERES_AMBIGUS})")
+    parser.add_argument("--max-repetitions", type=int, metavar="N",
+                        help="Nombre maximal de caractères identiques consécutifs")
+    parser.add_argument("--provisionner", metavar="FICHIER",
+                        help="Générer et hacher un mot de passe par compte (un par ligne, '-' pour l'entrée standard)")
+    parser.add_argument("-o", "--sortie", metavar="FICHIER",
+                        help="Avec --provisionner, fichier CSV compte,empreinte[,mot_de_passe] (défaut: sortie standard)")
+    parser.add_argument("--kdf", choices=tuple(PARAMETRES_KDF), default="scrypt",
+                        help="Avec --provisionner, fonction de dérivation (défaut: scrypt)")
+    parser.add_argument("--scrypt-n", type=int, help=f"Coût n de scrypt (défaut: {PARAMETRES_KDF['scrypt']['n']})")
+    parser.add_argument("--scrypt-r", type=int, help=f"Taille de bloc r de scrypt (défaut: {PARAMETRES_KDF['scrypt']['r']})")
+    parser.add_argument("--scrypt-p", type=int, help=f"Parallélisme p de scrypt (défaut: {PARAMETRES_KDF['scrypt']['p']})")
+    parser.add_argument("--iterations", type=int,
+                        help=f"Itérations de PBKDF2 (défaut: {PARAMETRES_KDF['pbkdf2_sha256']['iterations']})")
+    parser.add_argument("-p", "--phrase", action="store_true",
+                        help="Générer des phrases de passe (mots tirés d'une liste) plutôt que des mots de passe")
+    parser.add_argument("--mots", type=int, default=6, help="Avec --phrase, nombre de mots par phrase (défaut: 6)")
+    parser.add_argument("--separateurs", default="-",
+                        help="Avec --phrase, séparateurs possibles, un tiré au hasard entre chaque mot (défaut: -)")
+    parser.add_argument("--capitales", choices=CAPITALES_PHRASE, default="aucune",
+                        help="Avec --phrase, majuscule en début de mot : aucune, sur chaque mot ou au hasard")
+    parser.add_argument("--chiffre", action="store_true", help="Avec --phrase, ajouter un chiffre à un des mots")
+    parser.add_argument("--liste-mots", metavar="FICHIER",
+                        help="Liste de mots compilée avec --compiler-mots (défaut: liste française et anglaise livrée "
+                             "avec le script, compilée dans ~/.cache/novatech)")
+    parser.add_argument("--compiler-mots", nargs="+", metavar="FICHIER",
+                        help="Compiler des listes de mots (SOURCE... DESTINATION), par exemple française et anglaise")
     
     args = parser.parse_args()
     
+    if args.compiler_index:
+        source, destination = args.compiler_index
+        try:
+            nombre = compiler_index_fuites(source, destination)
+        except OSError as e:
+            print(f"Erreur lors de la compilation de l'index : {e}")
+            sys.exit(1)
+        if not args.quiet:
+            print(f"Index compilé : {nombre} mots de passe distincts dans '{destination}'")
+        return
+    
+    if args.compiler_mots:
+        if len(args.compiler_mots) < 2:
+            print("Erreur : --compiler-mots attend au moins une source et une destination")
+            sys.exit(1)
+        *sources, destination = args.compiler_mots
+        try:
+            nombre = compiler_liste_mots(sources, destination)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la compilation de la liste de mots : {e}")
+            sys.exit(1)
+        if not args.quiet:
+            print(f"Liste compilée : {nombre} mots distincts dans '{destination}'")
+        return
+    
+    if args.phrase:
+        if args.nombre < 1:
+            print("Erreur : Le nombre doit être au moins 1")
+            sys.exit(1)
+        try:
+            liste = ouvrir_liste_mots(args.liste_mots)
+            generateur = GenerateurPhrasesDePasse(liste, args.mots, args.separateurs, args.capitales, args.chiffre)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de l'ouverture de la liste de mots : {e}")
+            print("   Compilez une liste avec --compiler-mots SOURCE... DESTINATION")
+            sys.exit(1)
+        phrases = generateur.iter_phrases(args.nombre)
+        if args.quiet:
+            for lot in iter(lambda: list(itertools.islice(phrases, TAILLE_LOT_SORTIE)), []):
+                lot.append('')
+                sys.stdout.write('\n'.join(lot))
+        elif args.nombre == 1:
+            afficher_phrase(next(phrases), generateur.entropie(), len(liste))
+        else:
+            print(f"Génération de {args.nombre} phrases de passe ({generateur.entropie():.1f} bits chacune):")
+            for i, phrase in enumerate(phrases, 1):
+                print(f"{i:2d}. {phrase}")
+        return
+    
+    index = None
+    if args.index:
+        try:
+            index = IndexFuites(args.index)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de l'ouverture de l'index : {e}")
+            sys.exit(1)
+    
+    if args.audit:
+        # Audit d'une liste existante : les histogrammes vont sur la sortie
+        # d'erreur si les verdicts occupent la sortie standard
+        sortie = None
+        if args.verdicts == '-':
+            sortie = sys.stdout
+        elif args.verdicts:
+            sortie = open(args.verdicts, 'w', encoding='utf-8', newline='', buffering=1024 * 1024)
+        try:
+            statistiques = auditer_mots_de_passe(args.audit, sortie, args.avec_mots, args.entropie, index)
+        except OSError as e:
+            print(f"Erreur lors de la lecture du fichier : {e}")
+            sys.exit(1)
+        finally:
+            if sortie is not None and sortie is not sys.stdout:
+                sortie.close()
+        if not args.quiet:
+            afficher_audit(statistiques, sys.stderr if sortie is sys.stdout else sys.stdout)
+        return
+    
     # Validation des arguments
     if args.longueur < 8 or args.longueur > 64:
         print("Erreur : La longueur doit être entre 8 et 64 caractères")
@@ -257,27 +2376,93 @@ def interface_arguments():
         print("Erreur : Le nombre doit être au moins 1")
         sys.exit(1)
     
-    # Génération des mots de passe
-    mots_de_passe = generer_plusieurs_mots_de_passe(
-        args.nombre, 
-        args.longueur, 
-        args.majuscules, 
-        args.chiffres, 
-        args.symboles
-    )
+    if args.workers < 1:
+        print("Erreur : Le nombre de processus doit être au moins 1")
+        sys.exit(1)
+    
+    # Politique de composition, dès qu'une contrainte est demandée
+    politique = None
+    minimums = {nom: getattr(args, f"min_{nom}") for nom in ("majuscules", "minuscules", "chiffres", "symboles")}
+    if args.garantir:
+        inclus = {"majuscules": args.majuscules, "minuscules": True, "chiffres": args.chiffres, "symboles": args.symboles}
+        minimums = {nom: max(minimum, int(inclus[nom])) for nom, minimum in minimums.items()}
+    if any(minimums.values()) or args.exclure or args.sans_ambigus or args.max_repetitions is not None:
+        try:
+            politique = PolitiqueMotsDePasse(args.longueur, args.majuscules, args.chiffres, args.symboles,
+                                             minimums, args.exclure, args.sans_ambigus, args.max_repetitions)
+        except ValueError as e:
+            print(f"Erreur : {e}")
+            sys.exit(1)
+    
+    # Génération des mots de passe, écrits au fil de l'eau
+    if args.provisionner:
+        # Le CSV occupe la sortie standard si aucun fichier n'est donné :
+        # le rapport va alors sur la sortie d'erreur
+        parametres = {'n': args.scrypt_n, 'r': args.scrypt_r, 'p': args.scrypt_p, 'iterations': args.iterations}
+        sortie = open(args.sortie, 'w', encoding='utf-8', newline='', buffering=1024 * 1024) if args.sortie else sys.stdout
+        try:
+            statistiques = provisionner_comptes(args.provisionner, sortie, args.longueur, args.majuscules,
+                                                args.chiffres, args.symboles, politique, args.kdf, parametres,
+                                                args.avec_mots, args.workers)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"Erreur lors du provisionnement : {e}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            if sortie is not sys.stdout:
+                sortie.close()
+        if not args.quiet:
+            afficher_provisionnement(statistiques, sys.stderr if sortie is sys.stdout else sys.stdout)
+        return
+    
+    if args.workers > 1 and args.nombre > 1:
+        # L'évaluation de chaque mot de passe est faite par les processus
+        mots_de_passe = iter_mots_de_passe_paralleles(
+            args.nombre,
+            args.longueur,
+            args.majuscules,
+            args.chiffres,
+            args.symboles,
+            workers=args.workers,
+            evaluer=not args.quiet,
+            ordonne=args.ordonne,
+            politique=politique
+        )
+    elif politique is not None:
+        mots_de_passe = politique.iter_mots_de_passe(args.nombre)
+        if not args.quiet and args.nombre > 1:
+            mots_de_passe = ((mdp, evaluer_force(mdp)) for mdp in mots_de_passe)
+    else:
+        mots_de_passe = iter_mots_de_passe(
+            args.nombre, 
+            args.longueur, 
+            args.majuscules, 
+            args.chiffres, 
+            args.symboles
+        )
+        if not args.quiet and args.nombre > 1:
+            mots_de_passe = ((mdp, evaluer_force(mdp)) for mdp in mots_de_passe)
     
     # Affichage des résultats
     if args.quiet:
+        lot = []
         for mdp in mots_de_passe:
-            print(mdp)
+            lot.append(mdp)
+            if len(lot) >= TAILLE_LOT_SORTIE:
+                lot.append('')
+                sys.stdout.write('\n'.join(lot))
+                lot = []
+        if lot:
+            lot.append('')
+            sys.stdout.write('\n'.join(lot))
     else:
         if args.nombre == 1:
-            evaluation = evaluer_force(mots_de_passe[0])
-            afficher_resultat(mots_de_passe[0], evaluation)
+            mot_de_passe = next(mots_de_passe)
+            evaluation = evaluer_force(mot_de_passe)
+            estimation = estimer_entropie(mot_de_passe, index) if args.entropie or index else None
+            afficher_resultat(mot_de_passe, evaluation, estimation)
         else:
             print(f"Génération de {args.nombre} mots de passe:")
-            for i, mdp in enumerate(mots_de_passe, 1):
-                evaluation = evaluer_force(mdp)
+            for i, (mdp, evaluation) in enumerate(mots_de_passe, 1):
                 print(f"{i:2d}. {mdp} ({evaluation['couleur']} {evaluation['force']})")
 
 if __name__ == '__main__':
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Socle HTTP/JSON commun aux services NovaTech
+Ce module fournit un serveur HTTP/1.1 minimal basé sur asyncio (connexions
+persistantes, CORS, corps JSON) et les métriques de latence des services
+Dernière mise à jour : 17/10/2026
+"""
+
+import asyncio
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+# Taille maximale d'un corps de requête accepté (en octets)
+TAILLE_CORPS_MAX = 1024 * 1024
+
+# Nombre de latences conservées pour le calcul des percentiles
+NB_LATENCES = 10000
+
+STATUTS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error"
+}
+
+class ErreurRequete(Exception):
+    """Erreur renvoyée au client avec un code HTTP"""
+
+    def __init__(self, statut, message):
+        super().__init__(message)
+        self.statut = statut
+        self.message = message
+
+class Metriques:
+    """
+    Latences et nombre de requêtes d'un service
+    """
+
+    def __init__(self):
+        self.debut = time.monotonic()
+        self.nb_requetes = 0
+        self.latences = deque(maxlen=NB_LATENCES)
+
+    def enregistrer(self, latence):
+        """
+        Enregistre la latence d'une requête
+        
+        Args:
+            latence (float): Durée de traitement en secondes
+        """
+        self.nb_requetes += 1
+        self.latences.append(latence)
+
+    def percentile(self, rang):
+        """
+        Calcule un percentile des latences récentes
+        
+        Args:
+            rang (float): Percentile voulu (0-100)
+        
+        Returns:
+            float: Latence en millisecondes (0 sans mesure)
+        """
+        if not self.latences:
+            return 0
+        latences = sorted(self.latences)
+        indice = min(len(latences) - 1, int(len(latences) * rang / 100))
+        return latences[indice] * 1000
+
+    def duree(self):
+        """
+        Durée écoulée depuis le démarrage du service
+        
+        Returns:
+            float: Durée en secondes
+        """
+        return time.monotonic() - self.debut
+
+class ServeurJSON(ABC):
+    """
+    Serveur HTTP/JSON minimal basé sur asyncio
+    
+    Les sous-classes implémentent _traiter(methode, chemin, corps), qui
+    renvoie (statut, données JSON) ou lève ErreurRequete. Toute autre
+    exception est renvoyée au client comme une erreur 500.
+    
+    Args:
+        origine_cors (str): Origine autorisée pour les appels depuis le site
+    """
+
+    # En-têtes ajoutés à chaque réponse
+    ENTETES = ()
+
+    def __init__(self, origine_cors=None):
+        self.origine_cors = origine_cors
+
+    async def demarrer(self, hote="127.0.0.1", port=8080):
+        """
+        Démarre le serveur
+        
+        Args:
+            hote (str): Adresse d'écoute
+            port (int): Port d'écoute
+        
+        Returns:
+            asyncio.Server: Serveur démarré
+        """
+        return await asyncio.start_server(self._connexion, hote, port)
+
+    async def _connexion(self, lecteur, ecrivain):
+        try:
+            while True:
+                ligne = await lecteur.readline()
+                if not ligne:
+                    break
+                try:
+                    methode, chemin, version = ligne.decode('latin-1').split()
+                except ValueError:
+                    await self._repondre(ecrivain, 400, {"erreur": "Requête invalide"}, False)
+                    break
+                
+                entetes = {}
+                while True:
+                    ligne = await lecteur.readline()
+                    if ligne in (b'\r\n', b'\n', b''):
+                        break
+                    nom, _, valeur = ligne.decode('latin-1').partition(':')
+                    entetes[nom.strip().lower()] = valeur.strip()
+                
+                garder = entetes.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                try:
+                    longueur = int(entetes.get('content-length', 0))
+                except ValueError:
+                    longueur = -1
+                if longueur < 0 or longueur > TAILLE_CORPS_MAX:
+                    await self._repondre(ecrivain, 413 if longueur > 0 else 400,
+                                         {"erreur": "Corps de requête invalide"}, False)
+                    break
+                corps = await lecteur.readexactly(longueur) if longueur else b''
+                
+                chemin = chemin.split('?')[0]
+                try:
+                    statut, reponse = await self._traiter(methode, chemin, corps)
+                except ErreurRequete as e:
+                    statut, reponse = e.statut, {"erreur": e.message}
+                except Exception as e:
+                    # Ni le corps ni le message de l'exception (qui peut reprendre
+                    # un mot de passe ou un texte) ne sont journalisés
+                    print(f"Erreur interne sur {methode} {chemin} : {type(e).__name__}", file=sys.stderr)
+                    statut, reponse = 500, {"erreur": "Erreur interne du serveur"}
+                await self._repondre(ecrivain, statut, reponse, garder)
+                if not garder:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            ecrivain.close()
+
+    @abstractmethod
+    async def _traiter(self, methode, chemin, corps):
+        """
+        Traite une requête
+        
+        Args:
+            methode (str): Méthode HTTP
+            chemin (str): Chemin de la requête, sans paramètres
+            corps (bytes): Corps de la requête
+        
+        Returns:
+            tuple: (statut HTTP, données JSON ou None)
+        """
+
+    def _lire_objet(self, corps):
+        """
+        Décode un corps de requête contenant un objet JSON
+        
+        Args:
+            corps (bytes): Corps de la requête (vide : objet vide)
+        
+        Returns:
+            dict: Objet décodé
+        """
+        try:
+            donnees = json.loads(corps or b'{}')
+        except ValueError:
+            raise ErreurRequete(400, "JSON invalide")
+        if not isinstance(donnees, dict):
+            raise ErreurRequete(400, "Un objet JSON est attendu")
+        return donnees
+
+    async def _repondre(self, ecrivain, statut, donnees, garder):
+        corps = b'' if donnees is None else json.dumps(donnees, ensure_ascii=False).encode('utf-8')
+        entetes = [
+            f"HTTP/1.1 {statut} {STATUTS.get(statut, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(corps)}",
+            f"Connection: {'keep-alive' if garder else 'close'}"
+        ]
+        entetes.extend(self.ENTETES)
+        if self.origine_cors:
+            entetes.append(f"Access-Control-Allow-Origin: {self.origine_cors}")
+            entetes.append("Access-Control-Allow-Methods: GET, POST, OPTIONS")
+            entetes.append("Access-Control-Allow-Headers: Content-Type")
+        ecrivain.write(("\r\n".join(entetes) + "\r\n\r\n").encode('latin-1') + corps)
+        await ecrivain.drain()
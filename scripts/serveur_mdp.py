@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Service HTTP/JSON de génération de mots de passe pour NovaTech
+Ce script garde des réserves de mots de passe pré-générés pour les politiques
+courantes afin de servir les parcours d'inscription et de réinitialisation
+Dernière mise à jour : 17/10/2026
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from collections import deque
+
+from generateur_mdp import (GenerateurMotsDePasse, IndexFuites, PolitiqueMotsDePasse,
+                            estimer_entropie, evaluer_force)
+from serveur_http import ErreurRequete, Metriques, ServeurJSON
+
+# Nombre de mots de passe gardés prêts par politique
+CAPACITE_RESERVE = 4096
+
+# Nombre de mots de passe générés à chaque passage de la recharge
+TAILLE_RECHARGE = 512
+
+# Nombre maximal de réserves (les politiques suivantes sont servies sans réserve)
+NB_RESERVES_MAX = 32
+
+# Nombre maximal de mots de passe par requête
+NB_MOTS_MAX = 100
+
+# Politiques pré-remplies au démarrage : (longueur, majuscules, chiffres, symboles, garantir)
+POLITIQUES_COURANTES = (
+    (12, True, True, True, False),
+    (12, True, True, True, True),
+    (16, True, True, True, False),
+    (16, True, True, True, True),
+    (16, True, True, False, True),
+    (20, True, True, True, True)
+)
+
+# Politique appliquée aux champs absents d'une requête
+POLITIQUE_DEFAUT = {"longueur": 12, "majuscules": True, "chiffres": True, "symboles": True, "garantir": False}
+
+def creer_generateur(longueur, majuscules, chiffres, symboles, garantir):
+    """
+    Crée le générateur d'une politique
+    
+    Args:
+        longueur (int): Longueur des mots de passe (8-64)
+        majuscules (bool): Inclure des majuscules
+        chiffres (bool): Inclure des chiffres
+        symboles (bool): Inclure des symboles
+        garantir (bool): Au moins un caractère de chaque classe incluse
+    
+    Returns:
+        GenerateurMotsDePasse | PolitiqueMotsDePasse: Générateur (méthode generer)
+    """
+    if not garantir:
+        return GenerateurMotsDePasse(longueur, majuscules, chiffres, symboles)
+    minimums = {"majuscules": int(majuscules), "minuscules": 1,
+                "chiffres": int(chiffres), "symboles": int(symboles)}
+    return PolitiqueMotsDePasse(longueur, majuscules, chiffres, symboles, minimums)
+
+class ReserveMotsDePasse:
+    """
+    Réserve bornée de mots de passe pré-générés pour une politique
+    
+    Chaque mot de passe est retiré de la réserve au moment où il est servi,
+    il n'est donc remis qu'une seule fois. Dès qu'une demande amène la
+    réserve au seuil ou en dessous, la tâche de recharge la complète par
+    lots de TAILLE_RECHARGE dans un thread. Une réserve vide n'attend pas
+    la recharge : le mot de passe est généré sur le champ dans un thread
+    (et compté comme manqué), sans bloquer la boucle d'événements.
+    
+    La recharge et la génération sur le champ ont chacune leur générateur,
+    et la génération sur le champ est sérialisée par un verrou : les
+    réserves d'aléa d'un générateur ne sont jamais partagées entre deux
+    threads. La construction des générateurs (tables d'une politique) peut
+    être longue : une réserve créée pendant le service est construite dans
+    un thread (voir ServeurMotsDePasse._reserve).
+    
+    Args:
+        politique (tuple): (longueur, majuscules, chiffres, symboles, garantir)
+        capacite (int): Nombre maximal de mots de passe gardés prêts
+        seuil (int): Profondeur à partir de laquelle la recharge est
+            déclenchée (0 : quand la réserve est vide)
+    """
+
+    def __init__(self, politique, capacite=CAPACITE_RESERVE, seuil=None):
+        self.politique = politique
+        self.capacite = capacite
+        self.seuil = capacite // 2 if seuil is None else seuil
+        self.servis = 0
+        self.manques = 0
+        self.generes = 0
+        self._mots = deque()
+        self._generateur_recharge = creer_generateur(*politique)
+        self._generateur_direct = creer_generateur(*politique)
+        self._besoin = asyncio.Event()
+        self._verrou_direct = asyncio.Lock()
+        self._tache = None
+
+    def remplir(self):
+        """
+        Remplit la réserve d'un coup (avant le démarrage du service)
+        """
+        manquants = self.capacite - len(self._mots)
+        if manquants > 0:
+            self._mots.extend(self._generateur_recharge.generer(manquants))
+            self.generes += manquants
+
+    def demarrer(self):
+        """
+        Lance la tâche de fond qui recharge la réserve
+        """
+        self._tache = asyncio.get_running_loop().create_task(self._recharger())
+
+    async def arreter(self):
+        """
+        Arrête la tâche de recharge
+        """
+        if self._tache is not None:
+            self._tache.cancel()
+            try:
+                await self._tache
+            except asyncio.CancelledError:
+                pass
+
+    async def prendre(self, nombre=1):
+        """
+        Retire des mots de passe de la réserve
+        
+        Args:
+            nombre (int): Nombre de mots de passe voulus
+        
+        Returns:
+            list: Mots de passe, complétés par génération directe si la
+                réserve n'en contient pas assez
+        """
+        # La recharge démarre avant la génération directe éventuelle
+        if len(self._mots) - nombre <= self.seuil:
+            self._besoin.set()
+        mots = []
+        while self._mots and len(mots) < nombre:
+            mots.append(self._mots.popleft())
+        self.servis += len(mots)
+        if len(mots) < nombre:
+            manquants = nombre - len(mots)
+            self.manques += manquants
+            async with self._verrou_direct:
+                mots.extend(await asyncio.get_running_loop().run_in_executor(
+                    None, self._generateur_direct.generer, manquants))
+        return mots
+
+    async def _recharger(self):
+        boucle = asyncio.get_running_loop()
+        while True:
+            await self._besoin.wait()
+            self._besoin.clear()
+            while len(self._mots) < self.capacite:
+                taille = min(TAILLE_RECHARGE, self.capacite - len(self._mots))
+                mots = await boucle.run_in_executor(None, self._generateur_recharge.generer, taille)
+                self._mots.extend(mots)
+                self.generes += taille
+
+    def en_dict(self):
+        """
+        Exporte l'état de la réserve pour l'endpoint /metrics
+        
+        Returns:
+            dict: Politique, profondeur et taux de succès (sans mot de passe)
+        """
+        demandes = self.servis + self.manques
+        donnees = dict(zip(POLITIQUE_DEFAUT, self.politique))
+        donnees.update({
+            "profondeur": len(self._mots),
+            "capacite": self.capacite,
+            "servis": self.servis,
+            "manques": self.manques,
+            "generes": self.generes,
+            "taux_succes": round(self.servis / demandes, 4) if demandes else None
+        })
+        return donnees
+
+def lire_politique(donnees):
+    """
+    Valide la politique demandée dans une requête
+    
+    Args:
+        donnees (dict): Corps JSON de la requête
+    
+    Returns:
+        tuple: (longueur, majuscules, chiffres, symboles, garantir)
+    """
+    longueur = donnees.get("longueur", POLITIQUE_DEFAUT["longueur"])
+    if not isinstance(longueur, int) or isinstance(longueur, bool) or not 8 <= longueur <= 64:
+        raise ErreurRequete(400, "Le champ 'longueur' doit être un entier entre 8 et 64")
+    options = []
+    for nom in ("majuscules", "chiffres", "symboles", "garantir"):
+        valeur = donnees.get(nom, POLITIQUE_DEFAUT[nom])
+        if not isinstance(valeur, bool):
+            raise ErreurRequete(400, f"Le champ '{nom}' doit être un booléen")
+        options.append(valeur)
+    return (longueur, *options)
+
+class ServeurMotsDePasse(ServeurJSON):
+    """
+    Service HTTP/JSON de génération et d'évaluation de mots de passe
+    
+    Les mots de passe ne sont jamais journalisés ni mis en cache : le
+    service n'écrit rien sur ses sorties et chaque réponse porte
+    Cache-Control: no-store.
+    
+    Endpoints :
+        POST /mot-de-passe  {"longueur": 12, "majuscules": true, "chiffres": true,
+                             "symboles": true, "garantir": false, "nombre": 1,
+                             "evaluer": false}
+        POST /evaluation    {"mot_de_passe": "...", "entropie": false}
+        GET  /metrics
+    """
+    
+    ENTETES = ("Cache-Control: no-store",)
+
+    def __init__(self, politiques=POLITIQUES_COURANTES, capacite=CAPACITE_RESERVE, seuil=None,
+                 index=None, origine_cors=None):
+        super().__init__(origine_cors)
+        self.capacite = capacite
+        self.seuil = seuil
+        self.index = index
+        self.metriques = Metriques()
+        self.hors_reserve = 0
+        self.reserves = {}
+        for politique in politiques:
+            self.reserves[politique] = ReserveMotsDePasse(politique, capacite, seuil)
+            self.reserves[politique].remplir()
+        self._creations = {}
+        self._generateurs_directs = {}
+        self._verrou_direct = asyncio.Lock()
+
+    async def demarrer(self, hote="127.0.0.1", port=8081):
+        """
+        Démarre le serveur et la recharge des réserves
+        
+        Args:
+            hote (str): Adresse d'écoute
+            port (int): Port d'écoute
+        
+        Returns:
+            asyncio.Server: Serveur démarré
+        """
+        for reserve in self.reserves.values():
+            reserve.demarrer()
+        return await super().demarrer(hote, port)
+
+    async def arreter(self):
+        """
+        Arrête la recharge des réserves
+        """
+        for reserve in self.reserves.values():
+            await reserve.arreter()
+
+    async def _reserve(self, politique):
+        """
+        Renvoie la réserve d'une politique, créée à sa première demande
+        
+        La réserve est construite dans un thread ; les demandes simultanées
+        pour la même politique attendent la même construction.
+        
+        Returns:
+            ReserveMotsDePasse: Réserve, ou None au-delà de NB_RESERVES_MAX
+        """
+        reserve = self.reserves.get(politique)
+        if reserve is not None:
+            return reserve
+        creation = self._creations.get(politique)
+        if creation is None:
+            if len(self.reserves) + len(self._creations) >= NB_RESERVES_MAX:
+                return None
+            creation = self._creations[politique] = asyncio.ensure_future(self._creer_reserve(politique))
+        # Une requête abandonnée n'annule pas la construction partagée
+        return await asyncio.shield(creation)
+
+    async def _creer_reserve(self, politique):
+        try:
+            reserve = await asyncio.get_running_loop().run_in_executor(
+                None, ReserveMotsDePasse, politique, self.capacite, self.seuil)
+        finally:
+            del self._creations[politique]
+        reserve.demarrer()
+        self.reserves[politique] = reserve
+        return reserve
+
+    async def generer(self, politique, nombre):
+        """
+        Sert des mots de passe pour une politique
+        
+        Args:
+            politique (tuple): (longueur, majuscules, chiffres, symboles, garantir)
+            nombre (int): Nombre de mots de passe
+        
+        Returns:
+            list: Mots de passe, chacun servi une seule fois
+        """
+        reserve = await self._reserve(politique)
+        if reserve is not None:
+            return await reserve.prendre(nombre)
+        self.hors_reserve += nombre
+        boucle = asyncio.get_running_loop()
+        async with self._verrou_direct:
+            generateur = self._generateurs_directs.get(politique)
+            if generateur is None:
+                generateur = self._generateurs_directs[politique] = await boucle.run_in_executor(
+                    None, creer_generateur, *politique)
+            return await boucle.run_in_executor(None, generateur.generer, nombre)
+
+    def metriques_json(self):
+        """
+        Exporte les métriques pour l'endpoint /metrics
+        
+        Returns:
+            dict: Latences, taux de succès global et état de chaque réserve
+        """
+        servis = sum(reserve.servis for reserve in self.reserves.values())
+        manques = sum(reserve.manques for reserve in self.reserves.values()) + self.hors_reserve
+        return {
+            "duree_s": round(self.metriques.duree(), 1),
+            "requetes": self.metriques.nb_requetes,
+            "mots_de_passe_servis": servis + manques,
+            "taux_succes": round(servis / (servis + manques), 4) if servis + manques else None,
+            "hors_reserve": self.hors_reserve,
+            "latence_p50_ms": round(self.metriques.percentile(50), 3),
+            "latence_p90_ms": round(self.metriques.percentile(90), 3),
+            "latence_p99_ms": round(self.metriques.percentile(99), 3),
+            "reserves": [reserve.en_dict() for reserve in self.reserves.values()]
+        }
+
+    async def _traiter(self, methode, chemin, corps):
+        if methode == 'OPTIONS':
+            return 204, None
+        
+        if chemin == '/metrics':
+            if methode != 'GET':
+                raise ErreurRequete(405, "Utilisez GET")
+            return 200, self.metriques_json()
+        
+        if chemin not in ('/mot-de-passe', '/evaluation'):
+            raise ErreurRequete(404, "Endpoint inconnu")
+        if methode != 'POST':
+            raise ErreurRequete(405, "Utilisez POST")
+        
+        donnees = self._lire_objet(corps)
+        debut = time.perf_counter()
+        if chemin == '/mot-de-passe':
+            politique = lire_politique(donnees)
+            nombre = donnees.get("nombre", 1)
+            if not isinstance(nombre, int) or isinstance(nombre, bool) or not 1 <= nombre <= NB_MOTS_MAX:
+                raise ErreurRequete(400, f"Le champ 'nombre' doit être un entier entre 1 et {NB_MOTS_MAX}")
+            mots = await self.generer(politique, nombre)
+            if donnees.get("evaluer"):
+                reponse = {"mots_de_passe": [{"mot_de_passe": mot, "evaluation": evaluer_force(mot)}
+                                             for mot in mots]}
+            else:
+                reponse = {"mots_de_passe": mots}
+        else:
+            mot_de_passe = donnees.get("mot_de_passe")
+            if not isinstance(mot_de_passe, str) or not mot_de_passe:
+                raise ErreurRequete(400, "Le champ 'mot_de_passe' doit être un texte non vide")
+            reponse = {"evaluation": evaluer_force(mot_de_passe)}
+            if donnees.get("entropie") or self.index is not None:
+                estimation = estimer_entropie(mot_de_passe, self.index)
+                # Les motifs reprennent des morceaux du mot de passe : seul le type est renvoyé
+                estimation["motifs"] = [motif["type"] for motif in estimation["motifs"]]
+                if math.isinf(estimation["temps_cassage"]):
+                    # JSON ne représente pas l'infini
+                    estimation["temps_cassage"] = None
+                reponse["entropie"] = estimation
+        self.metriques.enregistrer(time.perf_counter() - debut)
+        
+        return 200, reponse
+
+async def executer(args):
+    """
+    Démarre le service et le garde actif jusqu'à l'interruption
+    
+    Args:
+        args (argparse.Namespace): Options de la ligne de commande
+    """
+    index = IndexFuites(args.index) if args.index else None
+    serveur = ServeurMotsDePasse(capacite=args.capacite, seuil=args.seuil, index=index, origine_cors=args.cors)
+    serveur_http = await serveur.demarrer(args.hote, args.port)
+    print(f"Service de mots de passe sur http://{args.hote}:{args.port}")
+    print("Endpoints : POST /mot-de-passe, POST /evaluation, GET /metrics")
+    try:
+        async with serveur_http:
+            await serveur_http.serve_forever()
+    finally:
+        await serveur.arreter()
+
+def interface_arguments():
+    """
+    Interface en ligne de commande avec arguments
+    """
+    parser = argparse.ArgumentParser(description="Service HTTP de mots de passe NovaTech")
+    parser.add_argument("--hote", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument("-p", "--port", type=int, default=8081, help="Port d'écoute (défaut: 8081)")
+    parser.add_argument("--capacite", type=int, default=CAPACITE_RESERVE,
+                        help=f"Mots de passe gardés prêts par politique (défaut: {CAPACITE_RESERVE})")
+    parser.add_argument("--seuil", type=int,
+                        help="Profondeur de réserve qui déclenche la recharge (défaut: la moitié de la capacité)")
+    parser.add_argument("--index", metavar="FICHIER",
+                        help="Index des mots de passe compromis pour /evaluation (voir generateur_mdp.py --compiler-index)")
+    parser.add_argument("--cors", help="Origine autorisée pour les appels depuis le site (ex: https://novatech.fr)")
+    
+    args = parser.parse_args()
+    
+    if args.capacite < 1:
+        print("Erreur : La capacité doit être au moins 1")
+        return
+    if args.seuil is not None and not 0 <= args.seuil < args.capacite:
+        print("Erreur : Le seuil doit être entre 0 et la capacité - 1")
+        return
+    
+    try:
+        asyncio.run(executer(args))
+    except KeyboardInterrupt:
+        print("\nService arrêté.")
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}")
+
+if __name__ == '__main__':
+    interface_arguments()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Service HTTP/JSON d'analyse de sentiments pour NovaTech
+Ce script garde un AnalyseurSentiments chargé en mémoire et regroupe les
+requêtes simultanées en micro-lots pour les formulaires du site (contact, blog)
+Dernière mise à jour : 17/10/2026
+"""
+
+import argparse
+import asyncio
+import time
+
+from analyseur_sentiments import AnalyseurSentiments
+from serveur_http import ErreurRequete, Metriques, ServeurJSON
+
+class MicroBatcheur:
+    """
+    Regroupe les textes reçus simultanément en lots analysés d'un seul coup
+    
+    Un lot est lancé dès qu'il atteint taille_max textes, ou au plus tard
+    attente_max secondes après l'arrivée de son premier texte. Chaque lot est
+    analysé dans un thread du pool par défaut de la boucle, un seul à la
+    fois : l'analyseur n'est jamais partagé entre deux lots.
+    """
+
+    def __init__(self, analyseur, taille_max=64, attente_max=0.005):
+        self.analyseur = analyseur
+        self.taille_max = taille_max
+        self.attente_max = attente_max
+        self.nb_lots = 0
+        self.nb_textes = 0
+        self._file = asyncio.Queue()
+        self._tache = None
+
+    def demarrer(self):
+        """
+        Lance la tâche de fond qui constitue et analyse les lots
+        """
+        self._tache = asyncio.get_running_loop().create_task(self._boucle())
+    
+    async def arreter(self):
+        """
+        Arrête la tâche de fond
+        """
+        if self._tache is not None:
+            self._tache.cancel()
+            try:
+                await self._tache
+            except asyncio.CancelledError:
+                pass
+    
+    async def analyser(self, textes):
+        """
+        Analyse des textes via les micro-lots
+        
+        Args:
+            textes (list): Textes à analyser
+        
+        Returns:
+            list: Un ResultatAnalyse par texte
+        """
+        boucle = asyncio.get_running_loop()
+        futurs = []
+        for texte in textes:
+            futur = boucle.create_future()
+            self._file.put_nowait((texte, futur))
+            futurs.append(futur)
+        return await asyncio.gather(*futurs)
+    
+    async def _boucle(self):
+        boucle = asyncio.get_running_loop()
+        while True:
+            lot = [await self._file.get()]
+            echeance = boucle.time() + self.attente_max
+            
+            # Compléter le lot jusqu'à la taille maximale ou l'échéance
+            while len(lot) < self.taille_max:
+                try:
+                    lot.append(self._file.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                restant = echeance - boucle.time()
+                if restant <= 0:
+                    break
+                try:
+                    lot.append(await asyncio.wait_for(self._file.get(), restant))
+                except asyncio.TimeoutError:
+                    break
+            
+            textes = [texte for texte, _ in lot]
+            try:
+                # Analyse hors de la boucle d'événements, qui continue d'accepter
+                # les connexions et de remplir la file pendant le calcul
+                resultats = await boucle.run_in_executor(None, self.analyseur.analyser_lot, textes)
+            except Exception as e:
+                for _, futur in lot:
+                    if not futur.done():
+                        futur.set_exception(e)
+                continue
+            
+            self.nb_lots += 1
+            self.nb_textes += len(lot)
+            for (_, futur), resultat in zip(lot, resultats):
+                if not futur.done():
+                    futur.set_result(resultat)
+
+def metriques_json(metriques, batcheur):
+    """
+    Exporte les métriques pour l'endpoint /metrics
+    
+    Args:
+        metriques (Metriques): Latences du service
+        batcheur (MicroBatcheur): Micro-batcheur du service
+    
+    Returns:
+        dict: Métriques du service
+    """
+    duree = metriques.duree()
+    return {
+        "duree_s": round(duree, 1),
+        "requetes": metriques.nb_requetes,
+        "textes": batcheur.nb_textes,
+        "lots": batcheur.nb_lots,
+        "taille_moyenne_lot": round(batcheur.nb_textes / batcheur.nb_lots, 2) if batcheur.nb_lots else 0,
+        "latence_p50_ms": round(metriques.percentile(50), 3),
+        "latence_p99_ms": round(metriques.percentile(99), 3),
+        "debit_textes_s": round(batcheur.nb_textes / duree, 1) if duree else 0
+    }
+
+def resultat_json(resultat, details=False):
+    """
+    Convertit un résultat d'analyse en dictionnaire sérialisable
+    
+    Args:
+        resultat (ResultatAnalyse): Résultat de l'analyse
+        details (bool): Inclure les listes de mots détectés
+    
+    Returns:
+        dict: Résultat sans le texte original
+    """
+    donnees = {
+        "sentiment": resultat.sentiment,
+        "confiance": resultat.confiance,
+        "score_positif": resultat.score_positif,
+        "score_negatif": resultat.score_negatif,
+        "score_total": resultat.score_total
+    }
+    if details:
+        donnees["mots_positifs"] = resultat.mots_positifs
+        donnees["mots_negatifs"] = resultat.mots_negatifs
+    return donnees
+
+class ServeurSentiments(ServeurJSON):
+    """
+    Service HTTP/JSON d'analyse de sentiments
+    
+    Endpoints :
+        POST /analyse        {"texte": "...", "details": false}
+        POST /analyse/batch  {"textes": ["...", ...], "details": false}
+        GET  /metrics
+    """
+
+    def __init__(self, analyseur=None, taille_lot=64, attente_max=0.005, origine_cors=None):
+        super().__init__(origine_cors)
+        self.analyseur = analyseur or AnalyseurSentiments()
+        self.batcheur = MicroBatcheur(self.analyseur, taille_lot, attente_max)
+        self.metriques = Metriques()
+    
+    async def demarrer(self, hote="127.0.0.1", port=8080):
+        """
+        Démarre le serveur et le micro-batcheur
+        
+        Args:
+            hote (str): Adresse d'écoute
+            port (int): Port d'écoute
+        
+        Returns:
+            asyncio.Server: Serveur démarré
+        """
+        self.batcheur.demarrer()
+        return await super().demarrer(hote, port)
+    
+    async def _traiter(self, methode, chemin, corps):
+        if methode == 'OPTIONS':
+            return 204, None
+        
+        if chemin == '/metrics':
+            if methode != 'GET':
+                raise ErreurRequete(405, "Utilisez GET")
+            return 200, metriques_json(self.metriques, self.batcheur)
+        
+        if chemin not in ('/analyse', '/analyse/batch'):
+            raise ErreurRequete(404, "Endpoint inconnu")
+        if methode != 'POST':
+            raise ErreurRequete(405, "Utilisez POST")
+        
+        donnees = self._lire_objet(corps)
+        details = bool(donnees.get('details', False))
+        
+        debut = time.perf_counter()
+        if chemin == '/analyse':
+            texte = donnees.get('texte')
+            if not isinstance(texte, str) or not texte.strip():
+                raise ErreurRequete(400, "Le champ 'texte' doit être un texte non vide")
+            resultat, = await self.batcheur.analyser([texte])
+            reponse = resultat_json(resultat, details)
+        else:
+            textes = donnees.get('textes')
+            if not isinstance(textes, list) or not all(isinstance(t, str) for t in textes):
+                raise ErreurRequete(400, "Le champ 'textes' doit être une liste de textes")
+            resultats = await self.batcheur.analyser(textes)
+            reponse = {"resultats": [resultat_json(r, details) for r in resultats]}
+        self.metriques.enregistrer(time.perf_counter() - debut)
+        
+        return 200, reponse
+
+async def executer(args):
+    """
+    Démarre le service et le garde actif jusqu'à l'interruption
+    
+    Args:
+        args (argparse.Namespace): Options de la ligne de commande
+    """
+    serveur = ServeurSentiments(taille_lot=args.taille_lot, attente_max=args.attente_ms / 1000,
+                                origine_cors=args.cors)
+    serveur_http = await serveur.demarrer(args.hote, args.port)
+    print(f"Service d'analyse de sentiments sur http://{args.hote}:{args.port}")
+    print("Endpoints : POST /analyse, POST /analyse/batch, GET /metrics")
+    try:
+        async with serveur_http:
+            await serveur_http.serve_forever()
+    finally:
+        await serveur.batcheur.arreter()
+
+def interface_arguments():
+    """
+    Interface en ligne de commande avec arguments
+    """
+    parser = argparse.ArgumentParser(description="Service HTTP d'analyse de sentiments NovaTech")
+    parser.add_argument("--hote", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument("-p", "--port", type=int, default=8080, help="Port d'écoute (défaut: 8080)")
+    parser.add_argument("--taille-lot", type=int, default=64,
+                        help="Nombre maximal de textes par micro-lot (défaut: 64)")
+    parser.add_argument("--attente-ms", type=float, default=5,
+                        help="Attente maximale avant de lancer un micro-lot, en ms (défaut: 5)")
+    parser.add_argument("--cors", help="Origine autorisée pour les appels depuis le site (ex: https://novatech.fr)")
+    
+    args = parser.parse_args()
+    
+    if args.taille_lot < 1:
+        print("Erreur : La taille de lot doit être au moins 1")
+        return
+    
+    try:
+        asyncio.run(executer(args))
+    except KeyboardInterrupt:
+        print("\nService arrêté.")
+
+if __name__ == '__main__':
+    interface_arguments()